@@ -0,0 +1,57 @@
+"""Benchmark reading a bulk layer CSV: plain ``pd.read_csv`` vs ``csv_to_dataframe``.
+
+Usage::
+
+    uv run python benchmarks/bench_csv.py [--series 1250] [--points 240]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+import pandas as pd
+from pyboj import csv_to_dataframe
+
+
+def _layer_csv(series: int, points: int) -> str:
+    lines = [
+        "SERIES_CODE,NAME_OF_TIME_SERIES,UNIT,FREQUENCY,CATEGORY,LAST_UPDATE,SURVEY_DATE,VALUE"
+    ]
+    dates = [2000 * 100 + 1 + (i // 12) * 100 + i % 12 for i in range(points)]
+    for n in range(series):
+        head = f"S{n:05d},Series {n},Percent,MONTHLY,Financial Markets,20250520"
+        lines.extend(
+            f"{head},{date},{'' if i % 50 == 0 else n + i / 10}" for i, date in enumerate(dates)
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=1250)
+    parser.add_argument("--points", type=int, default=240)
+    args = parser.parse_args()
+
+    text = _layer_csv(args.series, args.points)
+
+    t0 = time.perf_counter()
+    baseline = pd.read_csv(io.StringIO(text))
+    baseline["date"] = pd.to_datetime(baseline["SURVEY_DATE"].astype(str), format="%Y%m")
+    baseline = baseline.set_index("date")
+    plain = time.perf_counter() - t0
+
+    timings = {"read_csv": plain}
+    for engine in ("c", "pyarrow"):
+        t0 = time.perf_counter()
+        csv_to_dataframe(text, engine=engine)
+        timings[engine] = time.perf_counter() - t0
+
+    print(f"{args.series} series x {args.points} monthly dates ({len(text) / 1e6:.1f} MB)")
+    for name, seconds in timings.items():
+        print(f"{name:>10}: {seconds * 1e3:8.1f} ms  ({plain / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark survey-date parsing: per-element vs vectorised vs memoised.
+
+Usage::
+
+    uv run python benchmarks/bench_dates.py [--series 200] [--points 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import time
+
+from pyboj._parsing.dates import _parse_calendar, parse_survey_date, parse_survey_dates_array
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=200)
+    parser.add_argument("--points", type=int, default=5000)
+    args = parser.parse_args()
+
+    start = datetime.date(2000, 1, 1)
+    calendar = [
+        int((start + datetime.timedelta(days=i)).strftime("%Y%m%d")) for i in range(args.points)
+    ]
+    # Each series gets its own list object, as after JSON decoding.
+    series = [list(calendar) for _ in range(args.series)]
+
+    t0 = time.perf_counter()
+    for raw in series:
+        [parse_survey_date(d) for d in raw]
+    scalar = time.perf_counter() - t0
+
+    _parse_calendar.cache_clear()
+    t0 = time.perf_counter()
+    for raw in series:
+        parse_survey_dates_array(raw)
+        _parse_calendar.cache_clear()
+    vectorised = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for raw in series:
+        parse_survey_dates_array(raw)
+    memoised = time.perf_counter() - t0
+
+    print(f"{args.series} series x {args.points} daily dates")
+    for name, seconds in (("scalar", scalar), ("vectorised", vectorised), ("memoised", memoised)):
+        print(f"{name:>10}: {seconds * 1e3:8.1f} ms  ({scalar / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
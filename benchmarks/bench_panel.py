@@ -0,0 +1,51 @@
+"""Benchmark combining many series: per-series ``pd.concat`` vs ``to_panel``.
+
+Usage::
+
+    uv run python benchmarks/bench_panel.py [--series 500] [--points 120]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+from boj_ts_api import SeriesResult
+from pyboj import Series, to_panel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=500)
+    parser.add_argument("--points", type=int, default=120)
+    args = parser.parse_args()
+
+    calendar = [2000 * 100 + 1 + (i // 12) * 100 + i % 12 for i in range(args.points)]
+    series = [
+        Series(
+            SeriesResult.model_validate({
+                "SERIES_CODE": f"S{n:05d}",
+                "VALUES": {"SURVEY_DATES": list(calendar), "VALUES": [float(n)] * args.points},
+            })
+        )
+        for n in range(args.series)
+    ]
+    arrays = [s.arrays for s in series]  # parse up front; both paths read the same arrays
+    assert len(arrays) == args.series
+
+    t0 = time.perf_counter()
+    pd.concat([s.to_dataframe()["value"].rename(s.series_code) for s in series], axis=1)
+    concat = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    to_panel(series)
+    panel = time.perf_counter() - t0
+
+    print(f"{args.series} series x {args.points} monthly dates")
+    for name, seconds in (("pd.concat", concat), ("to_panel", panel)):
+        print(f"{name:>10}: {seconds * 1e3:8.1f} ms  ({concat / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
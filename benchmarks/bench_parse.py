@@ -0,0 +1,78 @@
+"""Benchmark JSON decoding backends on a synthetic Code API page.
+
+Usage::
+
+    uv run python benchmarks/bench_parse.py [--series 250] [--points 5000] [--repeat 5]
+
+The default payload (250 daily series x 5,000 observations) is roughly the
+size of the largest CO/FF pages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+import httpx
+from boj_ts_api import set_json_backend
+from boj_ts_api._parse import parse_data_response
+
+
+def build_payload(n_series: int, n_points: int) -> bytes:
+    rng = random.Random(0)
+    dates = [20000101 + i for i in range(n_points)]
+    resultset = [
+        {
+            "SERIES_CODE": f"SERIES{i:04d}",
+            "NAME_OF_TIME_SERIES": f"Synthetic series {i}",
+            "UNIT": "Yen",
+            "FREQUENCY": "DAILY",
+            "CATEGORY": "Benchmark",
+            "LAST_UPDATE": 20240101,
+            "VALUES": {
+                "SURVEY_DATES": dates,
+                "VALUES": [None if rng.random() < 0.02 else rng.uniform(0, 200) for _ in dates],
+            },
+        }
+        for i in range(n_series)
+    ]
+    body = {"STATUS": 200, "MESSAGEID": "M181000I", "MESSAGE": "", "RESULTSET": resultset}
+    return json.dumps(body).encode()
+
+
+def bench(backend: str, payload: bytes, repeat: int) -> float:
+    set_json_backend(backend)  # type: ignore[arg-type]
+    best = float("inf")
+    for _ in range(repeat):
+        response = httpx.Response(200, content=payload)
+        start = time.perf_counter()
+        parse_data_response(response)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=250)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_payload(args.series, args.points)
+    print(f"payload: {len(payload) / 1e6:.1f} MB, best of {args.repeat}")
+    baseline = None
+    for backend in ("stdlib", "orjson", "pydantic"):
+        try:
+            seconds = bench(backend, payload, args.repeat)
+        except ImportError:
+            print(f"{backend:>9}: skipped (not installed)")
+            continue
+        baseline = baseline or seconds
+        print(f"{backend:>9}: {seconds * 1e3:8.1f} ms  ({baseline / seconds:.2f}x)")
+    set_json_backend("pydantic")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 """boj-ts-api: Generic Python client for the Bank of Japan Time-Series Statistics API."""
 
+from boj_ts_api._cache import FileResponseCache, MemoryResponseCache, ResponseCache
+from boj_ts_api._parse import DataPageParser, get_json_backend, set_json_backend
+from boj_ts_api._rate_limit import RateLimiter
+from boj_ts_api._retry import RetryBudget, RetryPolicy
 from boj_ts_api._types.config import Format, Frequency, Lang
 from boj_ts_api._types.exceptions import BOJAPIError, BOJError, BOJRequestError, BOJValidationError
 from boj_ts_api._types.models import (
@@ -20,13 +24,22 @@ __all__ = [
     "BOJRequestError",
     "BOJValidationError",
     "Client",
+    "DataPageParser",
     "DataResponse",
+    "FileResponseCache",
     "Format",
     "Frequency",
     "Lang",
+    "MemoryResponseCache",
     "MetadataRecord",
     "MetadataResponse",
+    "RateLimiter",
+    "ResponseCache",
     "ResponseEnvelope",
+    "RetryBudget",
+    "RetryPolicy",
     "SeriesResult",
     "SeriesValues",
+    "get_json_backend",
+    "set_json_backend",
 ]
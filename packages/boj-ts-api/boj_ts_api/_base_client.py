@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import codecs
 from typing import Any
 
 from boj_ts_api._types.config import (
+    CSV_ENCODINGS,
     DEFAULT_TIMEOUT,
     ENDPOINT_DATA_CODE,
     ENDPOINT_DATA_LAYER,
@@ -23,6 +25,15 @@ class _BaseClient:
         self._lang = lang
         self._timeout = timeout
 
+    def _csv_decoder(self) -> codecs.IncrementalDecoder:
+        """Incremental decoder for CSV bodies in the client's language.
+
+        Multi-byte characters split across chunk boundaries are held back
+        until the rest arrives; undecodable bytes become U+FFFD, as in
+        ``httpx.Response.text``.
+        """
+        return codecs.getincrementaldecoder(CSV_ENCODINGS[self._lang.value])(errors="replace")
+
     def _base_params(self, format_: Format) -> dict[str, str]:
         return {"format": format_.value, "lang": self._lang.value}
 
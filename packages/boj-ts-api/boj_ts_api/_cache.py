@@ -0,0 +1,291 @@
+"""Optional HTTP response caches for the sync and async transports."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+# BOJ errors arrive as HTTP 200 with a non-200 STATUS in the JSON body.
+# STATUS is the first field of every JSON response, so the head is enough.
+_STATUS_OK_RE = re.compile(rb'"STATUS"\s*:\s*200\b')
+_SNIFF_BYTES = 256
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body plus what is needed to rebuild it."""
+
+    stored_at: float
+    status_code: int
+    content_type: str | None
+    url: str
+    content: bytes
+
+    def to_httpx(self) -> httpx.Response:
+        headers = {"content-type": self.content_type} if self.content_type else {}
+        return httpx.Response(
+            self.status_code,
+            headers=headers,
+            content=self.content,
+            request=httpx.Request("GET", self.url),
+        )
+
+
+def cache_key(path: str, params: Mapping[str, Any]) -> str:
+    """Build a stable key from *path* and *params*.
+
+    Parameter names are lower-cased (the BOJ API is case-insensitive) and
+    sorted, so equivalent requests share an entry.
+    """
+    items = sorted((str(k).lower(), str(v)) for k, v in params.items())
+    return f"{path}?{urlencode(items)}"
+
+
+def _is_cacheable(response: httpx.Response) -> bool:
+    if response.status_code != 200:
+        return False
+    head = response.content[:_SNIFF_BYTES].lstrip()
+    if head.startswith(b"{"):
+        return _STATUS_OK_RE.search(head) is not None
+    return True
+
+
+class ResponseCache(ABC):
+    """Base class for transport-level response caches.
+
+    Only successful responses are stored: HTTP errors and BOJ API errors
+    (``STATUS != 200`` in the body) always go to the network.
+
+    Parameters
+    ----------
+    ttl:
+        Default lifetime in seconds. ``None`` keeps entries until evicted.
+    endpoint_ttl:
+        Per-endpoint overrides keyed by path (e.g. ``ENDPOINT_METADATA``).
+        A TTL of ``0`` disables caching for that endpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = 300.0,
+        endpoint_ttl: Mapping[str, float | None] | None = None,
+    ) -> None:
+        self._ttl = ttl
+        self._endpoint_ttl = dict(endpoint_ttl or {})
+
+    def ttl_for(self, path: str) -> float | None:
+        """Return the TTL that applies to *path*."""
+        return self._endpoint_ttl.get(path, self._ttl)
+
+    def get(self, path: str, params: Mapping[str, Any]) -> httpx.Response | None:
+        """Return a cached response for the request, or ``None``."""
+        ttl = self.ttl_for(path)
+        if ttl is not None and ttl <= 0:
+            return None
+        key = cache_key(path, params)
+        entry = self._load(key)
+        if entry is None:
+            return None
+        if ttl is not None and time.time() - entry.stored_at > ttl:
+            self._delete(key)
+            return None
+        return entry.to_httpx()
+
+    def set(self, path: str, params: Mapping[str, Any], response: httpx.Response) -> None:
+        """Store *response* if it is cacheable for *path*."""
+        ttl = self.ttl_for(path)
+        if (ttl is not None and ttl <= 0) or not _is_cacheable(response):
+            return
+        entry = CachedResponse(
+            stored_at=time.time(),
+            status_code=response.status_code,
+            content_type=response.headers.get("content-type"),
+            url=str(response.request.url),
+            content=response.content,
+        )
+        self._save(cache_key(path, params), entry)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def _load(self, key: str) -> CachedResponse | None: ...
+
+    @abstractmethod
+    def _save(self, key: str, entry: CachedResponse) -> None: ...
+
+    @abstractmethod
+    def _delete(self, key: str) -> None: ...
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU response cache.
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of stored responses. ``None`` means unbounded.
+    max_bytes:
+        Maximum total size of stored bodies. ``None`` means unbounded.
+    ttl, endpoint_ttl:
+        See :class:`ResponseCache`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = 256,
+        max_bytes: int | None = None,
+        ttl: float | None = 300.0,
+        endpoint_ttl: Mapping[str, float | None] | None = None,
+    ) -> None:
+        super().__init__(ttl=ttl, endpoint_ttl=endpoint_ttl)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _load(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _save(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._entries and (
+                (self._max_entries is not None and len(self._entries) > self._max_entries)
+                or (self._max_bytes is not None and self._size > self._max_bytes)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+
+
+class FileResponseCache(ResponseCache):
+    """On-disk response cache, one file per request.
+
+    Each file holds a one-line JSON header followed by the raw body.  Files
+    are named by a hash of the request key; the least recently read files
+    are removed first when a size limit is exceeded.
+
+    Parameters
+    ----------
+    directory:
+        Cache directory. Created on first write.
+    max_entries:
+        Maximum number of stored responses. ``None`` means unbounded.
+    max_bytes:
+        Maximum total size of the cache files. ``None`` means unbounded.
+    ttl, endpoint_ttl:
+        See :class:`ResponseCache`.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = 512 * 1024 * 1024,
+        ttl: float | None = 300.0,
+        endpoint_ttl: Mapping[str, float | None] | None = None,
+    ) -> None:
+        super().__init__(ttl=ttl, endpoint_ttl=endpoint_ttl)
+        self._dir = Path(directory).expanduser()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{hashlib.sha256(key.encode()).hexdigest()}.bin"
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._dir.glob("*.bin"):
+                path.unlink(missing_ok=True)
+
+    def _load(self, key: str) -> CachedResponse | None:
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+            header_line, _, content = raw.partition(b"\n")
+            header = json.loads(header_line)
+            entry = CachedResponse(content=content, **header)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError):
+            path.unlink(missing_ok=True)  # unreadable or corrupt entry
+            return None
+        # Removed by a concurrent invalidate or eviction since the read.
+        with contextlib.suppress(FileNotFoundError):
+            stat = path.stat()
+            os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+            return entry
+        return None
+
+    def _save(self, key: str, entry: CachedResponse) -> None:
+        header = {
+            "stored_at": entry.stored_at,
+            "status_code": entry.status_code,
+            "content_type": entry.content_type,
+            "url": entry.url,
+        }
+        path = self._path(key)
+        with self._lock:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(json.dumps(header).encode() + b"\n" + entry.content)
+            os.replace(tmp, path)
+            self._evict()
+
+    def _delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        if self._max_entries is None and self._max_bytes is None:
+            return
+        files = [(p, p.stat()) for p in self._dir.glob("*.bin")]
+        files.sort(key=lambda item: item[1].st_atime_ns)
+        count = len(files)
+        size = sum(st.st_size for _, st in files)
+        for path, st in files:
+            over_count = self._max_entries is not None and count > self._max_entries
+            over_size = self._max_bytes is not None and size > self._max_bytes
+            if not (over_count or over_size):
+                break
+            path.unlink(missing_ok=True)
+            count -= 1
+            size -= st.st_size
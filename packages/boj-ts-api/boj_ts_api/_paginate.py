@@ -0,0 +1,178 @@
+"""NEXTPOSITION pagination with optional speculative look-ahead.
+
+The position of page N+1 is only known once page N has arrived, so a plain
+loop pays one full round trip per page.  With a look-ahead depth, the
+iterators below assume later pages are as wide as the last one (true for
+every page but the final one when the series-count limit is what splits
+the result) and request the next *lookahead* predicted positions while the
+current page is being consumed.  A predicted page is only used once the
+actual ``NEXTPOSITION`` chain reaches its position; pages at positions the
+chain skips are cancelled or discarded, so results are identical to the
+serial loop and a wrong guess only costs the wasted requests.
+
+The ``*_stream`` variants instead parse each page while it downloads (see
+:class:`~boj_ts_api._parse.DataPageParser`), yielding series before the
+page is complete.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from boj_ts_api._parse import DataPageParser
+from boj_ts_api._types.models.response import DataResponse
+from boj_ts_api._types.models.series import SeriesResult
+
+FetchPage = Callable[[int | None], DataResponse]
+AsyncFetchPage = Callable[[int | None], Awaitable[DataResponse]]
+StreamPage = Callable[[int | None], Iterable[bytes]]
+AsyncStreamPage = Callable[[int | None], AsyncIterable[bytes]]
+
+
+def _predict(
+    start: int, next_position: int, lookahead: int, last: int | None
+) -> list[int]:
+    """Positions of the *lookahead* pages after *next_position*, same width as this one."""
+    step = next_position - start
+    if step <= 0:
+        return []
+    positions = [next_position + i * step for i in range(lookahead)]
+    if last is not None:
+        positions = [p for p in positions if p <= last]
+    return positions
+
+
+def paginate(
+    fetch: FetchPage, *, lookahead: int = 0, last_position: int | None = None
+) -> Iterator[SeriesResult]:
+    """Yield every series of a paginated query.
+
+    Parameters
+    ----------
+    fetch:
+        Fetches (and parses) the page starting at a position; ``None`` is
+        the first page.
+    lookahead:
+        Predicted pages to request ahead on worker threads. ``0`` fetches
+        one page at a time.
+    last_position:
+        Highest valid start position, if known (the number of codes of a
+        Code API query). Predictions beyond it are not requested.
+    """
+    if lookahead <= 0:
+        position: int | None = None
+        while True:
+            resp = fetch(position)
+            yield from resp.RESULTSET
+            if resp.NEXTPOSITION is None:
+                return
+            position = resp.NEXTPOSITION
+
+    pool = ThreadPoolExecutor(max_workers=lookahead, thread_name_prefix="boj-page")
+    pending: dict[int, Future[DataResponse]] = {}
+    try:
+        start = 1
+        resp = fetch(None)
+        while True:
+            nxt = resp.NEXTPOSITION
+            if nxt is not None:
+                for pos in _predict(start, nxt, lookahead, last_position):
+                    if pos not in pending:
+                        pending[pos] = pool.submit(fetch, pos)
+            yield from resp.RESULTSET
+            if nxt is None:
+                return
+            for pos in [p for p in pending if p < nxt]:
+                pending.pop(pos).cancel()
+            future = pending.pop(nxt, None)
+            resp = future.result() if future is not None else fetch(nxt)
+            start = nxt
+    finally:
+        for future in pending.values():
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def apaginate(
+    fetch: AsyncFetchPage, *, lookahead: int = 0, last_position: int | None = None
+) -> AsyncIterator[SeriesResult]:
+    """Async counterpart of :func:`paginate`; look-ahead pages run as tasks."""
+    if lookahead <= 0:
+        position: int | None = None
+        while True:
+            resp = await fetch(position)
+            for sr in resp.RESULTSET:
+                yield sr
+            if resp.NEXTPOSITION is None:
+                return
+            position = resp.NEXTPOSITION
+
+    pending: dict[int, asyncio.Task[DataResponse]] = {}
+    try:
+        start = 1
+        resp = await fetch(None)
+        while True:
+            nxt = resp.NEXTPOSITION
+            if nxt is not None:
+                for pos in _predict(start, nxt, lookahead, last_position):
+                    if pos not in pending:
+                        task = asyncio.ensure_future(fetch(pos))
+                        task.add_done_callback(_discard_result)
+                        pending[pos] = task
+            for sr in resp.RESULTSET:
+                yield sr
+            if nxt is None:
+                return
+            for pos in [p for p in pending if p < nxt]:
+                pending.pop(pos).cancel()
+            task = pending.pop(nxt, None)
+            resp = await task if task is not None else await fetch(nxt)
+            start = nxt
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+
+def _discard_result(task: asyncio.Task[DataResponse]) -> None:
+    """Mark a look-ahead task's exception as retrieved; unused pages may fail."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _check_stream(lookahead: int) -> None:
+    if lookahead > 0:
+        raise ValueError("stream=True cannot be combined with lookahead")
+
+
+def paginate_stream(stream: StreamPage) -> Iterator[SeriesResult]:
+    """Yield every series of a paginated query, parsing pages as they arrive.
+
+    Parameters
+    ----------
+    stream:
+        Yields the body of the page starting at a position in chunks;
+        ``None`` is the first page.
+    """
+    position: int | None = None
+    while True:
+        parser = DataPageParser()
+        for chunk in stream(position):
+            yield from parser.feed(chunk)
+        position = parser.close().NEXTPOSITION
+        if position is None:
+            return
+
+
+async def apaginate_stream(stream: AsyncStreamPage) -> AsyncIterator[SeriesResult]:
+    """Async counterpart of :func:`paginate_stream`."""
+    position: int | None = None
+    while True:
+        parser = DataPageParser()
+        async for chunk in stream(position):
+            for sr in parser.feed(chunk):
+                yield sr
+        position = parser.close().NEXTPOSITION
+        if position is None:
+            return
@@ -1,34 +1,98 @@
-"""Response parsing — JSON to Pydantic models with error detection."""
+"""Response parsing — JSON to Pydantic models with error detection.
+
+By default the raw response bytes go straight to Pydantic's
+``model_validate_json``, which parses and validates in one pass in Rust
+without building an intermediate dict.  :func:`set_json_backend` switches
+to ``"orjson"`` (``pip install boj-ts-api[fast]``) or to ``"stdlib"`` (the
+original ``response.json()`` + ``model_validate`` path).
+
+:class:`DataPageParser` parses a data page incrementally from its byte
+stream, one ``RESULTSET`` element at a time.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from collections.abc import Callable
+from typing import Any, Literal, TypeVar
 
 import httpx
+from pydantic import ValidationError
 
 from boj_ts_api._types.exceptions import BOJAPIError, BOJRequestError
-from boj_ts_api._types.models.response import DataResponse, MetadataResponse
+from boj_ts_api._types.models.response import DataResponse, MetadataResponse, ResponseEnvelope
+from boj_ts_api._types.models.series import SeriesResult
+
+JsonBackend = Literal["pydantic", "orjson", "stdlib"]
+
+_E = TypeVar("_E", bound=ResponseEnvelope)
+
+_backend: JsonBackend = "pydantic"
+_orjson_loads: Callable[[bytes], Any] | None = None
+
+
+def set_json_backend(backend: JsonBackend) -> None:
+    """Select how JSON responses are decoded.
+
+    Parameters
+    ----------
+    backend:
+        ``"pydantic"`` (default) validates the raw bytes with
+        ``model_validate_json``; ``"orjson"`` decodes with orjson and then
+        validates the dict; ``"stdlib"`` uses ``response.json()``.
+    """
+    global _backend, _orjson_loads
+    if backend == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "The orjson backend requires orjson. Install it with: pip install boj-ts-api[fast]"
+            ) from None
+        _orjson_loads = orjson.loads
+    elif backend not in ("pydantic", "stdlib"):
+        raise ValueError(f"Unknown JSON backend: {backend!r}")
+    _backend = backend
+
+
+def get_json_backend() -> JsonBackend:
+    """Return the active JSON backend name."""
+    return _backend
 
 
 def parse_data_response(response: httpx.Response) -> DataResponse:
     """Parse a Code/Layer API JSON response into a DataResponse model."""
-    data = _extract_json(response)
-    resp = DataResponse.model_validate(data)
+    resp = _parse(response, DataResponse)
     _check_status(resp.STATUS, resp.MESSAGEID, resp.MESSAGE)
     return resp
 
 
 def parse_metadata_response(response: httpx.Response) -> MetadataResponse:
     """Parse a Metadata API JSON response into a MetadataResponse model."""
-    data = _extract_json(response)
-    resp = MetadataResponse.model_validate(data)
+    resp = _parse(response, MetadataResponse)
     _check_status(resp.STATUS, resp.MESSAGEID, resp.MESSAGE)
     return resp
 
 
+def _parse(response: httpx.Response, model: type[_E]) -> _E:
+    """Decode and validate *response* with the active backend."""
+    if _backend == "pydantic":
+        try:
+            return model.model_validate_json(response.content)
+        except ValidationError as exc:
+            if exc.errors()[0]["type"] != "json_invalid":
+                raise
+            raise BOJRequestError(
+                f"Failed to decode JSON response: {exc}", cause=exc
+            ) from exc
+    return model.model_validate(_extract_json(response))
+
+
 def _extract_json(response: httpx.Response) -> dict[str, Any]:
     """Extract JSON body from httpx response."""
     try:
+        if _backend == "orjson" and _orjson_loads is not None:
+            return _orjson_loads(response.content)
         return response.json()
     except Exception as exc:
         raise BOJRequestError(
@@ -40,3 +104,117 @@ def _check_status(status: int, message_id: str, message: str) -> None:
     """Raise BOJAPIError if the API STATUS is not 200."""
     if status != 200:
         raise BOJAPIError(status=status, message_id=message_id, message=message)
+
+
+# Strings (complete, or an unterminated opening quote) and brackets.  The
+# scanner never needs to look inside numbers, literals or whitespace.
+_TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"', re.DOTALL)
+_RESULTSET_KEY = b'"RESULTSET"'
+
+
+class DataPageParser:
+    """Incremental parser for one Code/Layer API JSON page.
+
+    Feed the body as it arrives; every complete ``RESULTSET`` element is
+    validated on its own (``SeriesResult.model_validate_json``) and
+    returned at once, so a page can be consumed before it has finished
+    downloading and the whole body is never held in memory.  The rest of
+    the envelope (``STATUS``, ``NEXTPOSITION``...) is validated by
+    :meth:`close`.
+
+    Usage::
+
+        parser = DataPageParser()
+        for chunk in response.iter_bytes():
+            for series in parser.feed(chunk):
+                ...
+        page = parser.close()  # DataResponse with an empty RESULTSET
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0  # next byte of _buf to scan
+        self._mark = 0  # first byte of _buf not yet assigned to the envelope
+        self._envelope = bytearray()
+        self._depth = 0
+        self._after_key = False  # last top-level token was the RESULTSET key
+        self._in_set = False
+        self._element: int | None = None  # start of the element being read
+
+    def feed(self, chunk: bytes) -> list[SeriesResult]:
+        """Consume *chunk* and return the series it completed."""
+        buf = self._buf
+        buf += chunk
+        completed: list[SeriesResult] = []
+        stop = len(buf)
+        for match in _TOKEN_RE.finditer(buf, self._pos):
+            token = match.group()
+            start = match.start()
+            if token == b'"':  # string continues in the next chunk
+                stop = start
+                break
+            if token[0] == 0x22:  # '"'
+                if self._depth == 1:
+                    self._after_key = token == _RESULTSET_KEY
+                continue
+            if token in b"{[":
+                if self._depth == 1 and token == b"[" and self._after_key:
+                    self._envelope += buf[self._mark : start + 1]
+                    self._in_set = True
+                elif self._in_set and self._depth == 2:
+                    self._element = start
+                self._depth += 1
+                self._after_key = False
+            else:
+                self._depth -= 1
+                if self._in_set and self._depth == 2 and self._element is not None:
+                    completed.append(_parse_element(bytes(buf[self._element : start + 1])))
+                    self._element = None
+                elif self._in_set and self._depth == 1:
+                    self._in_set = False
+                    self._mark = start
+        self._compact(stop)
+        return completed
+
+    def _compact(self, stop: int) -> None:
+        """Drop scanned bytes that are no longer needed."""
+        if self._element is not None:
+            keep = self._element
+            self._element = 0
+        else:
+            if not self._in_set:
+                self._envelope += self._buf[self._mark : stop]
+            keep = stop
+        del self._buf[:keep]
+        self._pos = stop - keep
+        self._mark = 0
+
+    def close(self) -> DataResponse:
+        """Validate the envelope once the body is complete.
+
+        Raises
+        ------
+        BOJRequestError
+            If the body is not complete, valid JSON.
+        BOJAPIError
+            If the API returned a non-200 ``STATUS``.
+        """
+        if self._depth != 0 or self._in_set or self._buf.strip():
+            raise BOJRequestError("Failed to decode JSON response: body is incomplete")
+        try:
+            resp = DataResponse.model_validate_json(bytes(self._envelope))
+        except ValidationError as exc:
+            if exc.errors()[0]["type"] != "json_invalid":
+                raise
+            raise BOJRequestError(f"Failed to decode JSON response: {exc}", cause=exc) from exc
+        _check_status(resp.STATUS, resp.MESSAGEID, resp.MESSAGE)
+        return resp
+
+
+def _parse_element(raw: bytes) -> SeriesResult:
+    try:
+        return SeriesResult.model_validate_json(raw)
+    except ValidationError as exc:
+        if exc.errors()[0]["type"] != "json_invalid":
+            raise
+        raise BOJRequestError(f"Failed to decode JSON response: {exc}", cause=exc) from exc
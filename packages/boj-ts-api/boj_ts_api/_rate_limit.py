@@ -0,0 +1,136 @@
+"""Client-side request pacing shared by the sync and async transports."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with optional AIMD rate adaptation.
+
+    One instance may be shared by any number of threads, event loops and
+    clients; every request takes one token.  Tokens are reserved under a
+    lock and the caller then sleeps outside it, so waiting callers are
+    served in arrival order.
+
+    With ``adaptive=True`` the rate follows additive-increase /
+    multiplicative-decrease: each successful request adds *increase*
+    requests per second (up to *max_rate*); a throttling signal (HTTP 429,
+    a 5xx status, a transport error, or latency above *latency_threshold*)
+    multiplies the rate by *decrease* (down to *min_rate*).  Decreases are
+    applied at most once per *cooldown* seconds so a burst of failures from
+    concurrent requests counts as one signal.
+
+    Parameters
+    ----------
+    rate:
+        Requests per second.
+    burst:
+        Number of requests that may be sent back-to-back after an idle
+        period.
+    adaptive:
+        Adjust the rate from observed latency and errors.
+    min_rate, max_rate:
+        Bounds for the adaptive rate. Default: ``rate / 10`` and ``rate``.
+    latency_threshold:
+        Seconds above which a successful response still counts as a
+        throttling signal. ``None`` only reacts to errors.
+    increase:
+        Requests per second added after each successful request.
+    decrease:
+        Factor applied to the rate on a throttling signal.
+    cooldown:
+        Minimum seconds between two decreases.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        adaptive: bool = False,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+        latency_threshold: float | None = None,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be between 0 and 1, got {decrease}")
+        self._min_rate = min_rate if min_rate is not None else rate / 10
+        self._max_rate = max_rate if max_rate is not None else rate
+        if not 0 < self._min_rate <= rate <= self._max_rate:
+            raise ValueError("rate bounds must satisfy 0 < min_rate <= rate <= max_rate")
+        self._rate = rate
+        self._burst = burst
+        self._adaptive = adaptive
+        self._latency_threshold = latency_threshold
+        self._increase = increase
+        self._decrease = decrease
+        self._cooldown = cooldown
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second."""
+        return self._rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(self, latency: float, *, ok: bool) -> None:
+        """Feed back the outcome of a request. No-op unless adaptive."""
+        if not self._adaptive:
+            return
+        slow = self._latency_threshold is not None and latency > self._latency_threshold
+        with self._lock:
+            self._refill(time.monotonic())
+            if ok and not slow:
+                self._rate = min(self._max_rate, self._rate + self._increase)
+                return
+            now = time.monotonic()
+            if now - self._last_decrease < self._cooldown:
+                return
+            self._last_decrease = now
+            self._rate = max(self._min_rate, self._rate * self._decrease)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
+def is_throttle_status(status_code: int | None) -> bool:
+    """Return ``True`` for outcomes that should slow an adaptive limiter down.
+
+    ``None`` stands for a transport error (timeout, connection reset).
+    """
+    return status_code is None or status_code == 429 or status_code >= 500
@@ -0,0 +1,163 @@
+"""Retry policy with exponential backoff, jitter and a retry budget."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Failures where the request most likely never reached the server or the
+# connection broke mid-response; safe to repeat because every call is a GET.
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class RetryBudget:
+    """Cap retries to a fraction of recent traffic.
+
+    Within a sliding *window*, retries are allowed while their count stays
+    below ``min_retries + ratio * requests``.  This keeps a struggling
+    server from being hit with a retry storm: when most requests fail the
+    budget runs dry and failures surface immediately.
+
+    Parameters
+    ----------
+    ratio:
+        Retries allowed per original request.
+    min_retries:
+        Retries always allowed per window, so low-traffic clients can retry.
+    window:
+        Length of the sliding window in seconds.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0) -> None:
+        if ratio < 0 or min_retries < 0 or window <= 0:
+            raise ValueError("ratio and min_retries must be >= 0 and window > 0")
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record an original (non-retry) request."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_withdraw(self) -> bool:
+        """Take one retry from the budget; ``False`` if it is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if len(self._retries) >= self._min_retries + self._ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._window
+        for stamps in (self._requests, self._retries):
+            while stamps and stamps[0] < cutoff:
+                stamps.popleft()
+
+
+class RetryPolicy:
+    """When and how long to wait before repeating a failed request.
+
+    Connect errors, timeouts, broken connections and responses whose status
+    is in *retry_statuses* are retried up to *max_retries* times.  The wait
+    before retry ``n`` is ``backoff_factor * 2 ** (n - 1)`` seconds, capped
+    at *max_backoff*; with *jitter* a uniformly random delay between zero
+    and that value is used instead ("full jitter").  A ``Retry-After``
+    header on the response overrides the computed delay, still capped at
+    *max_backoff*.
+
+    Parameters
+    ----------
+    max_retries:
+        Retries per request after the first attempt.
+    backoff_factor:
+        Base delay in seconds.
+    max_backoff:
+        Upper bound for a single delay.
+    jitter:
+        Randomise delays to spread out concurrent retries.
+    retry_statuses:
+        HTTP statuses worth retrying.
+    respect_retry_after:
+        Honour the ``Retry-After`` response header.
+    budget:
+        Optional :class:`RetryBudget`; share one instance across clients
+        to bound the total retry rate.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        *,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget
+
+    def record_request(self) -> None:
+        """Record an original request against the retry budget."""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def next_delay(self, cause: BaseException | None, retries: int) -> float | None:
+        """Return the wait before the next attempt, or ``None`` to give up.
+
+        *cause* is the underlying httpx exception of the failed attempt and
+        *retries* the number of retries already made for this request.
+        """
+        if retries >= self.max_retries or not self._is_retryable(cause):
+            return None
+        if self.budget is not None and not self.budget.try_withdraw():
+            return None
+        if self.respect_retry_after and isinstance(cause, httpx.HTTPStatusError):
+            retry_after = _parse_retry_after(cause.response.headers.get("retry-after"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        delay = min(self.max_backoff, self.backoff_factor * 2**retries)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _is_retryable(self, cause: BaseException | None) -> bool:
+        if isinstance(cause, httpx.HTTPStatusError):
+            return cause.response.status_code in self.retry_statuses
+        return isinstance(cause, _TRANSIENT_ERRORS)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -2,14 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import httpx
 
+from boj_ts_api._cache import ResponseCache
+from boj_ts_api._rate_limit import RateLimiter, is_throttle_status
+from boj_ts_api._retry import RetryPolicy
 from boj_ts_api._types.config import BASE_URL, DEFAULT_TIMEOUT
 from boj_ts_api._types.exceptions import BOJRequestError
 
 
+def _observe(limiter: RateLimiter | None, started: float, status_code: int | None) -> None:
+    if limiter is not None:
+        latency = time.monotonic() - started
+        limiter.record(latency, ok=not is_throttle_status(status_code))
+
+
+def _collected(resp: httpx.Response, chunks: list[bytes]) -> httpx.Response:
+    """Rebuild a read response from the decoded chunks of a streamed one."""
+    content_type = resp.headers.get("content-type")
+    return httpx.Response(
+        resp.status_code,
+        headers={"content-type": content_type} if content_type else {},
+        content=b"".join(chunks),
+        request=resp.request,
+    )
+
+
+def _retry_delay(policy: RetryPolicy | None, exc: BOJRequestError, retries: int) -> float | None:
+    """Return the wait before retrying *exc*, or record *retries* on it and give up."""
+    delay = policy.next_delay(exc.cause, retries) if policy is not None else None
+    if delay is None:
+        exc.retries = retries
+    return delay
+
+
 class SyncTransport:
     """Synchronous HTTP transport using httpx.Client."""
 
@@ -18,7 +49,13 @@ class SyncTransport:
         base_url: str = BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         client: httpx.Client | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
     ) -> None:
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry = retry
         self._owns_client = client is None
         self._client = client or httpx.Client(
             base_url=base_url,
@@ -27,17 +64,96 @@ class SyncTransport:
         )
 
     def get(self, path: str, params: dict[str, Any]) -> httpx.Response:
-        """Send GET request and return the raw httpx.Response."""
+        """Send GET request and return the raw httpx.Response.
+
+        Served from the response cache when one is configured and holds a
+        fresh entry for the same path and parameters.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(path, params)
+            if cached is not None:
+                return cached
+        resp = self._send(path, params)
+        if self._cache is not None:
+            self._cache.set(path, params, resp)
+        return resp
+
+    def stream(self, path: str, params: dict[str, Any]) -> Iterator[bytes]:
+        """Send GET request and yield the decoded body in chunks as it arrives.
+
+        Retries cover everything up to the response headers; an error
+        while reading the body raises :class:`BOJRequestError`.  A cache
+        hit is yielded as one chunk; on a miss the chunks are also
+        collected and cached once the body is complete.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(path, params)
+            if cached is not None:
+                yield cached.content
+                return
+        resp = self._send(path, params, stream=True)
+        chunks: list[bytes] | None = [] if self._cache is not None else None
         try:
-            resp = self._client.get(path, params=params)
-            resp.raise_for_status()
+            for chunk in resp.iter_bytes():
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+        except httpx.HTTPError as exc:
+            raise BOJRequestError(str(exc), cause=exc) from exc
+        finally:
+            resp.close()
+        if self._cache is not None and chunks is not None:
+            self._cache.set(path, params, _collected(resp, chunks))
+
+    def _send(
+        self, path: str, params: dict[str, Any], *, stream: bool = False
+    ) -> httpx.Response:
+        """Send the request, retrying per the retry policy.
+
+        The number of retries made is stored in ``response.extensions["retries"]``
+        or, on failure, in :attr:`BOJRequestError.retries`.  With *stream*,
+        the returned response's body has not been read yet.
+        """
+        if self._retry is not None:
+            self._retry.record_request()
+        retries = 0
+        while True:
+            try:
+                resp = self._attempt(path, params, stream=stream)
+            except BOJRequestError as exc:
+                delay = _retry_delay(self._retry, exc, retries)
+                if delay is None:
+                    raise
+                retries += 1
+                time.sleep(delay)
+                continue
+            resp.extensions["retries"] = retries
             return resp
+
+    def _attempt(
+        self, path: str, params: dict[str, Any], *, stream: bool = False
+    ) -> httpx.Response:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        started = time.monotonic()
+        try:
+            if stream:
+                request = self._client.build_request("GET", path, params=params)
+                resp = self._client.send(request, stream=True)
+            else:
+                resp = self._client.get(path, params=params)
+            resp.raise_for_status()
         except httpx.HTTPStatusError as exc:
+            exc.response.close()
+            _observe(self._rate_limiter, started, exc.response.status_code)
             raise BOJRequestError(
                 f"HTTP {exc.response.status_code} from {exc.request.url}", cause=exc
             ) from exc
         except httpx.HTTPError as exc:
+            _observe(self._rate_limiter, started, None)
             raise BOJRequestError(str(exc), cause=exc) from exc
+        _observe(self._rate_limiter, started, resp.status_code)
+        return resp
 
     def close(self) -> None:
         if self._owns_client:
@@ -52,7 +168,13 @@ class AsyncTransport:
         base_url: str = BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         client: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
     ) -> None:
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry = retry
         self._owns_client = client is None
         self._client = client or httpx.AsyncClient(
             base_url=base_url,
@@ -61,17 +183,90 @@ class AsyncTransport:
         )
 
     async def get(self, path: str, params: dict[str, Any]) -> httpx.Response:
-        """Send GET request and return the raw httpx.Response."""
+        """Send GET request and return the raw httpx.Response.
+
+        Served from the response cache when one is configured and holds a
+        fresh entry for the same path and parameters.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(path, params)
+            if cached is not None:
+                return cached
+        resp = await self._send(path, params)
+        if self._cache is not None:
+            self._cache.set(path, params, resp)
+        return resp
+
+    async def stream(self, path: str, params: dict[str, Any]) -> AsyncIterator[bytes]:
+        """Async counterpart of :meth:`SyncTransport.stream`."""
+        if self._cache is not None:
+            cached = self._cache.get(path, params)
+            if cached is not None:
+                yield cached.content
+                return
+        resp = await self._send(path, params, stream=True)
+        chunks: list[bytes] | None = [] if self._cache is not None else None
         try:
-            resp = await self._client.get(path, params=params)
-            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+        except httpx.HTTPError as exc:
+            raise BOJRequestError(str(exc), cause=exc) from exc
+        finally:
+            await resp.aclose()
+        if self._cache is not None and chunks is not None:
+            self._cache.set(path, params, _collected(resp, chunks))
+
+    async def _send(
+        self, path: str, params: dict[str, Any], *, stream: bool = False
+    ) -> httpx.Response:
+        """Send the request, retrying per the retry policy.
+
+        The number of retries made is stored in ``response.extensions["retries"]``
+        or, on failure, in :attr:`BOJRequestError.retries`.  With *stream*,
+        the returned response's body has not been read yet.
+        """
+        if self._retry is not None:
+            self._retry.record_request()
+        retries = 0
+        while True:
+            try:
+                resp = await self._attempt(path, params, stream=stream)
+            except BOJRequestError as exc:
+                delay = _retry_delay(self._retry, exc, retries)
+                if delay is None:
+                    raise
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+            resp.extensions["retries"] = retries
             return resp
+
+    async def _attempt(
+        self, path: str, params: dict[str, Any], *, stream: bool = False
+    ) -> httpx.Response:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.aacquire()
+        started = time.monotonic()
+        try:
+            if stream:
+                request = self._client.build_request("GET", path, params=params)
+                resp = await self._client.send(request, stream=True)
+            else:
+                resp = await self._client.get(path, params=params)
+            resp.raise_for_status()
         except httpx.HTTPStatusError as exc:
+            await exc.response.aclose()
+            _observe(self._rate_limiter, started, exc.response.status_code)
             raise BOJRequestError(
                 f"HTTP {exc.response.status_code} from {exc.request.url}", cause=exc
             ) from exc
         except httpx.HTTPError as exc:
+            _observe(self._rate_limiter, started, None)
             raise BOJRequestError(str(exc), cause=exc) from exc
+        _observe(self._rate_limiter, started, resp.status_code)
+        return resp
 
     async def close(self) -> None:
         if self._owns_client:
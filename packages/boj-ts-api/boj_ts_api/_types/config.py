@@ -14,6 +14,10 @@ ENDPOINT_METADATA = "/api/v1/getMetadata"
 # Defaults
 DEFAULT_TIMEOUT = 30.0
 
+# CSV response encodings; Japanese CSV is Shift-JIS in its Windows form
+# (code page 932, a superset that also covers NEC/IBM extension characters).
+CSV_ENCODINGS = {"jp": "cp932", "en": "utf-8"}
+
 # API limits
 MAX_SERIES_PER_REQUEST = 100
 MAX_DATA_POINTS_PER_REQUEST = 60_000
@@ -18,10 +18,14 @@ class BOJAPIError(BOJError):
 
 
 class BOJRequestError(BOJError):
-    """Raised on network / transport errors."""
+    """Raised on network / transport errors.
+
+    ``retries`` is the number of retries made before giving up.
+    """
 
     def __init__(self, message: str, cause: Exception | None = None) -> None:
         self.cause = cause
+        self.retries = 0
         super().__init__(message)
 
 
@@ -6,7 +6,11 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 from boj_ts_api._base_client import _BaseClient
+from boj_ts_api._cache import ResponseCache
+from boj_ts_api._paginate import _check_stream, apaginate, apaginate_stream
 from boj_ts_api._parse import parse_data_response, parse_metadata_response
+from boj_ts_api._rate_limit import RateLimiter
+from boj_ts_api._retry import RetryPolicy
 from boj_ts_api._transport import AsyncTransport
 from boj_ts_api._types.config import DEFAULT_TIMEOUT, Format, Frequency, Lang
 from boj_ts_api._types.models.response import DataResponse, MetadataResponse
@@ -20,6 +24,12 @@ class AsyncClient(_BaseClient):
 
         async with AsyncClient(lang=Lang.EN) as client:
             resp = await client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+
+    Pass ``cache=MemoryResponseCache()`` (or :class:`FileResponseCache`) to
+    serve repeated identical requests without touching the network, and
+    ``rate_limiter=RateLimiter(rate=5)`` to pace requests client-side.
+    ``retry=RetryPolicy()`` retries timeouts, connection errors, 5xx and 429
+    responses with exponential backoff.
     """
 
     def __init__(
@@ -27,9 +37,18 @@ class AsyncClient(_BaseClient):
         lang: Lang = Lang.EN,
         timeout: float = DEFAULT_TIMEOUT,
         base_url: str | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
     ) -> None:
         super().__init__(lang=lang, timeout=timeout)
-        kwargs: dict[str, Any] = {"timeout": timeout}
+        kwargs: dict[str, Any] = {
+            "timeout": timeout,
+            "cache": cache,
+            "rate_limiter": rate_limiter,
+            "retry": retry,
+        }
         if base_url is not None:
             kwargs["base_url"] = base_url
         self._transport = AsyncTransport(**kwargs)
@@ -45,6 +64,16 @@ class AsyncClient(_BaseClient):
     async def close(self) -> None:
         await self._transport.close()
 
+    async def _decode_csv(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        decoder = self._csv_decoder()
+        async for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
     # -- Data by Code --
 
     async def get_data_code(
@@ -70,19 +99,44 @@ class AsyncClient(_BaseClient):
         *,
         start_date: str | None = None,
         end_date: str | None = None,
+        lookahead: int = 0,
+        stream: bool = False,
     ) -> AsyncIterator[SeriesResult]:
-        """Iterate over all series results, auto-paginating via NEXTPOSITION."""
-        start_position: int | None = None
-        while True:
-            resp = await self.get_data_code(
+        """Iterate over all series results, auto-paginating via NEXTPOSITION.
+
+        With ``lookahead=n`` the next *n* pages, at positions predicted from
+        the width of the last page, are requested while the current one is
+        consumed; results are unchanged.
+
+        With ``stream=True`` each page is parsed while it downloads and its
+        series are yielded as they complete, so the first results arrive
+        before the page has finished and no page is held in memory whole.
+        Cannot be combined with *lookahead*.
+        """
+        if stream:
+            _check_stream(lookahead)
+
+            def stream_page(start_position: int | None) -> AsyncIterator[bytes]:
+                path, params = self._data_code_params(
+                    db, code, start_date=start_date, end_date=end_date,
+                    start_position=start_position, format_=Format.JSON,
+                )
+                return self._transport.stream(path, params)
+
+            async for item in apaginate_stream(stream_page):
+                yield item
+            return
+
+        async def fetch(start_position: int | None) -> DataResponse:
+            return await self.get_data_code(
                 db=db, code=code, start_date=start_date,
                 end_date=end_date, start_position=start_position,
             )
-            for item in resp.RESULTSET:
-                yield item
-            if resp.NEXTPOSITION is None:
-                break
-            start_position = resp.NEXTPOSITION
+
+        # startPosition indexes the requested codes, so it cannot exceed their count.
+        last = code.count(",") + 1
+        async for item in apaginate(fetch, lookahead=lookahead, last_position=last):
+            yield item
 
     async def get_data_code_csv(
         self,
@@ -100,6 +154,28 @@ class AsyncClient(_BaseClient):
         )
         return (await self._transport.get(path, params)).text
 
+    async def stream_data_code_csv(
+        self,
+        db: str,
+        code: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        start_position: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream time-series data as CSV text, decoded chunk by chunk as it downloads.
+
+        Yields ``str`` chunks whose concatenation equals
+        :meth:`get_data_code_csv`, without holding the whole body in memory.
+        Japanese (``lang=jp``) Shift-JIS bodies are decoded incrementally.
+        """
+        path, params = self._data_code_params(
+            db, code, start_date=start_date, end_date=end_date,
+            start_position=start_position, format_=Format.CSV,
+        )
+        async for text in self._decode_csv(self._transport.stream(path, params)):
+            yield text
+
     # -- Data by Layer --
 
     async def get_data_layer(
@@ -127,20 +203,37 @@ class AsyncClient(_BaseClient):
         *,
         start_date: str | None = None,
         end_date: str | None = None,
+        lookahead: int = 0,
+        stream: bool = False,
     ) -> AsyncIterator[SeriesResult]:
-        """Iterate over all series results from Layer API, auto-paginating."""
-        start_position: int | None = None
-        while True:
-            resp = await self.get_data_layer(
+        """Iterate over all series results from Layer API, auto-paginating.
+
+        ``lookahead`` requests predicted pages ahead and ``stream`` parses
+        pages as they download, as in :meth:`iter_data_code`.
+        """
+        if stream:
+            _check_stream(lookahead)
+
+            def stream_page(start_position: int | None) -> AsyncIterator[bytes]:
+                path, params = self._data_layer_params(
+                    db, frequency, layer, start_date=start_date, end_date=end_date,
+                    start_position=start_position, format_=Format.JSON,
+                )
+                return self._transport.stream(path, params)
+
+            async for item in apaginate_stream(stream_page):
+                yield item
+            return
+
+        async def fetch(start_position: int | None) -> DataResponse:
+            return await self.get_data_layer(
                 db=db, frequency=frequency, layer=layer,
                 start_date=start_date, end_date=end_date,
                 start_position=start_position,
             )
-            for item in resp.RESULTSET:
-                yield item
-            if resp.NEXTPOSITION is None:
-                break
-            start_position = resp.NEXTPOSITION
+
+        async for item in apaginate(fetch, lookahead=lookahead):
+            yield item
 
     async def get_data_layer_csv(
         self,
@@ -159,6 +252,24 @@ class AsyncClient(_BaseClient):
         )
         return (await self._transport.get(path, params)).text
 
+    async def stream_data_layer_csv(
+        self,
+        db: str,
+        frequency: Frequency,
+        layer: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        start_position: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream layer data as CSV text; see :meth:`stream_data_code_csv`."""
+        path, params = self._data_layer_params(
+            db, frequency, layer, start_date=start_date, end_date=end_date,
+            start_position=start_position, format_=Format.CSV,
+        )
+        async for text in self._decode_csv(self._transport.stream(path, params)):
+            yield text
+
     # -- Metadata --
 
     async def get_metadata(self, db: str) -> MetadataResponse:
@@ -170,3 +281,9 @@ class AsyncClient(_BaseClient):
         """Fetch metadata as raw CSV text."""
         path, params = self._metadata_params(db, format_=Format.CSV)
         return (await self._transport.get(path, params)).text
+
+    async def stream_metadata_csv(self, db: str) -> AsyncIterator[str]:
+        """Stream metadata as CSV text; see :meth:`stream_data_code_csv`."""
+        path, params = self._metadata_params(db, format_=Format.CSV)
+        async for text in self._decode_csv(self._transport.stream(path, params)):
+            yield text
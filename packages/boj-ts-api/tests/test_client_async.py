@@ -12,6 +12,7 @@ from boj_ts_api._types.config import (
     ENDPOINT_DATA_LAYER,
     ENDPOINT_METADATA,
 )
+from test_pagination import _paged_server
 
 
 class TestAsyncGetDataCode:
@@ -85,3 +86,22 @@ class TestAsyncGetMetadata:
 
         assert resp.STATUS == 200
         assert len(resp.RESULTSET) == 2
+
+
+class TestAsyncLookahead:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_uneven_pages_follow_next_position(self):
+        codes = [f"C{i}" for i in range(1, 8)]
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            side_effect=_paged_server(codes, [1, 3, 4, 6])
+        )
+        async with AsyncClient(lang=Lang.EN) as client:
+            results = [
+                item
+                async for item in client.iter_data_code(
+                    db="CO", code=",".join(codes), lookahead=2
+                )
+            ]
+
+        assert [r.SERIES_CODE for r in results] == codes
@@ -50,3 +50,68 @@ class TestIterDataLayer:
 
         assert len(results) == 1
         assert results[0].SERIES_CODE == "MAINAVG"
+
+
+def _paged_server(codes: list[str], starts: list[int]):
+    """Serve *codes* in pages beginning at the 1-based positions in *starts*."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params.get("startPosition", 1))
+        if start not in starts:
+            return httpx.Response(
+                400, json={"STATUS": 400, "MESSAGEID": "M181012E", "MESSAGE": "bad position"}
+            )
+        i = starts.index(start)
+        stop = starts[i + 1] if i + 1 < len(starts) else len(codes) + 1
+        body = {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "",
+            "DATE": "2025-12-02T13:13:14.587+09:00",
+            "NEXTPOSITION": stop if stop <= len(codes) else None,
+            "RESULTSET": [{"SERIES_CODE": c} for c in codes[start - 1 : stop - 1]],
+        }
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+class TestLookahead:
+    CODES = [f"C{i}" for i in range(1, 8)]
+
+    @respx.mock
+    def test_predicted_pages_fetched_once(self):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            side_effect=_paged_server(self.CODES, [1, 3, 5, 7])
+        )
+        with Client(lang=Lang.EN) as client:
+            results = list(
+                client.iter_data_code(db="CO", code=",".join(self.CODES), lookahead=3)
+            )
+
+        assert [r.SERIES_CODE for r in results] == self.CODES
+        assert route.call_count == 4
+
+    @respx.mock
+    def test_uneven_pages_follow_next_position(self):
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            side_effect=_paged_server(self.CODES, [1, 3, 4, 6])
+        )
+        with Client(lang=Lang.EN) as client:
+            results = list(
+                client.iter_data_code(db="CO", code=",".join(self.CODES), lookahead=2)
+            )
+
+        assert [r.SERIES_CODE for r in results] == self.CODES
+
+    @respx.mock
+    def test_failed_speculative_pages_are_ignored(self):
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_LAYER}").mock(
+            side_effect=_paged_server(self.CODES, [1, 4])
+        )
+        with Client(lang=Lang.EN) as client:
+            results = list(
+                client.iter_data_layer(db="FM08", frequency=Frequency.D, layer="*", lookahead=4)
+            )
+
+        assert [r.SERIES_CODE for r in results] == self.CODES
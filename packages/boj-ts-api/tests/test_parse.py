@@ -0,0 +1,59 @@
+"""Tests for JSON response parsing backends."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from boj_ts_api import BOJAPIError, BOJRequestError, get_json_backend, set_json_backend
+from boj_ts_api._parse import parse_data_response, parse_metadata_response
+from pydantic import ValidationError
+
+BACKENDS = ["pydantic", "orjson", "stdlib"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    previous = get_json_backend()
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+def _response(body: bytes, content_type: str = "application/json") -> httpx.Response:
+    return httpx.Response(200, content=body, headers={"content-type": content_type})
+
+
+class TestBackends:
+    def test_data_response_identical(self, backend: str, data_code_json: dict):
+        resp = parse_data_response(_response(json.dumps(data_code_json).encode()))
+        set_json_backend("stdlib")
+        expected = parse_data_response(_response(json.dumps(data_code_json).encode()))
+        assert resp == expected
+
+    def test_metadata_response(self, backend: str, metadata_json: dict):
+        resp = parse_metadata_response(_response(json.dumps(metadata_json).encode()))
+        expected = [rec.get("SERIES_CODE") for rec in metadata_json["RESULTSET"]]
+        assert [rec.SERIES_CODE for rec in resp.RESULTSET] == expected
+
+    def test_api_error(self, backend: str, error_json: dict):
+        with pytest.raises(BOJAPIError):
+            parse_data_response(_response(json.dumps(error_json).encode()))
+
+    def test_invalid_json(self, backend: str):
+        with pytest.raises(BOJRequestError, match="decode JSON"):
+            parse_data_response(_response(b"<html>busy</html>"))
+
+    def test_schema_error_not_masked(self, backend: str):
+        with pytest.raises(ValidationError):
+            parse_data_response(_response(b'{"STATUS": "not-a-number"}'))
+
+
+class TestSetJsonBackend:
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            set_json_backend("simdjson")  # type: ignore[arg-type]
@@ -0,0 +1,111 @@
+"""Tests for the client-side rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+from boj_ts_api import AsyncClient, BOJRequestError, Client, Lang, RateLimiter
+from boj_ts_api._rate_limit import is_throttle_status
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE
+
+
+class TestRateLimiterInit:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"rate": 0},
+            {"rate": 1, "burst": 0},
+            {"rate": 1, "decrease": 1.0},
+            {"rate": 5, "max_rate": 2},
+            {"rate": 5, "min_rate": 10},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+
+class TestTokenBucket:
+    def test_burst_is_immediate(self):
+        limiter = RateLimiter(rate=1, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_paces_after_burst(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.19
+
+    async def test_async_paces_concurrent_waiters(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.aacquire() for _ in range(5)))
+        assert time.monotonic() - start >= 0.19
+
+
+class TestAdaptive:
+    def test_static_limiter_ignores_feedback(self):
+        limiter = RateLimiter(rate=4)
+        limiter.record(0.1, ok=False)
+        assert limiter.rate == 4
+
+    def test_error_halves_rate(self):
+        limiter = RateLimiter(rate=4, adaptive=True)
+        limiter.record(0.1, ok=False)
+        assert limiter.rate == 2
+
+    def test_decrease_respects_cooldown_and_floor(self):
+        limiter = RateLimiter(rate=4, adaptive=True, min_rate=3, cooldown=60)
+        limiter.record(0.1, ok=False)
+        limiter.record(0.1, ok=False)
+        assert limiter.rate == 3
+
+    def test_slow_response_counts_as_signal(self):
+        limiter = RateLimiter(rate=4, adaptive=True, latency_threshold=1.0)
+        limiter.record(2.0, ok=True)
+        assert limiter.rate == 2
+
+    def test_success_increases_up_to_max(self):
+        limiter = RateLimiter(rate=4, adaptive=True, max_rate=4.25, increase=0.2)
+        limiter.record(0.1, ok=True)
+        assert limiter.rate == pytest.approx(4.2)
+        limiter.record(0.1, ok=True)
+        assert limiter.rate == 4.25
+
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [(None, True), (200, False), (404, False), (429, True), (503, True)],
+    )
+    def test_throttle_status(self, status: int | None, expected: bool):
+        assert is_throttle_status(status) is expected
+
+
+class TestTransportIntegration:
+    @respx.mock
+    def test_sync_client_backs_off_on_503(self):
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(return_value=httpx.Response(503))
+        limiter = RateLimiter(rate=10, burst=5, adaptive=True)
+        with (
+            Client(lang=Lang.EN, rate_limiter=limiter) as client,
+            pytest.raises(BOJRequestError),
+        ):
+            client.get_data_code(db="CO", code="X")
+        assert limiter.rate == 5
+
+    @respx.mock
+    async def test_async_client_increases_on_success(self, data_code_json: dict):
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, json=data_code_json)
+        )
+        limiter = RateLimiter(rate=10, burst=5, adaptive=True, max_rate=20, increase=1)
+        async with AsyncClient(lang=Lang.EN, rate_limiter=limiter) as client:
+            await client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+        assert limiter.rate == 11
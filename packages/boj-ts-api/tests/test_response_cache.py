@@ -0,0 +1,146 @@
+"""Tests for the transport-level response caches."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+from boj_ts_api import (
+    AsyncClient,
+    BOJAPIError,
+    Client,
+    FileResponseCache,
+    Lang,
+    MemoryResponseCache,
+)
+from boj_ts_api._cache import cache_key
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+
+
+class TestCacheKey:
+    def test_param_order_and_case_ignored(self):
+        a = cache_key("/p", {"db": "CO", "Code": "X"})
+        assert a == cache_key("/p", {"code": "X", "DB": "CO"})
+
+    def test_values_distinguish(self):
+        assert cache_key("/p", {"code": "X"}) != cache_key("/p", {"code": "Y"})
+
+
+class TestMemoryResponseCache:
+    @respx.mock
+    def test_repeated_request_served_from_cache(self, data_code_json: dict):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, json=data_code_json)
+        )
+        with Client(lang=Lang.EN, cache=MemoryResponseCache()) as client:
+            first = client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+            second = client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+
+        assert route.call_count == 1
+        assert first == second
+
+    @respx.mock
+    def test_api_error_not_cached(self, error_json: dict):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, json=error_json)
+        )
+        cache = MemoryResponseCache()
+        with Client(lang=Lang.EN, cache=cache) as client:
+            for _ in range(2):
+                with pytest.raises(BOJAPIError):
+                    client.get_data_code(db="CO", code="BAD")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_endpoint_ttl_zero_disables(self, metadata_json: dict):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_METADATA}").mock(
+            return_value=httpx.Response(200, json=metadata_json)
+        )
+        cache = MemoryResponseCache(endpoint_ttl={ENDPOINT_METADATA: 0})
+        with Client(lang=Lang.EN, cache=cache) as client:
+            client.get_metadata(db="FM08")
+            client.get_metadata(db="FM08")
+
+        assert route.call_count == 2
+
+    def test_ttl_expiry(self):
+        cache = MemoryResponseCache(ttl=0.01)
+        resp = httpx.Response(200, text="a,b", request=httpx.Request("GET", BASE_URL))
+        cache.set("/p", {}, resp)
+        assert cache.get("/p", {}) is not None
+        time.sleep(0.02)
+        assert cache.get("/p", {}) is None
+
+    def test_lru_size_limit(self):
+        cache = MemoryResponseCache(max_entries=None, max_bytes=10)
+        for name in ("a", "b"):
+            resp = httpx.Response(200, text="x" * 6, request=httpx.Request("GET", BASE_URL))
+            cache.set("/p", {"k": name}, resp)
+        assert cache.get("/p", {"k": "a"}) is None
+        assert cache.get("/p", {"k": "b"}) is not None
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_client(self, data_code_json: dict):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, json=data_code_json)
+        )
+        async with AsyncClient(lang=Lang.EN, cache=MemoryResponseCache()) as client:
+            await client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+            await client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+
+        assert route.call_count == 1
+
+
+class TestFileResponseCache:
+    @respx.mock
+    def test_persists_across_clients(self, tmp_path, csv_text: str):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, text=csv_text)
+        )
+        for _ in range(2):
+            with Client(lang=Lang.EN, cache=FileResponseCache(tmp_path)) as client:
+                result = client.get_data_code_csv(db="CO", code="TK99F1000601GCQ01000")
+
+        assert route.call_count == 1
+        assert result == csv_text
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        cache = FileResponseCache(tmp_path, max_entries=2, max_bytes=None)
+        for name in ("a", "b"):
+            resp = httpx.Response(200, text=name, request=httpx.Request("GET", BASE_URL))
+            cache.set("/p", {"k": name}, resp)
+        # Mark "a" as most recently read
+        path_a = cache._path(cache_key("/p", {"k": "a"}))
+        now = time.time()
+        os.utime(path_a, (now + 10, now))
+        resp = httpx.Response(200, text="c", request=httpx.Request("GET", BASE_URL))
+        cache.set("/p", {"k": "c"}, resp)
+
+        assert cache.get("/p", {"k": "b"}) is None
+        assert cache.get("/p", {"k": "a"}).text == "a"
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        cache = FileResponseCache(tmp_path)
+        path = cache._path(cache_key("/p", {}))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"not json\n")
+        assert cache.get("/p", {}) is None
+        assert not path.exists()
+
+    def test_file_removed_during_lookup_is_a_miss(self, tmp_path, monkeypatch):
+        cache = FileResponseCache(tmp_path)
+        resp = httpx.Response(200, text="a", request=httpx.Request("GET", BASE_URL))
+        cache.set("/p", {}, resp)
+
+        def vanished(self, **kwargs):
+            self.unlink()
+            raise FileNotFoundError(self)
+
+        monkeypatch.setattr(Path, "stat", vanished)
+        assert cache.get("/p", {}) is None
@@ -0,0 +1,127 @@
+"""Tests for retry with backoff in the transports."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+from boj_ts_api import AsyncClient, BOJRequestError, Client, Lang, RetryBudget, RetryPolicy
+from boj_ts_api._retry import _parse_retry_after
+from boj_ts_api._transport import SyncTransport
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE
+
+URL = f"{BASE_URL}{ENDPOINT_DATA_CODE}"
+
+
+def _no_wait(max_retries: int = 3, **kwargs) -> RetryPolicy:
+    return RetryPolicy(max_retries, backoff_factor=0, jitter=False, **kwargs)
+
+
+def _status_error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", URL)
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff_without_jitter(self):
+        policy = RetryPolicy(5, backoff_factor=1, max_backoff=5, jitter=False)
+        cause = _status_error(503)
+        assert [policy.next_delay(cause, n) for n in range(5)] == [1, 2, 4, 5, 5]
+
+    def test_full_jitter_within_bounds(self):
+        policy = RetryPolicy(backoff_factor=1)
+        delays = [policy.next_delay(_status_error(500), 2) for _ in range(50)]
+        assert all(0 <= d <= 4 for d in delays)
+
+    def test_gives_up_after_max_retries(self):
+        assert _no_wait(2).next_delay(_status_error(503), 2) is None
+
+    @pytest.mark.parametrize(
+        "cause",
+        [
+            httpx.ConnectError("refused"),
+            httpx.ReadTimeout("slow"),
+            httpx.RemoteProtocolError("reset"),
+        ],
+    )
+    def test_transient_errors_retried(self, cause: Exception):
+        assert _no_wait().next_delay(cause, 0) == 0
+
+    @pytest.mark.parametrize("status", [400, 404])
+    def test_client_errors_not_retried(self, status: int):
+        assert _no_wait().next_delay(_status_error(status), 0) is None
+
+    def test_retry_after_header(self):
+        policy = RetryPolicy(max_backoff=10)
+        assert policy.next_delay(_status_error(429, {"Retry-After": "7"}), 0) == 7
+        assert policy.next_delay(_status_error(429, {"Retry-After": "120"}), 0) == 10
+
+    def test_retry_after_http_date(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert _parse_retry_after("soon") is None
+
+
+class TestRetryBudget:
+    def test_min_retries_then_ratio(self):
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+    def test_exhausted_budget_stops_retries(self):
+        policy = _no_wait(budget=RetryBudget(ratio=0, min_retries=0))
+        assert policy.next_delay(_status_error(503), 0) is None
+
+
+class TestTransportRetries:
+    @respx.mock
+    def test_recovers_from_transient_errors(self, data_code_json: dict):
+        route = respx.get(URL).mock(
+            side_effect=[
+                httpx.ConnectError("refused"),
+                httpx.Response(503),
+                httpx.Response(200, json=data_code_json),
+            ]
+        )
+        transport = SyncTransport(retry=_no_wait())
+        resp = transport.get(ENDPOINT_DATA_CODE, {"db": "CO"})
+        transport.close()
+
+        assert route.call_count == 3
+        assert resp.extensions["retries"] == 2
+
+    @respx.mock
+    def test_error_carries_retry_count(self):
+        route = respx.get(URL).mock(return_value=httpx.Response(502))
+        with (
+            Client(lang=Lang.EN, retry=_no_wait(2)) as client,
+            pytest.raises(BOJRequestError) as exc_info,
+        ):
+            client.get_data_code(db="CO", code="X")
+
+        assert route.call_count == 3
+        assert exc_info.value.retries == 2
+
+    @respx.mock
+    def test_no_policy_means_single_attempt(self):
+        route = respx.get(URL).mock(return_value=httpx.Response(503))
+        with Client(lang=Lang.EN) as client, pytest.raises(BOJRequestError) as exc_info:
+            client.get_data_code(db="CO", code="X")
+
+        assert route.call_count == 1
+        assert exc_info.value.retries == 0
+
+    @respx.mock
+    async def test_async_client_retries(self, data_code_json: dict):
+        route = respx.get(URL).mock(
+            side_effect=[httpx.Response(429), httpx.Response(200, json=data_code_json)]
+        )
+        async with AsyncClient(lang=Lang.EN, retry=_no_wait()) as client:
+            resp = await client.get_data_code(db="CO", code="TK99F1000601GCQ01000")
+
+        assert route.call_count == 2
+        assert resp.RESULTSET
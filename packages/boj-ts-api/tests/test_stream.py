@@ -0,0 +1,244 @@
+"""Tests for streaming JSON data pages and CSV bodies."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+from boj_ts_api import (
+    AsyncClient,
+    BOJAPIError,
+    BOJRequestError,
+    Client,
+    DataPageParser,
+    Frequency,
+    Lang,
+    MemoryResponseCache,
+    RetryPolicy,
+)
+from boj_ts_api._parse import parse_data_response
+from boj_ts_api._types.config import (
+    BASE_URL,
+    ENDPOINT_DATA_CODE,
+    ENDPOINT_DATA_LAYER,
+    ENDPOINT_METADATA,
+)
+from test_pagination import _paged_server
+
+TRICKY = {
+    "STATUS": 200,
+    "MESSAGEID": "M181000I",
+    "MESSAGE": "RESULTSET",
+    "NEXTPOSITION": 3,
+    "PARAMETER": {"RESULTSET": ["not", "this", "one"]},
+    "RESULTSET": [
+        {"SERIES_CODE": "A", "NAME_OF_TIME_SERIES": 'Braces {[ and "quotes" ]}\\',
+         "VALUES": {"SURVEY_DATES": [202401, 202402], "VALUES": [1.5, None]}},
+        {"SERIES_CODE": "B", "NAME_OF_TIME_SERIES_J": "円／ドル",
+         "VALUES": {"SURVEY_DATES": [], "VALUES": []}},
+    ],
+    "DATE": "2025-12-02T13:00:00.000+09:00",
+}
+
+
+def _parse_in_chunks(body: bytes, size: int) -> tuple[list, object]:
+    parser = DataPageParser()
+    series = []
+    for i in range(0, len(body), size):
+        series.extend(parser.feed(body[i : i + size]))
+    return series, parser.close()
+
+
+class TestDataPageParser:
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 1 << 20])
+    def test_matches_whole_body_parse(self, size, data_code_json):
+        for doc in (data_code_json, TRICKY):
+            body = json.dumps(doc, ensure_ascii=False).encode()
+            expected = parse_data_response(httpx.Response(200, content=body))
+            series, envelope = _parse_in_chunks(body, size)
+            assert series == expected.RESULTSET
+            assert envelope.RESULTSET == []
+            assert envelope.NEXTPOSITION == expected.NEXTPOSITION
+            assert envelope.MESSAGE == expected.MESSAGE
+
+    def test_series_returned_as_soon_as_complete(self):
+        body = json.dumps(TRICKY).encode()
+        end_of_first = body.index(b"[1.5, null]}}") + len(b"[1.5, null]}}")
+        parser = DataPageParser()
+        assert [sr.SERIES_CODE for sr in parser.feed(body[: end_of_first - 1])] == []
+        assert [sr.SERIES_CODE for sr in parser.feed(body[end_of_first - 1 : end_of_first])] == [
+            "A"
+        ]
+
+    def test_truncated_body(self):
+        parser = DataPageParser()
+        parser.feed(json.dumps(TRICKY).encode()[:-40])
+        with pytest.raises(BOJRequestError, match="incomplete"):
+            parser.close()
+
+    def test_invalid_json(self):
+        parser = DataPageParser()
+        parser.feed(b"<html>busy</html>")
+        with pytest.raises(BOJRequestError, match="decode JSON"):
+            parser.close()
+
+    def test_api_error(self, error_json):
+        parser = DataPageParser()
+        assert parser.feed(json.dumps(error_json).encode()) == []
+        with pytest.raises(BOJAPIError):
+            parser.close()
+
+
+def _chunked(handler, size: int = 16):
+    """Wrap a respx handler so its body is delivered in *size*-byte chunks."""
+
+    def stream(request: httpx.Request) -> httpx.Response:
+        resp = handler(request)
+        body = resp.content
+        chunks = iter([body[i : i + size] for i in range(0, len(body), size)])
+        return httpx.Response(resp.status_code, content=chunks, headers=resp.headers)
+
+    return stream
+
+
+class TestStreamingClient:
+    CODES = [f"C{i}" for i in range(1, 8)]
+
+    @respx.mock
+    def test_same_results_as_buffered(self):
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            side_effect=_chunked(_paged_server(self.CODES, [1, 3, 5, 7]))
+        )
+        with Client() as client:
+            streamed = list(client.iter_data_code("CO", ",".join(self.CODES), stream=True))
+            buffered = list(client.iter_data_code("CO", ",".join(self.CODES)))
+        assert [sr.SERIES_CODE for sr in streamed] == self.CODES
+        assert streamed == buffered
+
+    @respx.mock
+    def test_first_series_before_body_finishes(self):
+        body = json.dumps({
+            "STATUS": 200, "MESSAGEID": "M181000I", "MESSAGE": "", "NEXTPOSITION": None,
+            "RESULTSET": [{"SERIES_CODE": c} for c in self.CODES],
+        }).encode()
+        sent: list[int] = []
+
+        def chunks():
+            for i in range(0, len(body), 8):
+                sent.append(i)
+                yield body[i : i + 8]
+
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, content=chunks())
+        )
+        with Client() as client:
+            it = client.iter_data_code("CO", ",".join(self.CODES), stream=True)
+            assert next(it).SERIES_CODE == "C1"
+            assert len(sent) * 8 < len(body)
+            assert [sr.SERIES_CODE for sr in it] == self.CODES[1:]
+
+    @respx.mock
+    def test_streamed_page_cached(self):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            side_effect=_chunked(_paged_server(self.CODES, [1]))
+        )
+        with Client(cache=MemoryResponseCache()) as client:
+            first = list(client.iter_data_code("CO", ",".join(self.CODES), stream=True))
+            second = list(client.iter_data_code("CO", ",".join(self.CODES), stream=True))
+        assert route.call_count == 1
+        assert first == second
+
+    @respx.mock
+    def test_retries_before_body(self):
+        route = respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}")
+        route.side_effect = [httpx.Response(503), *[
+            _chunked(_paged_server(self.CODES, [1]))(httpx.Request("GET", BASE_URL))
+        ]]
+        retry = RetryPolicy(2, backoff_factor=0, jitter=False)
+        with Client(retry=retry) as client:
+            results = list(client.iter_data_code("CO", ",".join(self.CODES), stream=True))
+        assert len(results) == len(self.CODES)
+        assert route.call_count == 2
+
+    def test_lookahead_rejected(self):
+        with Client() as client, pytest.raises(ValueError, match="lookahead"):
+            next(client.iter_data_code("CO", "A", stream=True, lookahead=2))
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_layer(self, data_layer_json):
+        body = json.dumps(data_layer_json).encode()
+
+        async def chunks():
+            for i in range(0, len(body), 32):
+                yield body[i : i + 32]
+
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_LAYER}").mock(
+            return_value=httpx.Response(200, content=chunks())
+        )
+        async with AsyncClient() as client:
+            results = [
+                sr async for sr in client.iter_data_layer("MD10", Frequency.Q, "*", stream=True)
+            ]
+        expected = parse_data_response(httpx.Response(200, content=body)).RESULTSET
+        assert results == expected
+
+
+JP_CSV = "系列コード,系列名称,値\nFM08'FXERD01,東京市場　ドル・円　スポット　9時時点,156.12\n"
+
+
+def _byte_chunks(body: bytes, size: int):
+    return iter([body[i : i + size] for i in range(0, len(body), size)])
+
+
+class TestStreamingCsv:
+    @respx.mock
+    @pytest.mark.parametrize("size", [1, 3, 1 << 16])
+    def test_shift_jis_decoded_across_chunks(self, size):
+        body = JP_CSV.encode("cp932")
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_CODE}").mock(
+            return_value=httpx.Response(200, content=_byte_chunks(body, size))
+        )
+        with Client(lang=Lang.JP) as client:
+            chunks = list(client.stream_data_code_csv(db="FM08", code="FXERD01"))
+        assert "".join(chunks) == JP_CSV
+        assert all(chunks)
+
+    @respx.mock
+    def test_english_matches_get(self, csv_text: str):
+        respx.get(f"{BASE_URL}{ENDPOINT_DATA_LAYER}").mock(
+            return_value=httpx.Response(200, text=csv_text)
+        )
+        with Client() as client:
+            streamed = "".join(client.stream_data_layer_csv("CO", Frequency.Q, "*"))
+            assert streamed == client.get_data_layer_csv("CO", Frequency.Q, "*")
+
+    @respx.mock
+    def test_metadata_cached(self):
+        body = JP_CSV.encode("cp932")
+        route = respx.get(f"{BASE_URL}{ENDPOINT_METADATA}").mock(
+            side_effect=lambda request: httpx.Response(200, content=_byte_chunks(body, 5))
+        )
+        with Client(lang=Lang.JP, cache=MemoryResponseCache()) as client:
+            first = "".join(client.stream_metadata_csv("FM08"))
+            second = "".join(client.stream_metadata_csv("FM08"))
+        assert first == second == JP_CSV
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_shift_jis(self):
+        body = JP_CSV.encode("cp932")
+
+        async def chunks():
+            for i in range(len(body)):
+                yield body[i : i + 1]
+
+        respx.get(f"{BASE_URL}{ENDPOINT_METADATA}").mock(
+            return_value=httpx.Response(200, content=chunks())
+        )
+        async with AsyncClient(lang=Lang.JP) as client:
+            text = "".join([chunk async for chunk in client.stream_metadata_csv("FM08")])
+        assert text == JP_CSV
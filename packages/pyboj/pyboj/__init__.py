@@ -8,17 +8,26 @@ from boj_ts_api import (
     BOJValidationError,
     Client,
     DataResponse,
+    FileResponseCache,
     Format,
     Frequency,
     Lang,
+    MemoryResponseCache,
     MetadataRecord,
     MetadataResponse,
+    RateLimiter,
+    ResponseCache,
     ResponseEnvelope,
+    RetryBudget,
+    RetryPolicy,
     SeriesResult,
     SeriesValues,
 )
 
+from pyboj._async_boj import AsyncBOJ
 from pyboj._boj import BOJ
+from pyboj._cache import FileMetadataCache, MemoryMetadataCache, MetadataCache
+from pyboj._collection import SeriesCollection
 from pyboj._config import Database
 from pyboj._domains import (
     AccountSide,
@@ -59,13 +68,26 @@ from pyboj._domains import (
     TankanSize,
     TankanTiming,
 )
-from pyboj._helpers.csv import csv_to_dataframe
+from pyboj._helpers.csv import csv_to_dataframe, iter_csv_batches, iter_csv_frames, write_csv
 from pyboj._helpers.layer_tree import LayerNode, build_layer_tree, search_metadata
+from pyboj._helpers.panel import to_panel
+from pyboj._helpers.search_index import GlobalSearchIndex
+from pyboj._helpers.sync import SyncReport
+from pyboj._parsing.arrays import SeriesArrays
 from pyboj._plotting import plot_series
+from pyboj._store import (
+    ArrowSeriesStore,
+    MemorySeriesStore,
+    ParquetSeriesStore,
+    SeriesStore,
+    StoredState,
+)
 
 __all__ = [
     "AccountSide",
     "Adjustment",
+    "ArrowSeriesStore",
+    "AsyncBOJ",
     "AsyncClient",
     "BOJ",
     "BOJAPIError",
@@ -82,6 +104,8 @@ __all__ = [
     "DataResponse",
     "Database",
     "ExchangeRate",
+    "FileMetadataCache",
+    "FileResponseCache",
     "FinancialMarket",
     "FiscalItem",
     "FlowOfFunds",
@@ -89,6 +113,7 @@ __all__ = [
     "FofSector",
     "Format",
     "Frequency",
+    "GlobalSearchIndex",
     "IndexType",
     "IndustrySector",
     "InstitutionType",
@@ -99,20 +124,34 @@ __all__ = [
     "LayerNode",
     "Loan",
     "MarketSegment",
+    "MemoryMetadataCache",
+    "MemoryResponseCache",
+    "MemorySeriesStore",
+    "MetadataCache",
     "MetadataRecord",
     "MetadataResponse",
     "MonetaryComponent",
     "MoneyDeposit",
     "OperationType",
+    "ParquetSeriesStore",
     "PriceIndex",
     "PublicFinance",
     "RateCategory",
+    "RateLimiter",
     "RateType",
+    "ResponseCache",
     "ResponseEnvelope",
+    "RetryBudget",
+    "RetryPolicy",
     "Series",
+    "SeriesArrays",
+    "SeriesCollection",
     "SeriesResult",
+    "SeriesStore",
     "SeriesValues",
     "StatCategory",
+    "StoredState",
+    "SyncReport",
     "Tankan",
     "TankanIndustry",
     "TankanItem",
@@ -121,6 +160,10 @@ __all__ = [
     "TankanTiming",
     "build_layer_tree",
     "csv_to_dataframe",
+    "iter_csv_batches",
+    "iter_csv_frames",
     "plot_series",
     "search_metadata",
+    "to_panel",
+    "write_csv",
 ]
@@ -0,0 +1,813 @@
+"""Asynchronous high-level BOJ client with typed domain methods."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from typing import TypeVar
+
+from boj_ts_api import (
+    AsyncClient,
+    Frequency,
+    Lang,
+    MetadataRecord,
+    MetadataResponse,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    SeriesResult,
+)
+from boj_ts_api._types.config import DEFAULT_TIMEOUT
+from boj_ts_api._types.exceptions import BOJError, BOJRequestError
+
+from pyboj._base_boj import _PREFETCH_WORKERS, Filters, _as_database, _BaseBOJ, _db_key
+from pyboj._cache import MetadataCache
+from pyboj._collection import SeriesCollection
+from pyboj._config import Database
+from pyboj._domains._base import Series
+from pyboj._domains.balance_of_payments import BalanceOfPayments, BopAccount
+from pyboj._domains.balance_sheet import AccountSide, BalanceSheet, InstitutionType
+from pyboj._domains.boj_operation import BOJOperation, OperationType
+from pyboj._domains.exchange_rate import Currency, ExchangeRate, RateType
+from pyboj._domains.financial_market import FinancialMarket, InstrumentType, MarketSegment
+from pyboj._domains.flow_of_funds import FlowOfFunds, FofInstrument, FofSector
+from pyboj._domains.interest_rate import Collateralization, InterestRate, RateCategory
+from pyboj._domains.international_stat import InternationalStat, StatCategory
+from pyboj._domains.loan import IndustrySector, Loan
+from pyboj._domains.money_deposit import Adjustment, MonetaryComponent, MoneyDeposit
+from pyboj._domains.price_index import IndexType, PriceIndex
+from pyboj._domains.public_finance import FiscalItem, PublicFinance
+from pyboj._domains.tankan import (
+    Tankan,
+    TankanIndustry,
+    TankanItem,
+    TankanSeriesType,
+    TankanSize,
+    TankanTiming,
+)
+from pyboj._helpers.layer_tree import LayerNode, build_layer_tree
+from pyboj._helpers.planner import RequestPlan, assemble_results, complete_codes
+from pyboj._helpers.search_index import GlobalSearchIndex
+from pyboj._helpers.sync import DEFAULT_SYNC_WINDOW, SyncReport, apply_sync, plan_sync
+from pyboj._store import SeriesStore
+
+_T = TypeVar("_T", bound=Series)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBOJ(_BaseBOJ):
+    """Asynchronous counterpart of :class:`~pyboj.BOJ`.
+
+    Exposes the same domain methods as coroutines, so many queries can run
+    concurrently on one event loop.
+
+    Usage::
+
+        import asyncio
+        from pyboj import AsyncBOJ, Currency, Frequency
+
+        async def main():
+            async with AsyncBOJ() as boj:
+                rates, funds = await asyncio.gather(
+                    boj.exchange_rates(currency=Currency.USD_JPY, frequency=Frequency.D),
+                    boj.flow_of_funds(),
+                )
+
+        asyncio.run(main())
+
+    ``max_concurrency`` caps how many code batches of a single call are in
+    flight at once; a shared ``rate_limiter`` paces requests across calls.
+    """
+
+    def __init__(
+        self,
+        lang: Lang = Lang.JP,
+        timeout: float = DEFAULT_TIMEOUT,
+        *,
+        max_concurrency: int = 1,
+        metadata_cache: MetadataCache | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        search_index: GlobalSearchIndex | None = None,
+        store: SeriesStore | None = None,
+    ) -> None:
+        super().__init__(
+            lang,
+            max_concurrency=max_concurrency,
+            metadata_cache=metadata_cache,
+            search_index=search_index,
+            store=store,
+        )
+        self._client = AsyncClient(
+            lang=lang,
+            timeout=timeout,
+            cache=response_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+        )
+        self._metadata_locks: dict[str, asyncio.Lock] = {}
+        # Store I/O runs in worker threads; one call per database at a time,
+        # so overlapping domain calls do not rewrite the same files at once.
+        self._store_locks: dict[str, asyncio.Lock] = {}
+
+    async def __aenter__(self) -> AsyncBOJ:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.close()
+
+    # ── Metadata ─────────────────────────────────────────────────────
+
+    async def _get_metadata(self, db: str | Database) -> MetadataResponse:
+        """Fetch metadata, using the configured metadata cache.
+
+        Concurrent callers for the same database share a single request.
+        Every lookup is passed to the global search index, which re-indexes
+        only when the metadata object has changed.  Cache and index calls
+        may touch the disk, so they run in a worker thread.
+        """
+        key = _db_key(db)
+        meta = await asyncio.to_thread(self._metadata_cache.get, key, self._lang)
+        if meta is None:
+            lock = self._metadata_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                meta = await asyncio.to_thread(self._metadata_cache.get, key, self._lang)
+                if meta is None:
+                    meta = await self._client.get_metadata(db=key)
+                    await asyncio.to_thread(self._metadata_cache.set, key, self._lang, meta)
+        await asyncio.to_thread(self._search_index.add, key, meta.RESULTSET, source=meta)
+        return meta
+
+    async def metadata(self, db: Database) -> list[MetadataRecord]:
+        """Return metadata records for a database.
+
+        Parameters
+        ----------
+        db:
+            Database to query.
+        """
+        return (await self._get_metadata(db)).RESULTSET
+
+    async def prefetch_metadata(
+        self,
+        dbs: Iterable[Database | str] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Database | str, float]:
+        """Load the metadata of many databases concurrently.
+
+        Warms the metadata cache (and the :meth:`search_all` index) so later
+        domain calls skip the metadata round trip.  Databases already
+        cached cost nothing.  A database whose metadata cannot be fetched
+        is logged and left out of the result.
+
+        Parameters
+        ----------
+        dbs:
+            Databases to load. ``None`` loads every :class:`~pyboj.Database`.
+        max_workers:
+            Metadata requests in flight at once. Default: the larger of
+            ``max_concurrency`` and 8.
+
+        Returns
+        -------
+        dict[Database | str, float]
+            Seconds spent loading each database, in the order given.
+        """
+        keys = list(dict.fromkeys(_db_key(db) for db in (Database if dbs is None else dbs)))
+        semaphore = asyncio.Semaphore(max_workers or max(self._max_concurrency, _PREFETCH_WORKERS))
+
+        async def load(key: str) -> float | None:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await self._get_metadata(key)
+                except BOJError as exc:
+                    logger.warning("Could not prefetch metadata (db=%s): %s", key, exc)
+                    return None
+                return time.perf_counter() - started
+
+        timings = await asyncio.gather(*(load(key) for key in keys))
+        return {
+            _as_database(key): elapsed
+            for key, elapsed in zip(keys, timings, strict=True)
+            if elapsed is not None
+        }
+
+    # ── Core fetch logic ─────────────────────────────────────────────
+
+    async def _filter_and_fetch(
+        self,
+        db: str | Database,
+        filters: Filters,
+        wrapper: type[_T],
+        *,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> SeriesCollection[_T]:
+        """Fetch series matching domain filters.
+
+        Same steps as :meth:`BOJ._filter_and_fetch`, with requests fanned out
+        via :func:`asyncio.gather` (at most ``max_concurrency`` in flight).
+        """
+        meta = await self._get_metadata(db)
+        codes = self._select_codes(_db_key(db), meta, filters, frequency)
+        if not codes:
+            return SeriesCollection(wrapper=wrapper)
+
+        db_str = _db_key(db)
+        store_lock = self._store_locks.setdefault(db_str, asyncio.Lock())
+        async with store_lock:
+            stored, missing = await asyncio.to_thread(
+                self._read_store, db_str, meta, codes, start_date, end_date
+            )
+        plans = self._plan_requests(db_str, meta, missing, start_date, end_date)
+        pages = await self._fetch_plans(db_str, plans)
+        results = assemble_results(missing, plans, pages)
+        await asyncio.to_thread(self._invalidate_if_stale, db_str, meta, results)
+        complete = complete_codes(plans, pages)
+        async with store_lock:
+            await asyncio.to_thread(
+                self._write_store, db_str, meta, results, start_date, end_date, complete
+            )
+        return SeriesCollection(self._merge_stored(codes, stored, results), wrapper)
+
+    async def _fetch_plans(self, db: str, plans: list[RequestPlan]) -> list[list[SeriesResult]]:
+        """Fetch every planned request, at most ``max_concurrency`` at a time."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(plan: RequestPlan) -> list[SeriesResult]:
+            async with semaphore:
+                return await self._fetch_batch(
+                    db, list(plan.codes), start_date=plan.start_date, end_date=plan.end_date
+                )
+
+        return list(await asyncio.gather(*(fetch(plan) for plan in plans)))
+
+    async def _fetch_batch(
+        self,
+        db: str,
+        batch: list[str],
+        *,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> list[SeriesResult]:
+        """Fetch one batch of codes, keeping whatever arrived before a transport error."""
+        results: list[SeriesResult] = []
+        try:
+            async for sr in self._client.iter_data_code(
+                db=db, code=",".join(batch), start_date=start_date, end_date=end_date
+            ):
+                results.append(sr)
+        except BOJRequestError as exc:
+            logger.warning(
+                "Dropping batch after %d retries (db=%s, %d codes, %d series received): %s",
+                exc.retries, db, len(batch), len(results), exc,
+            )
+        return results
+
+    # ── Incremental sync ─────────────────────────────────────────────
+
+    async def sync(
+        self,
+        db: Database | str,
+        store: SeriesStore | None = None,
+        *,
+        window: int = DEFAULT_SYNC_WINDOW,
+    ) -> SyncReport:
+        """Bring a local copy of a database up to date with minimal downloads.
+
+        Fresh metadata is fetched (bypassing the metadata cache) and each
+        series' ``LAST_UPDATE`` is compared with the copy in *store*.
+        Series missing from the store are fetched in full; series that
+        changed upstream are re-fetched only from *window* periods before
+        their last stored observation, and the new observations replace
+        the stored ones from there on.  Unchanged series are not requested.
+
+        Parameters
+        ----------
+        db:
+            Database to sync.
+        store:
+            Local series store, e.g. :class:`~pyboj.ParquetSeriesStore`.
+            Defaults to the client's ``store``.
+        window:
+            Periods (months for daily, weekly and monthly series; else
+            quarters, halves or years) re-fetched before the last stored
+            observation, to pick up revisions.
+
+        Returns
+        -------
+        SyncReport
+            Codes added, updated, skipped as unchanged, and failed.
+        """
+        if store is None:
+            if self._store is None:
+                raise ValueError("sync needs a store: pass one here or to the client")
+            store = self._store
+        key = _db_key(db)
+        await asyncio.to_thread(self._metadata_cache.invalidate, key, self._lang)
+        meta = await self._get_metadata(key)
+        store_lock = self._store_locks.setdefault(key, asyncio.Lock())
+        async with store_lock:
+            plan = await asyncio.to_thread(plan_sync, key, meta.RESULTSET, store, window)
+        pages = await self._fetch_plans(key, plan.plans)
+        async with store_lock:
+            return await asyncio.to_thread(apply_sync, key, plan, store, pages)
+
+    # ── Domain methods ───────────────────────────────────────────────
+
+    async def exchange_rates(
+        self,
+        *,
+        currency: Currency | None = None,
+        rate_type: RateType | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.EXCHANGE_RATES,
+    ) -> SeriesCollection[ExchangeRate]:
+        """Fetch exchange rate series.
+
+        Parameters
+        ----------
+        currency:
+            Filter by currency pair (e.g. ``Currency.USD_JPY``).
+        rate_type:
+            Filter by rate type (e.g. ``RateType.SPOT_9AM``).
+        frequency:
+            Filter by frequency (e.g. ``Frequency.D``).
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: FM08 (Exchange Rates).
+        """
+        return await self._filter_and_fetch(
+            db, {Currency: currency, RateType: rate_type}, ExchangeRate,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def interest_rates(
+        self,
+        *,
+        category: RateCategory | None = None,
+        collateralization: Collateralization | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.CALL_RATES,
+    ) -> SeriesCollection[InterestRate]:
+        """Fetch interest rate series.
+
+        Parameters
+        ----------
+        category:
+            Filter by rate category (e.g. ``RateCategory.CALL_RATE``).
+        collateralization:
+            Filter by collateralization type.
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: FM01 (Call Rates).
+        """
+        return await self._filter_and_fetch(
+            db, {RateCategory: category, Collateralization: collateralization}, InterestRate,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def price_indices(
+        self,
+        *,
+        index_type: IndexType | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.PRODUCER_PRICE_INDEX,
+    ) -> SeriesCollection[PriceIndex]:
+        """Fetch price index series.
+
+        Parameters
+        ----------
+        index_type:
+            Filter by index type (e.g. ``IndexType.PRODUCER``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: PR01 (Producer Price Index).
+        """
+        return await self._filter_and_fetch(
+            db, {IndexType: index_type}, PriceIndex,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def tankan(
+        self,
+        *,
+        industry: TankanIndustry | None = None,
+        size: TankanSize | None = None,
+        item: TankanItem | None = None,
+        series_type: TankanSeriesType | None = None,
+        timing: TankanTiming | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> SeriesCollection[Tankan]:
+        """Fetch TANKAN survey series.
+
+        Parameters
+        ----------
+        industry:
+            Filter by industry classification.
+        size:
+            Filter by enterprise size.
+        item:
+            Filter by survey item.
+        series_type:
+            Filter by series type (DI, percent point, etc.).
+        timing:
+            Filter by timing (actual vs forecast).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        """
+        return await self._filter_and_fetch(
+            Database.TANKAN,
+            {
+                TankanIndustry: industry,
+                TankanSize: size,
+                TankanItem: item,
+                TankanSeriesType: series_type,
+                TankanTiming: timing,
+            },
+            Tankan,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def balance_of_payments(
+        self,
+        *,
+        account: BopAccount | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> SeriesCollection[BalanceOfPayments]:
+        """Fetch balance of payments series.
+
+        Parameters
+        ----------
+        account:
+            Filter by BOP account type.
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        """
+        return await self._filter_and_fetch(
+            Database.BALANCE_OF_PAYMENTS, {BopAccount: account}, BalanceOfPayments,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def money_deposits(
+        self,
+        *,
+        component: MonetaryComponent | None = None,
+        adjustment: Adjustment | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.MONETARY_BASE,
+    ) -> SeriesCollection[MoneyDeposit]:
+        """Fetch money and deposit series.
+
+        Parameters
+        ----------
+        component:
+            Filter by monetary component.
+        adjustment:
+            Filter by adjustment type.
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: MD01 (Monetary Base).
+        """
+        return await self._filter_and_fetch(
+            db, {MonetaryComponent: component, Adjustment: adjustment}, MoneyDeposit,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def loans(
+        self,
+        *,
+        sector: IndustrySector | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.LOANS_BY_SECTOR,
+    ) -> SeriesCollection[Loan]:
+        """Fetch loan series.
+
+        Parameters
+        ----------
+        sector:
+            Filter by industry sector.
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: LA01 (Loans by Sector).
+        """
+        return await self._filter_and_fetch(
+            db, {IndustrySector: sector}, Loan,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    # ── Rich wrappers (formerly light wrappers) ──────────────────────
+
+    async def financial_markets(
+        self,
+        *,
+        segment: MarketSegment | None = None,
+        instrument_type: InstrumentType | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.SHORT_TERM_MONEY_OUTSTANDING,
+    ) -> SeriesCollection[FinancialMarket]:
+        """Fetch financial markets series (FM03-FM07).
+
+        Parameters
+        ----------
+        segment:
+            Filter by market segment (e.g. ``MarketSegment.GOVT_BONDS``).
+        instrument_type:
+            Filter by instrument type (e.g. ``InstrumentType.OUTSTANDING``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: FM03.
+        """
+        return await self._filter_and_fetch(
+            db, {MarketSegment: segment, InstrumentType: instrument_type}, FinancialMarket,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def balance_sheets(
+        self,
+        *,
+        account_side: AccountSide | None = None,
+        institution_type: InstitutionType | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.BOJ_ACCOUNTS,
+    ) -> SeriesCollection[BalanceSheet]:
+        """Fetch balance sheet series (BS01-BS02).
+
+        Parameters
+        ----------
+        account_side:
+            Filter by balance sheet side (e.g. ``AccountSide.ASSETS``).
+        institution_type:
+            Filter by institution type (e.g. ``InstitutionType.BOJ``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: BS01.
+        """
+        return await self._filter_and_fetch(
+            db, {AccountSide: account_side, InstitutionType: institution_type}, BalanceSheet,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def flow_of_funds(
+        self,
+        *,
+        sector: FofSector | None = None,
+        instrument: FofInstrument | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> SeriesCollection[FlowOfFunds]:
+        """Fetch flow of funds series (FF).
+
+        Parameters
+        ----------
+        sector:
+            Filter by economic sector (e.g. ``FofSector.HOUSEHOLDS``).
+        instrument:
+            Filter by financial instrument (e.g. ``FofInstrument.EQUITY``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        """
+        return await self._filter_and_fetch(
+            Database.FLOW_OF_FUNDS, {FofSector: sector, FofInstrument: instrument}, FlowOfFunds,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def boj_operations(
+        self,
+        *,
+        operation_type: OperationType | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.GOVT_TRANSACTIONS,
+    ) -> SeriesCollection[BOJOperation]:
+        """Fetch BOJ operations series (OB01-OB02).
+
+        Parameters
+        ----------
+        operation_type:
+            Filter by operation type (e.g. ``OperationType.JGB_OPERATIONS``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: OB01.
+        """
+        return await self._filter_and_fetch(
+            db, {OperationType: operation_type}, BOJOperation,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def public_finance(
+        self,
+        *,
+        fiscal_item: FiscalItem | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.TREASURY_RECEIPTS_PAYMENTS,
+    ) -> SeriesCollection[PublicFinance]:
+        """Fetch public finance series (PF01-PF02).
+
+        Parameters
+        ----------
+        fiscal_item:
+            Filter by fiscal item (e.g. ``FiscalItem.TAX_REVENUE``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: PF01.
+        """
+        return await self._filter_and_fetch(
+            db, {FiscalItem: fiscal_item}, PublicFinance,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    async def international(
+        self,
+        *,
+        stat_category: StatCategory | None = None,
+        frequency: Frequency | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        db: Database = Database.BIS_BANKING_STATISTICS,
+    ) -> SeriesCollection[InternationalStat]:
+        """Fetch international statistics series (BIS, DER, PS01, PS02, OT).
+
+        Parameters
+        ----------
+        stat_category:
+            Filter by statistics category (e.g. ``StatCategory.DERIVATIVES``).
+        frequency:
+            Filter by frequency.
+        start_date:
+            Start date in ``YYYYMM`` format.
+        end_date:
+            End date in ``YYYYMM`` format.
+        db:
+            Database to query. Default: BIS.
+        """
+        return await self._filter_and_fetch(
+            db, {StatCategory: stat_category}, InternationalStat,
+            frequency=frequency, start_date=start_date, end_date=end_date,
+        )
+
+    # ── Discovery ────────────────────────────────────────────────────
+
+    async def layer_tree(self, db: Database) -> LayerNode:
+        """Build a hierarchical layer tree from database metadata.
+
+        Parameters
+        ----------
+        db:
+            Database to build the tree for.
+
+        Returns
+        -------
+        LayerNode
+            Root node of the layer hierarchy.
+        """
+        records = await self.metadata(db)
+        return build_layer_tree(records)
+
+    async def search(self, db: Database, query: str) -> list[MetadataRecord]:
+        """Search metadata records by keyword.
+
+        Parameters
+        ----------
+        db:
+            Database to search.
+        query:
+            Case-insensitive search string. Each word must prefix a word
+            of the series code, name or category; Japanese text must occur
+            verbatim.
+
+        Returns
+        -------
+        list[MetadataRecord]
+            Matching metadata records, best match first. The search index
+            is built on the first search of each database and reused.
+        """
+        meta = await self._get_metadata(db)
+        return self._metadata_index(_db_key(db), meta).search_index.search(query)
+
+    async def search_all(
+        self,
+        query: str,
+        dbs: Iterable[Database] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[tuple[Database | str, MetadataRecord]]:
+        """Search the metadata of many databases at once.
+
+        Every database whose metadata this client has loaded is indexed as
+        it loads (and, with ``search_index=GlobalSearchIndex(directory)``,
+        kept on disk for later processes).
+
+        Parameters
+        ----------
+        query:
+            Search string; matched as in :meth:`search`.
+        dbs:
+            Databases to search. Any whose metadata is not indexed yet is
+            fetched first with :meth:`prefetch_metadata`. ``None`` searches
+            every database already indexed, without fetching anything.
+        limit:
+            Maximum number of hits.
+
+        Returns
+        -------
+        list[tuple[Database | str, MetadataRecord]]
+            ``(database, record)`` pairs, best match first.
+        """
+        keys = None
+        if dbs is not None:
+            keys = [_db_key(db) for db in dbs]
+            indexed = await asyncio.to_thread(lambda: set(self._search_index.dbs))
+            missing = [key for key in keys if key not in indexed]
+            if missing:
+                await self.prefetch_metadata(missing)
+        hits = await asyncio.to_thread(self._search_index.search, query, keys, limit=limit)
+        return [(_as_database(db), rec) for db, rec in hits]
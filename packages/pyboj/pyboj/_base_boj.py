@@ -0,0 +1,223 @@
+"""Shared logic for the sync and async high-level BOJ clients."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from enum import Enum
+
+from boj_ts_api import Frequency, Lang, MetadataResponse, SeriesResult
+
+from pyboj._cache import MemoryMetadataCache, MetadataCache
+from pyboj._config import Database
+from pyboj._domains._base import Series
+from pyboj._helpers.metadata_index import MetadataIndex
+from pyboj._helpers.planner import RequestPlan, clip_arrays, plan_requests
+from pyboj._helpers.search_index import GlobalSearchIndex
+from pyboj._store import SeriesStore
+from pyboj._utils import parse_last_update
+
+# Domain filters keyed by facet, e.g. ``{Currency: Currency.USD_JPY, RateType: None}``.
+# Values may be enum members, their string values, or ``None`` for "any".
+Filters = Mapping[type[Enum], Enum | str | None]
+
+# Default number of databases whose metadata is fetched at once by
+# ``prefetch_metadata``, independent of ``max_concurrency``.
+_PREFETCH_WORKERS = 8
+
+
+def _db_key(db: str | Database) -> str:
+    return db.value if isinstance(db, Database) else db
+
+
+def _as_database(key: str) -> Database | str:
+    try:
+        return Database(key)
+    except ValueError:
+        return key
+
+
+def _series_code(item: SeriesResult | Series) -> str:
+    return item.series_code if isinstance(item, Series) else item.SERIES_CODE
+
+
+class _BaseBOJ:
+    """Shared state and code selection for BOJ and AsyncBOJ."""
+
+    def __init__(
+        self,
+        lang: Lang,
+        *,
+        max_concurrency: int,
+        metadata_cache: MetadataCache | None,
+        search_index: GlobalSearchIndex | None,
+        store: SeriesStore | None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self._lang = lang
+        self._max_concurrency = max_concurrency
+        self._metadata_cache = (
+            metadata_cache if metadata_cache is not None else MemoryMetadataCache()
+        )
+        self._indexes: dict[str, MetadataIndex] = {}
+        self._search_index = search_index if search_index is not None else GlobalSearchIndex()
+        self._store = store
+        try:
+            from pyboj._plotting._plot import set_default_lang
+
+            set_default_lang(lang)
+        except Exception:  # plotting deps may not be installed
+            pass
+
+    # ── Code selection ───────────────────────────────────────────────
+
+    def _metadata_index(self, db: str, meta: MetadataResponse) -> MetadataIndex:
+        """Return the column index for *meta*, rebuilding it when metadata changes."""
+        index = self._indexes.get(db)
+        if index is None or index.meta is not meta:
+            index = MetadataIndex(meta)
+            self._indexes[db] = index
+        return index
+
+    def _select_codes(
+        self,
+        db: str,
+        meta: MetadataResponse,
+        filters: Filters,
+        frequency: Frequency | None,
+    ) -> list[str]:
+        """Return series codes matching *frequency* and every filter, in metadata order.
+
+        Each filter is a domain enum member (e.g. ``Currency.USD_JPY``), its
+        string value (``"USD/JPY"``) or ``None`` for "any". A string that is
+        not a value of its facet matches nothing. Header rows (empty
+        SERIES_CODE) are skipped.
+        """
+        members: list[Enum | None] = []
+        for facet, value in filters.items():
+            if value is None or isinstance(value, facet):
+                members.append(value)
+                continue
+            try:
+                members.append(facet(value))
+            except ValueError:
+                return []
+        return self._metadata_index(db, meta).select(members, frequency)
+
+    def _plan_requests(
+        self,
+        db: str,
+        meta: MetadataResponse,
+        codes: list[str],
+        start_date: str | None,
+        end_date: str | None,
+    ) -> list[RequestPlan]:
+        """Pack *codes* into single-page requests using their metadata."""
+        index = self._metadata_index(db, meta)
+        return plan_requests(
+            [index.record(code) for code in codes], start_date=start_date, end_date=end_date
+        )
+
+    def _invalidate_if_stale(
+        self, db: str, meta: MetadataResponse, results: Iterable[SeriesResult]
+    ) -> None:
+        """Drop cached metadata when fetched data is newer than it claims.
+
+        A series whose ``LAST_UPDATE`` is later than the one recorded in the
+        cached metadata means the catalogue has changed since it was cached,
+        so the next call re-downloads it.
+        """
+        known = {
+            rec.SERIES_CODE: parse_last_update(rec.LAST_UPDATE)
+            for rec in meta.RESULTSET
+            if rec.SERIES_CODE
+        }
+        for sr in results:
+            fetched = parse_last_update(sr.LAST_UPDATE)
+            cached = known.get(sr.SERIES_CODE)
+            if fetched is not None and cached is not None and fetched > cached:
+                self._metadata_cache.invalidate(db, self._lang)
+                return
+
+    # ── Local store ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _merge_stored(
+        codes: list[str], stored: dict[str, Series], results: list[SeriesResult]
+    ) -> list[SeriesResult | Series]:
+        """Stored and fetched series together, in *codes* order."""
+        if not stored:
+            return list(results)
+        order = {code: i for i, code in enumerate(codes)}
+        return sorted(
+            [*stored.values(), *results],
+            key=lambda item: order.get(_series_code(item), len(order)),
+        )
+
+    def _read_store(
+        self,
+        db: str,
+        meta: MetadataResponse,
+        codes: list[str],
+        start_date: str | None,
+        end_date: str | None,
+    ) -> tuple[dict[str, Series], list[str]]:
+        """Split *codes* into series served from the store and codes to fetch.
+
+        A stored series is used when its ``LAST_UPDATE`` is not older than
+        the one in *meta*; it is loaded through :meth:`SeriesStore.load`,
+        so columnar stores hand over their arrays, and clipped to the
+        requested date range.
+        """
+        if self._store is None:
+            return {}, codes
+        index = self._metadata_index(db, meta)
+        current: list[str] = []
+        missing: list[str] = []
+        for code in codes:
+            state = self._store.state(db, code)
+            known = parse_last_update(state.last_update) if state is not None else None
+            fresh = parse_last_update(index.record(code).LAST_UPDATE)
+            if known is not None and fresh is not None and known >= fresh:
+                current.append(code)
+            else:
+                missing.append(code)
+        hits: dict[str, Series] = {}
+        for series in self._store.load(db, current):
+            if start_date is not None or end_date is not None:
+                arrays = clip_arrays(series.arrays, series.frequency, start_date, end_date)
+                series = Series.from_arrays(series._result, arrays)
+            hits[series.series_code] = series
+        return hits, missing
+
+    def _write_store(
+        self,
+        db: str,
+        meta: MetadataResponse,
+        results: list[SeriesResult],
+        start_date: str | None,
+        end_date: str | None,
+        complete: set[str],
+    ) -> None:
+        """Keep fetched full histories in the store.
+
+        Results of date-limited requests are not stored, nor are series
+        outside *complete* (see :func:`~pyboj._helpers.planner.complete_codes`),
+        since either would replace a full history with part of it.
+        ``LAST_UPDATE`` is taken from *meta* when the data response omits it.
+        """
+        if self._store is None or start_date is not None or end_date is not None:
+            return
+        results = [sr for sr in results if sr.SERIES_CODE in complete]
+        if not results:
+            return
+        last_update = {rec.SERIES_CODE: rec.LAST_UPDATE for rec in meta.RESULTSET}
+        self._store.put(
+            db,
+            [
+                sr
+                if sr.LAST_UPDATE is not None
+                else sr.model_copy(update={"LAST_UPDATE": last_update.get(sr.SERIES_CODE)})
+                for sr in results
+            ],
+        )
@@ -3,61 +3,42 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypeVar
 
-from boj_ts_api import Client, Frequency, Lang, MetadataRecord, MetadataResponse
+from boj_ts_api import (
+    Client,
+    Frequency,
+    Lang,
+    MetadataRecord,
+    MetadataResponse,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    SeriesResult,
+)
 from boj_ts_api._types.config import DEFAULT_TIMEOUT
-from boj_ts_api._types.exceptions import BOJRequestError
+from boj_ts_api._types.exceptions import BOJError, BOJRequestError
 
+from pyboj._base_boj import _PREFETCH_WORKERS, Filters, _as_database, _BaseBOJ, _db_key
+from pyboj._cache import MetadataCache
+from pyboj._collection import SeriesCollection
 from pyboj._config import Database
 from pyboj._domains._base import Series
 from pyboj._domains.balance_of_payments import BalanceOfPayments, BopAccount
-from pyboj._domains.balance_sheet import (
-    AccountSide,
-    BalanceSheet,
-    InstitutionType,
-    _detect_institution,
-    _detect_side,
-)
-from pyboj._domains.boj_operation import BOJOperation, OperationType, _detect_operation
-from pyboj._domains.exchange_rate import (
-    Currency,
-    ExchangeRate,
-    RateType,
-    _detect_currency,
-    _detect_rate_type,
-)
-from pyboj._domains.financial_market import (
-    FinancialMarket,
-    InstrumentType,
-    MarketSegment,
-    _detect_instrument,
-    _detect_segment,
-)
-from pyboj._domains.flow_of_funds import (
-    FlowOfFunds,
-    FofInstrument,
-    FofSector,
-    _detect_fof_instrument,
-    _detect_fof_sector,
-)
-from pyboj._domains.interest_rate import (
-    Collateralization,
-    InterestRate,
-    RateCategory,
-    _detect_collateralization,
-    _detect_rate_category,
-)
-from pyboj._domains.international_stat import (
-    InternationalStat,
-    StatCategory,
-    _detect_stat_category,
-)
+from pyboj._domains.balance_sheet import AccountSide, BalanceSheet, InstitutionType
+from pyboj._domains.boj_operation import BOJOperation, OperationType
+from pyboj._domains.exchange_rate import Currency, ExchangeRate, RateType
+from pyboj._domains.financial_market import FinancialMarket, InstrumentType, MarketSegment
+from pyboj._domains.flow_of_funds import FlowOfFunds, FofInstrument, FofSector
+from pyboj._domains.interest_rate import Collateralization, InterestRate, RateCategory
+from pyboj._domains.international_stat import InternationalStat, StatCategory
 from pyboj._domains.loan import IndustrySector, Loan
 from pyboj._domains.money_deposit import Adjustment, MonetaryComponent, MoneyDeposit
-from pyboj._domains.price_index import IndexType, PriceIndex, _detect_index_type
-from pyboj._domains.public_finance import FiscalItem, PublicFinance, _detect_fiscal_item
+from pyboj._domains.price_index import IndexType, PriceIndex
+from pyboj._domains.public_finance import FiscalItem, PublicFinance
 from pyboj._domains.tankan import (
     Tankan,
     TankanIndustry,
@@ -66,13 +47,18 @@ from pyboj._domains.tankan import (
     TankanSize,
     TankanTiming,
 )
-from pyboj._helpers.layer_tree import LayerNode, build_layer_tree, search_metadata
-from pyboj._utils import frequency_matches
+from pyboj._helpers.layer_tree import LayerNode, build_layer_tree
+from pyboj._helpers.planner import RequestPlan, assemble_results, complete_codes
+from pyboj._helpers.search_index import GlobalSearchIndex
+from pyboj._helpers.sync import DEFAULT_SYNC_WINDOW, SyncReport, apply_sync, plan_sync
+from pyboj._store import SeriesStore
 
 _T = TypeVar("_T", bound=Series)
 
+logger = logging.getLogger(__name__)
 
-class BOJ:
+
+class BOJ(_BaseBOJ):
     """High-level client for the Bank of Japan Time-Series Statistics API.
 
     Every parameter is typed — no magic strings. The client fetches metadata,
@@ -92,18 +78,69 @@ class BOJ:
 
         with BOJ() as boj:
             rates = boj.exchange_rates(currency=Currency.USD_JPY)
-    """
 
-    def __init__(self, lang: Lang = Lang.JP, timeout: float = DEFAULT_TIMEOUT) -> None:
-        self._client = Client(lang=lang, timeout=timeout)
-        self._lang = lang
-        self._metadata_cache: dict[str, MetadataResponse] = {}
-        try:
-            from pyboj._plotting._plot import set_default_lang
+    Large pulls are split into several requests.  Pass ``max_concurrency``
+    to send those requests in parallel::
+
+        boj = BOJ(max_concurrency=4)
+        funds = boj.flow_of_funds()  # batches fetched on 4 threads
+
+    Metadata is cached per database.  Pass a :class:`~pyboj.FileMetadataCache`
+    to keep it across processes::
+
+        boj = BOJ(metadata_cache=FileMetadataCache("~/.cache/pyboj", ttl=3600))
 
-            set_default_lang(lang)
-        except Exception:  # plotting deps may not be installed
-            pass
+    Pass a :class:`~pyboj.RateLimiter` to keep parallel fetches under a
+    request rate; with ``adaptive=True`` it backs off when the API slows
+    down or starts returning errors::
+
+        boj = BOJ(max_concurrency=8, rate_limiter=RateLimiter(rate=5, adaptive=True))
+
+    A batch that still fails after the retries of ``retry=RetryPolicy()``
+    is skipped with a warning log, so one bad request does not abort a
+    whole pull.
+
+    :meth:`search_all` searches every database loaded so far in one call;
+    pass a :class:`~pyboj.GlobalSearchIndex` with a directory to keep that
+    index across processes::
+
+        boj = BOJ(search_index=GlobalSearchIndex("~/.cache/pyboj/search/jp"))
+        hits = boj.search_all("call rate")  # [(Database.CALL_RATES, record), ...]
+
+    Pass a ``store`` to keep fetched series locally: domain methods then
+    serve series whose stored copy is current from it, and only request
+    the rest::
+
+        boj = BOJ(store=ParquetSeriesStore("~/.cache/pyboj/series"))
+    """
+
+    def __init__(
+        self,
+        lang: Lang = Lang.JP,
+        timeout: float = DEFAULT_TIMEOUT,
+        *,
+        max_concurrency: int = 1,
+        metadata_cache: MetadataCache | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        search_index: GlobalSearchIndex | None = None,
+        store: SeriesStore | None = None,
+    ) -> None:
+        super().__init__(
+            lang,
+            max_concurrency=max_concurrency,
+            metadata_cache=metadata_cache,
+            search_index=search_index,
+            store=store,
+        )
+        self._client = Client(
+            lang=lang,
+            timeout=timeout,
+            cache=response_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+        )
 
     def __enter__(self) -> BOJ:
         return self
@@ -118,11 +155,18 @@ class BOJ:
     # ── Metadata ─────────────────────────────────────────────────────
 
     def _get_metadata(self, db: str | Database) -> MetadataResponse:
-        """Fetch metadata, using a per-database cache."""
-        key = db.value if isinstance(db, Database) else db
-        if key not in self._metadata_cache:
-            self._metadata_cache[key] = self._client.get_metadata(db=key)
-        return self._metadata_cache[key]
+        """Fetch metadata, using the configured metadata cache.
+
+        Every lookup is passed to the global search index, which re-indexes
+        only when the metadata object has changed.
+        """
+        key = _db_key(db)
+        meta = self._metadata_cache.get(key, self._lang)
+        if meta is None:
+            meta = self._client.get_metadata(db=key)
+            self._metadata_cache.set(key, self._lang, meta)
+        self._search_index.add(key, meta.RESULTSET, source=meta)
+        return meta
 
     def metadata(self, db: Database) -> list[MetadataRecord]:
         """Return metadata records for a database.
@@ -134,69 +178,180 @@ class BOJ:
         """
         return self._get_metadata(db).RESULTSET
 
+    def prefetch_metadata(
+        self,
+        dbs: Iterable[Database | str] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Database | str, float]:
+        """Load the metadata of many databases concurrently.
+
+        Warms the metadata cache (and the :meth:`search_all` index) so later
+        domain calls skip the metadata round trip.  Databases already
+        cached cost nothing.  A database whose metadata cannot be fetched
+        is logged and left out of the result.
+
+        Parameters
+        ----------
+        dbs:
+            Databases to load. ``None`` loads every :class:`~pyboj.Database`.
+        max_workers:
+            Metadata requests in flight at once. Default: the larger of
+            ``max_concurrency`` and 8.
+
+        Returns
+        -------
+        dict[Database | str, float]
+            Seconds spent loading each database, in the order given.
+        """
+        keys = list(dict.fromkeys(_db_key(db) for db in (Database if dbs is None else dbs)))
+        workers = min(max_workers or max(self._max_concurrency, _PREFETCH_WORKERS), len(keys))
+
+        def load(key: str) -> float | None:
+            started = time.perf_counter()
+            try:
+                self._get_metadata(key)
+            except BOJError as exc:
+                logger.warning("Could not prefetch metadata (db=%s): %s", key, exc)
+                return None
+            return time.perf_counter() - started
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                timings = list(pool.map(load, keys))
+        else:
+            timings = [load(key) for key in keys]
+        return {
+            _as_database(key): elapsed
+            for key, elapsed in zip(keys, timings, strict=True)
+            if elapsed is not None
+        }
+
     # ── Core fetch logic ─────────────────────────────────────────────
 
     def _filter_and_fetch(
         self,
         db: str | Database,
-        predicate: Callable[[MetadataRecord], bool],
+        filters: Filters,
         wrapper: type[_T],
         *,
         frequency: Frequency | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> list[_T]:
-        """Fetch series matching a metadata predicate.
+    ) -> SeriesCollection[_T]:
+        """Fetch series matching domain filters.
 
         1. Get metadata for the database (cached).
         2. Skip header rows (empty SERIES_CODE).
         3. Filter by frequency if requested.
-        4. Apply the domain-specific predicate.
-        5. Batch matching codes (max 250 per request).
-        6. Fetch via iter_data_code and wrap results.
+        4. Keep records whose classified labels equal every filter.
+        5. With a ``store``, take series whose stored ``LAST_UPDATE`` is
+           current from it; only the rest are requested.
+        6. Plan requests: group codes by frequency and pack them so each
+           request stays under the series, data-point and URL limits
+           (see :func:`~pyboj._helpers.planner.plan_requests`).
+        7. Fetch requests via iter_data_code (in parallel when
+           ``max_concurrency > 1``), keep full-history results in the
+           store, and return them in metadata order as a
+           :class:`~pyboj.SeriesCollection` of *wrapper*.
         """
         meta = self._get_metadata(db)
-        codes: list[str] = []
-        for rec in meta.RESULTSET:
-            if not rec.SERIES_CODE:
-                continue
-            if frequency is not None and not frequency_matches(rec.FREQUENCY, frequency):
-                continue
-            if not predicate(rec):
-                continue
-            codes.append(rec.SERIES_CODE)
-
+        codes = self._select_codes(_db_key(db), meta, filters, frequency)
         if not codes:
-            return []
-
-        db_str = db.value if isinstance(db, Database) else db
-        results: list[_T] = []
-        # Batch codes so that the comma-separated string stays under the URL
-        # length limit of the BOJ API.  We cap the code parameter at 1000
-        # characters to leave room for the rest of the URL (path, other params).
-        max_code_len = 1000
-        batches: list[list[str]] = [[]]
-        cur_len = 0
-        for code in codes:
-            added_len = len(code) + (1 if batches[-1] else 0)  # comma separator
-            if batches[-1] and cur_len + added_len > max_code_len:
-                batches.append([])
-                cur_len = 0
-            batches[-1].append(code)
-            cur_len += added_len
-
-        logger = logging.getLogger(__name__)
-        for batch in batches:
-            code_str = ",".join(batch)
-            try:
-                for sr in self._client.iter_data_code(
-                    db=db_str, code=code_str, start_date=start_date, end_date=end_date
-                ):
-                    results.append(wrapper(sr))
-            except BOJRequestError as exc:
-                logger.debug("Batch request failed (db=%s, %d codes): %s", db_str, len(batch), exc)
+            return SeriesCollection(wrapper=wrapper)
+
+        db_str = _db_key(db)
+        stored, missing = self._read_store(db_str, meta, codes, start_date, end_date)
+        plans = self._plan_requests(db_str, meta, missing, start_date, end_date)
+        pages = self._fetch_plans(db_str, plans)
+        results = assemble_results(missing, plans, pages)
+        self._invalidate_if_stale(db_str, meta, results)
+        complete = complete_codes(plans, pages)
+        self._write_store(db_str, meta, results, start_date, end_date, complete)
+        return SeriesCollection(self._merge_stored(codes, stored, results), wrapper)
+
+    def _fetch_plans(self, db: str, plans: list[RequestPlan]) -> list[list[SeriesResult]]:
+        """Fetch every planned request, on up to ``max_concurrency`` threads."""
+
+        def fetch(plan: RequestPlan) -> list[SeriesResult]:
+            return self._fetch_batch(
+                db, list(plan.codes), start_date=plan.start_date, end_date=plan.end_date
+            )
+
+        if self._max_concurrency > 1 and len(plans) > 1:
+            workers = min(self._max_concurrency, len(plans))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(fetch, plans))
+        return [fetch(plan) for plan in plans]
+
+    def _fetch_batch(
+        self,
+        db: str,
+        batch: list[str],
+        *,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> list[SeriesResult]:
+        """Fetch one batch of codes, keeping whatever arrived before a transport error."""
+        results: list[SeriesResult] = []
+        try:
+            for sr in self._client.iter_data_code(
+                db=db, code=",".join(batch), start_date=start_date, end_date=end_date
+            ):
+                results.append(sr)
+        except BOJRequestError as exc:
+            logger.warning(
+                "Dropping batch after %d retries (db=%s, %d codes, %d series received): %s",
+                exc.retries, db, len(batch), len(results), exc,
+            )
         return results
 
+    # ── Incremental sync ─────────────────────────────────────────────
+
+    def sync(
+        self,
+        db: Database | str,
+        store: SeriesStore | None = None,
+        *,
+        window: int = DEFAULT_SYNC_WINDOW,
+    ) -> SyncReport:
+        """Bring a local copy of a database up to date with minimal downloads.
+
+        Fresh metadata is fetched (bypassing the metadata cache) and each
+        series' ``LAST_UPDATE`` is compared with the copy in *store*.
+        Series missing from the store are fetched in full; series that
+        changed upstream are re-fetched only from *window* periods before
+        their last stored observation, and the new observations replace
+        the stored ones from there on.  Unchanged series are not requested.
+
+        Parameters
+        ----------
+        db:
+            Database to sync.
+        store:
+            Local series store, e.g. :class:`~pyboj.ParquetSeriesStore`.
+            Defaults to the client's ``store``.
+        window:
+            Periods (months for daily, weekly and monthly series; else
+            quarters, halves or years) re-fetched before the last stored
+            observation, to pick up revisions.
+
+        Returns
+        -------
+        SyncReport
+            Codes added, updated, skipped as unchanged, and failed.
+        """
+        if store is None:
+            if self._store is None:
+                raise ValueError("sync needs a store: pass one here or to the client")
+            store = self._store
+        key = _db_key(db)
+        self._metadata_cache.invalidate(key, self._lang)
+        meta = self._get_metadata(key)
+        plan = plan_sync(key, meta.RESULTSET, store, window)
+        pages = self._fetch_plans(key, plan.plans)
+        return apply_sync(key, plan, store, pages)
+
     # ── Domain methods ───────────────────────────────────────────────
 
     def exchange_rates(
@@ -208,7 +363,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.EXCHANGE_RATES,
-    ) -> list[ExchangeRate]:
+    ) -> SeriesCollection[ExchangeRate]:
         """Fetch exchange rate series.
 
         Parameters
@@ -226,15 +381,8 @@ class BOJ:
         db:
             Database to query. Default: FM08 (Exchange Rates).
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            name = rec.NAME_OF_TIME_SERIES or ""
-            if currency is not None and _detect_currency(name) != currency:
-                return False
-            return rate_type is None or _detect_rate_type(name) == rate_type
-
         return self._filter_and_fetch(
-            db, predicate, ExchangeRate,
+            db, {Currency: currency, RateType: rate_type}, ExchangeRate,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -247,7 +395,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.CALL_RATES,
-    ) -> list[InterestRate]:
+    ) -> SeriesCollection[InterestRate]:
         """Fetch interest rate series.
 
         Parameters
@@ -265,18 +413,8 @@ class BOJ:
         db:
             Database to query. Default: FM01 (Call Rates).
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            name = rec.NAME_OF_TIME_SERIES or ""
-            if category is not None and _detect_rate_category(name) != category:
-                return False
-            return (
-                collateralization is None
-                or _detect_collateralization(name) == collateralization
-            )
-
         return self._filter_and_fetch(
-            db, predicate, InterestRate,
+            db, {RateCategory: category, Collateralization: collateralization}, InterestRate,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -288,7 +426,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.PRODUCER_PRICE_INDEX,
-    ) -> list[PriceIndex]:
+    ) -> SeriesCollection[PriceIndex]:
         """Fetch price index series.
 
         Parameters
@@ -304,17 +442,8 @@ class BOJ:
         db:
             Database to query. Default: PR01 (Producer Price Index).
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            if index_type is not None:
-                name = rec.NAME_OF_TIME_SERIES or ""
-                cat = rec.CATEGORY or ""
-                if _detect_index_type(name, cat) != index_type:
-                    return False
-            return True
-
         return self._filter_and_fetch(
-            db, predicate, PriceIndex,
+            db, {IndexType: index_type}, PriceIndex,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -329,7 +458,7 @@ class BOJ:
         frequency: Frequency | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> list[Tankan]:
+    ) -> SeriesCollection[Tankan]:
         """Fetch TANKAN survey series.
 
         Parameters
@@ -351,16 +480,16 @@ class BOJ:
         end_date:
             End date in ``YYYYMM`` format.
         """
-        from pyboj._domains.tankan import _matches_tankan_filters
-
-        def predicate(rec: MetadataRecord) -> bool:
-            return _matches_tankan_filters(
-                rec, industry=industry, size=size, item=item,
-                series_type=series_type, timing=timing,
-            )
-
         return self._filter_and_fetch(
-            Database.TANKAN, predicate, Tankan,
+            Database.TANKAN,
+            {
+                TankanIndustry: industry,
+                TankanSize: size,
+                TankanItem: item,
+                TankanSeriesType: series_type,
+                TankanTiming: timing,
+            },
+            Tankan,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -371,7 +500,7 @@ class BOJ:
         frequency: Frequency | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> list[BalanceOfPayments]:
+    ) -> SeriesCollection[BalanceOfPayments]:
         """Fetch balance of payments series.
 
         Parameters
@@ -385,17 +514,8 @@ class BOJ:
         end_date:
             End date in ``YYYYMM`` format.
         """
-        from pyboj._domains.balance_of_payments import _detect_bop_account
-
-        def predicate(rec: MetadataRecord) -> bool:
-            if account is not None:
-                name = rec.NAME_OF_TIME_SERIES or ""
-                if _detect_bop_account(name) != account:
-                    return False
-            return True
-
         return self._filter_and_fetch(
-            Database.BALANCE_OF_PAYMENTS, predicate, BalanceOfPayments,
+            Database.BALANCE_OF_PAYMENTS, {BopAccount: account}, BalanceOfPayments,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -408,7 +528,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.MONETARY_BASE,
-    ) -> list[MoneyDeposit]:
+    ) -> SeriesCollection[MoneyDeposit]:
         """Fetch money and deposit series.
 
         Parameters
@@ -426,16 +546,8 @@ class BOJ:
         db:
             Database to query. Default: MD01 (Monetary Base).
         """
-        from pyboj._domains.money_deposit import _detect_adjustment, _detect_component
-
-        def predicate(rec: MetadataRecord) -> bool:
-            name = rec.NAME_OF_TIME_SERIES or ""
-            if component is not None and _detect_component(name) != component:
-                return False
-            return adjustment is None or _detect_adjustment(name) == adjustment
-
         return self._filter_and_fetch(
-            db, predicate, MoneyDeposit,
+            db, {MonetaryComponent: component, Adjustment: adjustment}, MoneyDeposit,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -447,7 +559,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.LOANS_BY_SECTOR,
-    ) -> list[Loan]:
+    ) -> SeriesCollection[Loan]:
         """Fetch loan series.
 
         Parameters
@@ -463,17 +575,8 @@ class BOJ:
         db:
             Database to query. Default: LA01 (Loans by Sector).
         """
-        from pyboj._domains.loan import _detect_sector
-
-        def predicate(rec: MetadataRecord) -> bool:
-            if sector is not None:
-                name = rec.NAME_OF_TIME_SERIES or ""
-                if _detect_sector(name) != sector:
-                    return False
-            return True
-
         return self._filter_and_fetch(
-            db, predicate, Loan,
+            db, {IndustrySector: sector}, Loan,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -488,7 +591,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.SHORT_TERM_MONEY_OUTSTANDING,
-    ) -> list[FinancialMarket]:
+    ) -> SeriesCollection[FinancialMarket]:
         """Fetch financial markets series (FM03-FM07).
 
         Parameters
@@ -506,15 +609,8 @@ class BOJ:
         db:
             Database to query. Default: FM03.
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            name = rec.NAME_OF_TIME_SERIES or ""
-            if segment is not None and _detect_segment(name) != segment:
-                return False
-            return instrument_type is None or _detect_instrument(name) == instrument_type
-
         return self._filter_and_fetch(
-            db, predicate, FinancialMarket,
+            db, {MarketSegment: segment, InstrumentType: instrument_type}, FinancialMarket,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -527,7 +623,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.BOJ_ACCOUNTS,
-    ) -> list[BalanceSheet]:
+    ) -> SeriesCollection[BalanceSheet]:
         """Fetch balance sheet series (BS01-BS02).
 
         Parameters
@@ -545,15 +641,8 @@ class BOJ:
         db:
             Database to query. Default: BS01.
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            name = rec.NAME_OF_TIME_SERIES or ""
-            if account_side is not None and _detect_side(name) != account_side:
-                return False
-            return institution_type is None or _detect_institution(name) == institution_type
-
         return self._filter_and_fetch(
-            db, predicate, BalanceSheet,
+            db, {AccountSide: account_side, InstitutionType: institution_type}, BalanceSheet,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -565,7 +654,7 @@ class BOJ:
         frequency: Frequency | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> list[FlowOfFunds]:
+    ) -> SeriesCollection[FlowOfFunds]:
         """Fetch flow of funds series (FF).
 
         Parameters
@@ -581,15 +670,8 @@ class BOJ:
         end_date:
             End date in ``YYYYMM`` format.
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            name = rec.NAME_OF_TIME_SERIES or ""
-            if sector is not None and _detect_fof_sector(name) != sector:
-                return False
-            return instrument is None or _detect_fof_instrument(name) == instrument
-
         return self._filter_and_fetch(
-            Database.FLOW_OF_FUNDS, predicate, FlowOfFunds,
+            Database.FLOW_OF_FUNDS, {FofSector: sector, FofInstrument: instrument}, FlowOfFunds,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -601,7 +683,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.GOVT_TRANSACTIONS,
-    ) -> list[BOJOperation]:
+    ) -> SeriesCollection[BOJOperation]:
         """Fetch BOJ operations series (OB01-OB02).
 
         Parameters
@@ -617,16 +699,8 @@ class BOJ:
         db:
             Database to query. Default: OB01.
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            if operation_type is not None:
-                name = rec.NAME_OF_TIME_SERIES or ""
-                if _detect_operation(name) != operation_type:
-                    return False
-            return True
-
         return self._filter_and_fetch(
-            db, predicate, BOJOperation,
+            db, {OperationType: operation_type}, BOJOperation,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -638,7 +712,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.TREASURY_RECEIPTS_PAYMENTS,
-    ) -> list[PublicFinance]:
+    ) -> SeriesCollection[PublicFinance]:
         """Fetch public finance series (PF01-PF02).
 
         Parameters
@@ -654,16 +728,8 @@ class BOJ:
         db:
             Database to query. Default: PF01.
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            if fiscal_item is not None:
-                name = rec.NAME_OF_TIME_SERIES or ""
-                if _detect_fiscal_item(name) != fiscal_item:
-                    return False
-            return True
-
         return self._filter_and_fetch(
-            db, predicate, PublicFinance,
+            db, {FiscalItem: fiscal_item}, PublicFinance,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -675,7 +741,7 @@ class BOJ:
         start_date: str | None = None,
         end_date: str | None = None,
         db: Database = Database.BIS_BANKING_STATISTICS,
-    ) -> list[InternationalStat]:
+    ) -> SeriesCollection[InternationalStat]:
         """Fetch international statistics series (BIS, DER, PS01, PS02, OT).
 
         Parameters
@@ -691,16 +757,8 @@ class BOJ:
         db:
             Database to query. Default: BIS.
         """
-
-        def predicate(rec: MetadataRecord) -> bool:
-            if stat_category is not None:
-                name = rec.NAME_OF_TIME_SERIES or ""
-                if _detect_stat_category(name) != stat_category:
-                    return False
-            return True
-
         return self._filter_and_fetch(
-            db, predicate, InternationalStat,
+            db, {StatCategory: stat_category}, InternationalStat,
             frequency=frequency, start_date=start_date, end_date=end_date,
         )
 
@@ -730,12 +788,53 @@ class BOJ:
         db:
             Database to search.
         query:
-            Case-insensitive search string.
+            Case-insensitive search string. Each word must prefix a word
+            of the series code, name or category; Japanese text must occur
+            verbatim.
 
         Returns
         -------
         list[MetadataRecord]
-            Matching metadata records.
+            Matching metadata records, best match first. The search index
+            is built on the first search of each database and reused.
         """
-        records = self.metadata(db)
-        return search_metadata(records, query)
+        meta = self._get_metadata(db)
+        return self._metadata_index(_db_key(db), meta).search_index.search(query)
+
+    def search_all(
+        self,
+        query: str,
+        dbs: Iterable[Database] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[tuple[Database | str, MetadataRecord]]:
+        """Search the metadata of many databases at once.
+
+        Every database whose metadata this client has loaded is indexed as
+        it loads (and, with ``search_index=GlobalSearchIndex(directory)``,
+        kept on disk for later processes).
+
+        Parameters
+        ----------
+        query:
+            Search string; matched as in :meth:`search`.
+        dbs:
+            Databases to search. Any whose metadata is not indexed yet is
+            fetched first with :meth:`prefetch_metadata`. ``None`` searches
+            every database already indexed, without fetching anything.
+        limit:
+            Maximum number of hits.
+
+        Returns
+        -------
+        list[tuple[Database | str, MetadataRecord]]
+            ``(database, record)`` pairs, best match first.
+        """
+        keys = None
+        if dbs is not None:
+            keys = [_db_key(db) for db in dbs]
+            missing = [key for key in keys if key not in self._search_index]
+            if missing:
+                self.prefetch_metadata(missing)
+        hits = self._search_index.search(query, keys, limit=limit)
+        return [(_as_database(db), rec) for db, rec in hits]
@@ -0,0 +1,181 @@
+"""Pluggable metadata caches for the high-level BOJ clients."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+
+from boj_ts_api import Lang, MetadataResponse
+
+
+class MetadataCache(ABC):
+    """Interface for storing :class:`~boj_ts_api.MetadataResponse` objects.
+
+    Entries are keyed by database code and response language.  Implement
+    this to plug a custom backend into :class:`~pyboj.BOJ`.  Methods may
+    be called from several threads at once (:meth:`BOJ.prefetch_metadata`,
+    and :class:`~pyboj.AsyncBOJ`, which runs them off the event loop).
+    """
+
+    @abstractmethod
+    def get(self, db: str, lang: Lang) -> MetadataResponse | None:
+        """Return the cached response, or ``None`` if missing or expired."""
+
+    @abstractmethod
+    def set(self, db: str, lang: Lang, response: MetadataResponse) -> None:
+        """Store *response* for *db* and *lang*."""
+
+    @abstractmethod
+    def invalidate(self, db: str, lang: Lang) -> None:
+        """Drop the entry for *db* and *lang*, if any."""
+
+
+class MemoryMetadataCache(MetadataCache):
+    """In-process cache (the default).
+
+    Parameters
+    ----------
+    ttl:
+        Seconds after which an entry expires. ``None`` keeps entries forever.
+    max_entries:
+        Maximum number of entries; the least recently used one is evicted
+        first. ``None`` means unbounded.
+    """
+
+    def __init__(self, *, ttl: float | None = None, max_entries: int | None = None) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, MetadataResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, db: str, lang: Lang) -> MetadataResponse | None:
+        key = (db, lang.value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if self._ttl is not None and time.time() - stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, db: str, lang: Lang, response: MetadataResponse) -> None:
+        key = (db, lang.value)
+        with self._lock:
+            self._entries[key] = (time.time(), response)
+            self._entries.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, db: str, lang: Lang) -> None:
+        with self._lock:
+            self._entries.pop((db, lang.value), None)
+
+
+class FileMetadataCache(MetadataCache):
+    """Persistent cache storing one JSON file per database and language.
+
+    Files live at ``<directory>/<lang>/<db>.json``.  The modification time
+    records when an entry was written (for *ttl*); the access time records
+    when it was last read (for least-recently-used eviction).  Parsed
+    responses are also kept in memory until the file changes, so repeated
+    lookups within one process do not re-read the file.
+
+    Parameters
+    ----------
+    directory:
+        Cache directory. Created on first write.
+    ttl:
+        Seconds after which an entry expires. ``None`` keeps entries until
+        they are invalidated or evicted. Default: one day.
+    max_entries:
+        Maximum number of cached files; the least recently used ones are
+        removed first. ``None`` means unbounded.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        ttl: float | None = 86_400.0,
+        max_entries: int | None = None,
+    ) -> None:
+        self._dir = Path(directory).expanduser()
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._loaded: dict[Path, tuple[int, MetadataResponse]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, db: str, lang: Lang) -> Path:
+        return self._dir / lang.value / f"{db}.json"
+
+    def get(self, db: str, lang: Lang) -> MetadataResponse | None:
+        with self._lock:
+            return self._get(self._path(db, lang))
+
+    def _get(self, path: Path) -> MetadataResponse | None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._loaded.pop(path, None)
+            return None
+        now = time.time()
+        if self._ttl is not None and now - stat.st_mtime > self._ttl:
+            self._remove(path)
+            return None
+
+        loaded = self._loaded.get(path)
+        if loaded is not None and loaded[0] == stat.st_mtime_ns:
+            response = loaded[1]
+        else:
+            try:
+                response = MetadataResponse.model_validate_json(path.read_bytes())
+            except (OSError, ValueError):
+                self._remove(path)  # unreadable or corrupt entry
+                return None
+            self._loaded[path] = (stat.st_mtime_ns, response)
+        with contextlib.suppress(FileNotFoundError):  # removed by another process
+            os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+        return response
+
+    def set(self, db: str, lang: Lang, response: MetadataResponse) -> None:
+        path = self._path(db, lang)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(response.model_dump_json(), encoding="utf-8")
+            os.replace(tmp, path)
+            self._loaded[path] = (path.stat().st_mtime_ns, response)
+            self._evict()
+
+    def invalidate(self, db: str, lang: Lang) -> None:
+        with self._lock:
+            self._remove(self._path(db, lang))
+
+    def _remove(self, path: Path) -> None:
+        self._loaded.pop(path, None)
+        path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        if self._max_entries is None:
+            return
+        # Another process sharing the directory may delete files meanwhile.
+        accessed: list[tuple[int, Path]] = []
+        for path in self._dir.glob("*/*.json"):
+            try:
+                accessed.append((path.stat().st_atime_ns, path))
+            except FileNotFoundError:
+                self._loaded.pop(path, None)
+        accessed.sort()
+        for _, path in accessed[: max(0, len(accessed) - self._max_entries)]:
+            self._remove(path)
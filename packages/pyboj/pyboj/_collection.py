@@ -0,0 +1,243 @@
+"""Columnar container for the series returned by domain methods."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from enum import Enum
+from typing import Literal, TypeVar, overload
+
+import numpy as np
+import pandas as pd
+from boj_ts_api import Frequency, MetadataRecord, SeriesResult
+
+from pyboj._domains._base import Series
+from pyboj._helpers.metadata_index import CLASSIFIERS
+from pyboj._helpers.panel import panel_frame
+from pyboj._parsing.arrays import SeriesArrays, series_arrays
+from pyboj._utils import frequency_matches
+
+_T = TypeVar("_T", bound=Series)
+
+# Every SeriesResult field but the observations, kept as one list per field.
+_ATTRIBUTES = tuple(name for name in SeriesResult.model_fields if name != "VALUES")
+
+
+def _factorize(labels: Iterable[Hashable]) -> tuple[np.ndarray, list[Hashable]]:
+    """Integer code per label, plus the distinct labels in first-seen order."""
+    positions: dict[Hashable, int] = {}
+    codes = np.fromiter(
+        (positions.setdefault(label, len(positions)) for label in labels), dtype=np.intp
+    )
+    return codes, list(positions)
+
+
+_EMPTY = SeriesArrays(
+    dates=np.empty(0, dtype="datetime64[D]"),
+    values=np.empty(0),
+    mask=np.empty(0, dtype=bool),
+)
+
+
+class _Columns:
+    """Storage shared by a collection and every view derived from it."""
+
+    def __init__(self, results: Iterable[SeriesResult | Series]) -> None:
+        self.attributes: dict[str, list] = {name: [] for name in _ATTRIBUTES}
+        self.dates: list[np.ndarray] = []
+        # Series whose observations failed to parse, by position.  They hold
+        # no observations here; their wrappers are built from the raw result
+        # and raise the parse error when their data is read.
+        self.unparsed: dict[int, SeriesResult] = {}
+        chunks: list[np.ndarray] = []
+        for item in results:
+            sr = item._result if isinstance(item, Series) else item
+            try:
+                arrays = item.arrays if isinstance(item, Series) else series_arrays(sr.VALUES)
+            except ValueError:
+                self.unparsed[len(self.dates)] = sr
+                arrays = _EMPTY
+            for name in _ATTRIBUTES:
+                self.attributes[name].append(getattr(sr, name))
+            self.dates.append(arrays.dates)  # parsed calendars are shared
+            chunks.append(arrays.values)
+        self.values = np.concatenate(chunks) if chunks else np.empty(0)
+        self.values.flags.writeable = False
+        self.offsets = np.concatenate(([0], np.cumsum([len(c) for c in chunks], dtype=np.intp)))
+        self.items: dict[int, Series] = {}
+        self.facets: dict[type[Enum], tuple[np.ndarray, list[Hashable]]] = {}
+        self.frequencies: tuple[np.ndarray, list[Hashable]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def observations(self, pos: int) -> np.ndarray:
+        return self.values[self.offsets[pos] : self.offsets[pos + 1]]
+
+    def facet(self, facet: type[Enum]) -> tuple[np.ndarray, list[Hashable]]:
+        """Factorized labels of *facet*, classified once from the series names."""
+        column = self.facets.get(facet)
+        if column is None:
+            classify = CLASSIFIERS[facet]
+            records = (
+                MetadataRecord.model_construct(NAME_OF_TIME_SERIES=name, CATEGORY=category)
+                for name, category in zip(
+                    self.attributes["NAME_OF_TIME_SERIES"],
+                    self.attributes["CATEGORY"],
+                    strict=True,
+                )
+            )
+            column = _factorize(classify(rec) for rec in records)
+            self.facets[facet] = column
+        return column
+
+
+class SeriesCollection(Sequence[_T]):
+    """Read-only sequence of domain wrappers, stored column by column.
+
+    Domain methods return one of these instead of a list.  Series
+    attributes are kept as one list per field and all observations in
+    one shared ``float64`` buffer, so a large pull holds no per-series
+    objects until an element is accessed; wrappers such as
+    :class:`~pyboj.ExchangeRate` are then created on first access (and
+    reused).  Indexing, iteration and ``len`` work as for a list, and a
+    collection compares equal to a list of the same wrappers.
+
+    Usage::
+
+        rates = boj.exchange_rates()
+        spot = rates.filter(Currency.USD_JPY, RateType.SPOT_9AM, frequency=Frequency.D)
+        df = spot.to_dataframe()  # one column per series code
+
+    Parameters
+    ----------
+    results:
+        Series to hold, in order: :class:`~boj_ts_api.SeriesResult` objects,
+        or wrappers whose :attr:`~pyboj.Series.arrays` are taken as they are
+        (as :meth:`~pyboj.ParquetSeriesStore.load` returns them).
+    wrapper:
+        Domain wrapper class created for each element.
+    """
+
+    def __init__(
+        self,
+        results: Iterable[SeriesResult | Series] = (),
+        wrapper: type[_T] = Series,  # type: ignore[assignment]
+    ) -> None:
+        self._wrapper = wrapper
+        self._columns = _Columns(results)
+        self._rows = np.arange(len(self._columns))
+
+    def _view(self, rows: np.ndarray) -> SeriesCollection[_T]:
+        view = object.__new__(type(self))
+        view._wrapper = self._wrapper
+        view._columns = self._columns
+        view._rows = rows
+        return view
+
+    def _item(self, pos: int) -> _T:
+        columns = self._columns
+        item = columns.items.get(pos)
+        if item is None and pos in columns.unparsed:
+            item = self._wrapper(columns.unparsed[pos])
+            columns.items[pos] = item
+        if item is None:
+            values = columns.observations(pos)
+            mask = np.isnan(values)
+            mask.flags.writeable = False
+            result = SeriesResult.model_construct(
+                **{name: columns.attributes[name][pos] for name in _ATTRIBUTES}
+            )
+            arrays = SeriesArrays(dates=columns.dates[pos], values=values, mask=mask)
+            item = self._wrapper.from_arrays(result, arrays)
+            columns.items[pos] = item
+        return item  # type: ignore[return-value]
+
+    # ── Sequence protocol ────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, key: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> SeriesCollection[_T]: ...
+
+    def __getitem__(self, key: int | slice) -> _T | SeriesCollection[_T]:
+        if isinstance(key, slice):
+            return self._view(self._rows[key])
+        return self._item(int(self._rows[key]))
+
+    def __iter__(self) -> Iterator[_T]:
+        for pos in self._rows.tolist():
+            yield self._item(pos)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SeriesCollection):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SeriesCollection({self._wrapper.__name__}, {len(self)} series)"
+
+    # ── Columns ──────────────────────────────────────────────────────
+
+    @property
+    def codes(self) -> list[str]:
+        """Series codes, in order."""
+        codes = self._columns.attributes["SERIES_CODE"]
+        return [codes[pos] for pos in self._rows.tolist()]
+
+    def filter(
+        self, *facets: Enum | None, frequency: Frequency | None = None
+    ) -> SeriesCollection[_T]:
+        """Return the series matching every facet label and *frequency*.
+
+        Facets are domain enum members (e.g. ``Currency.USD_JPY``,
+        ``TankanSize.LARGE``), detected from the series names as the
+        wrappers' own properties do; ``None`` matches anything.  Each facet
+        is classified once per collection and matched as integer codes, so
+        repeated filtering does not create wrappers or re-run detectors.
+        """
+        keep = np.ones(len(self._rows), dtype=bool)
+        for label in facets:
+            if label is None:
+                continue
+            codes, labels = self._columns.facet(type(label))
+            wanted = labels.index(label) if label in labels else -1
+            keep &= codes[self._rows] == wanted
+        if frequency is not None:
+            columns = self._columns
+            if columns.frequencies is None:
+                columns.frequencies = _factorize(columns.attributes["FREQUENCY"])
+            codes, labels = columns.frequencies
+            matches = np.array(
+                [frequency_matches(freq, frequency) for freq in labels],  # type: ignore[arg-type]
+                dtype=bool,
+            )
+            keep &= matches[codes[self._rows]]
+        return self._view(self._rows[keep])
+
+    def to_dataframe(self, *, layout: Literal["wide", "long"] = "wide") -> pd.DataFrame:
+        """Combine every series into one DataFrame; see :func:`~pyboj.to_panel`.
+
+        Reads the shared buffers directly, without creating wrappers.
+        Raises ``ValueError`` if a selected series' observations cannot be
+        parsed.
+        """
+        rows = self._rows.tolist()
+        columns = self._columns
+        for pos in rows:
+            if pos in columns.unparsed:
+                series_arrays(columns.unparsed[pos].VALUES)  # raises its parse error
+        return panel_frame(
+            self.codes,
+            [columns.dates[pos] for pos in rows],
+            [columns.observations(pos) for pos in rows],
+            layout=layout,
+        )
+
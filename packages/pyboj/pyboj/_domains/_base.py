@@ -3,25 +3,42 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
-from pyboj._parsing.dates import parse_survey_dates
+from pyboj._parsing.arrays import SeriesArrays, series_arrays
 
 if TYPE_CHECKING:
     from boj_ts_api import SeriesResult
 
+_S = TypeVar("_S", bound="Series")
+
 
 class Series:
     """Base class for domain wrapper objects.
 
     Wraps a :class:`~boj_ts_api.SeriesResult` and provides parsed
     dates, cleaned numeric values, and optional DataFrame conversion.
+    Parsing happens once, on first access, and is cached on the instance.
     """
 
-    __slots__ = ("_result",)
+    __slots__ = ("_result", "_arrays", "_dates", "_values")
 
     def __init__(self, result: SeriesResult) -> None:
         self._result = result
+        self._arrays: SeriesArrays | None = None
+        self._dates: list[datetime.date] | None = None
+        self._values: list[float | None] | None = None
+
+    @classmethod
+    def from_arrays(cls: type[_S], result: SeriesResult, arrays: SeriesArrays) -> _S:
+        """Wrap observations that are already arrays.
+
+        *result* supplies the series attributes; its ``VALUES`` are not
+        read.  Used to wrap stored series without building Python lists.
+        """
+        series = cls(result)
+        series._arrays = arrays
+        return series
 
     # ── Pass-through properties ───────────────────────────────────────
 
@@ -61,6 +78,18 @@ class Series:
 
     # ── Parsed data ───────────────────────────────────────────────────
 
+    @property
+    def arrays(self) -> SeriesArrays:
+        """Observations as read-only NumPy arrays.
+
+        ``dates`` is ``datetime64[D]``, ``values`` is ``float64`` with ``NaN``
+        for missing or non-numeric entries, and ``mask`` flags those entries.
+        Entries where the raw date is ``None`` are excluded.
+        """
+        if self._arrays is None:
+            self._arrays = series_arrays(self._result.VALUES)
+        return self._arrays
+
     @property
     def dates(self) -> list[datetime.date]:
         """Survey dates parsed into :class:`datetime.date` objects.
@@ -68,7 +97,9 @@ class Series:
         Entries where the raw date is ``None`` are excluded, along with their
         corresponding values, to keep dates and values aligned.
         """
-        return [d for d, _ in self._aligned_pairs()]
+        if self._dates is None:
+            self._dates = self.arrays.dates.tolist()
+        return list(self._dates)
 
     @property
     def values(self) -> list[float | None]:
@@ -76,27 +107,29 @@ class Series:
 
         Entries where the corresponding date is ``None`` are excluded.
         """
-        return [v for _, v in self._aligned_pairs()]
+        if self._values is None:
+            arrays = self.arrays
+            self._values = [
+                None if missing else v
+                for v, missing in zip(arrays.values.tolist(), arrays.mask.tolist(), strict=True)
+            ]
+        return list(self._values)
 
     def _aligned_pairs(self) -> list[tuple[datetime.date, float | None]]:
         """Return aligned (date, value) pairs, skipping entries with None dates."""
-        raw_dates = parse_survey_dates(self._result.VALUES.SURVEY_DATES)
-        raw_values = self._result.VALUES.VALUES
-        pairs: list[tuple[datetime.date, float | None]] = []
-        for d, v in zip(raw_dates, raw_values, strict=False):
-            if d is None:
-                continue
-            if v is None or isinstance(v, str):
-                pairs.append((d, None))
-            else:
-                pairs.append((d, float(v)))
-        return pairs
+        return list(zip(self.dates, self.values, strict=True))
 
     # ── Output ────────────────────────────────────────────────────────
 
-    def to_dataframe(self):
+    def to_dataframe(self, *, copy: bool = True):
         """Return a :class:`pandas.DataFrame` with a ``DatetimeIndex``.
 
+        Parameters
+        ----------
+        copy:
+            Copy the value array. With ``False`` the frame is a read-only
+            view of :attr:`arrays` and cannot be modified in place.
+
         Returns
         -------
         pandas.DataFrame
@@ -104,9 +137,9 @@ class Series:
         """
         import pandas as pd
 
-        pairs = self._aligned_pairs()
-        index = pd.DatetimeIndex([d for d, _ in pairs], name="date")
-        return pd.DataFrame({"value": [v for _, v in pairs]}, index=index)
+        arrays = self.arrays
+        index = pd.DatetimeIndex(arrays.dates, name="date")
+        return pd.DataFrame({"value": arrays.values}, index=index, copy=copy)
 
     # ── Plotting ──────────────────────────────────────────────────────
 
@@ -147,5 +180,8 @@ class Series:
 
     def __repr__(self) -> str:
         cls = type(self).__name__
-        n = len(self._result.VALUES.SURVEY_DATES)
+        if self._arrays is not None:
+            n = len(self._arrays)
+        else:
+            n = len(self._result.VALUES.SURVEY_DATES)
         return f"{cls}(series_code={self.series_code!r}, name={self.name!r}, observations={n})"
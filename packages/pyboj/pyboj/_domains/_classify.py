@@ -0,0 +1,50 @@
+"""Precompiled first-match-wins pattern tables for the domain detectors."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+_L = TypeVar("_L")
+_D = TypeVar("_D")
+
+
+class PatternClassifier(Generic[_L, _D]):
+    """Classify text with an ordered ``(pattern, label)`` table in one regex call.
+
+    Equivalent to trying ``re.search(pattern, text)`` for each row in order
+    and returning the first row's label, or *default* if none match.  The
+    table is compiled once into a single anchored alternation in which every
+    branch is a lookahead for one pattern followed by an empty named group;
+    the regex engine tries branches in table order, so the first pattern
+    found anywhere in the text wins, exactly as with the sequential loop.
+
+    Parameters
+    ----------
+    patterns:
+        Ordered ``(regex, label)`` rows. Patterns must not contain
+        capturing groups.
+    default:
+        Returned when no pattern matches.
+    flags:
+        ``re`` flags applied to every pattern.
+    """
+
+    __slots__ = ("_labels", "_default", "_regex")
+
+    def __init__(
+        self, patterns: Sequence[tuple[str, _L]], default: _D, *, flags: int = 0
+    ) -> None:
+        self._labels = [label for _, label in patterns]
+        self._default = default
+        branches = "|".join(
+            f"(?=(?s:.*?)(?:{pattern}))(?P<_{i}>)" for i, (pattern, _) in enumerate(patterns)
+        )
+        self._regex = re.compile(f"(?:{branches})", flags)
+
+    def __call__(self, text: str) -> _L | _D:
+        m = self._regex.match(text)
+        if m is None or m.lastgroup is None:
+            return self._default
+        return self._labels[int(m.lastgroup[1:])]
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class BopAccount(str, Enum):
@@ -38,14 +38,12 @@ _BOP_PATTERNS: list[tuple[str, BopAccount]] = [
     (r"\b[Ss]ervices\b", BopAccount.SERVICES),
     (r"[Cc]urrent\s*[Aa]ccount", BopAccount.CURRENT),
 ]
+_BOP_CLASSIFIER = PatternClassifier(_BOP_PATTERNS, BopAccount.OTHER)
 
 
 def _detect_bop_account(name: str) -> BopAccount:
     """Detect the BOP account type from a BOJ series name."""
-    for pattern, acct in _BOP_PATTERNS:
-        if re.search(pattern, name):
-            return acct
-    return BopAccount.OTHER
+    return _BOP_CLASSIFIER(name)
 
 
 class BalanceOfPayments(Series):
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class AccountSide(str, Enum):
@@ -35,6 +35,7 @@ _SIDE_PATTERNS: list[tuple[str, AccountSide]] = [
     (r"[Aa]sset|[Ll]oan|[Ss]ecurities\s*[Hh]eld|[Cc]ash", AccountSide.ASSETS),
     (r"[Ll]iabilit|[Dd]eposit|[Bb]orrowing|[Bb]anknote", AccountSide.LIABILITIES),
 ]
+_SIDE_CLASSIFIER = PatternClassifier(_SIDE_PATTERNS, AccountSide.OTHER)
 
 _INSTITUTION_PATTERNS: list[tuple[str, InstitutionType]] = [
     (r"[Bb]ank\s*of\s*[Jj]apan|BOJ\b", InstitutionType.BOJ),
@@ -45,22 +46,17 @@ _INSTITUTION_PATTERNS: list[tuple[str, InstitutionType]] = [
     (r"[Cc]redit\s*[Cc]ooperative", InstitutionType.CREDIT_COOPERATIVES),
     (r"[Aa]ll\s*[Bb]ank", InstitutionType.ALL_BANKS),
 ]
+_INSTITUTION_CLASSIFIER = PatternClassifier(_INSTITUTION_PATTERNS, InstitutionType.OTHER)
 
 
 def _detect_side(name: str) -> AccountSide:
     """Detect the balance sheet side from a BOJ series name."""
-    for pattern, side in _SIDE_PATTERNS:
-        if re.search(pattern, name):
-            return side
-    return AccountSide.OTHER
+    return _SIDE_CLASSIFIER(name)
 
 
 def _detect_institution(name: str) -> InstitutionType:
     """Detect the institution type from a BOJ series name."""
-    for pattern, inst in _INSTITUTION_PATTERNS:
-        if re.search(pattern, name):
-            return inst
-    return InstitutionType.OTHER
+    return _INSTITUTION_CLASSIFIER(name)
 
 
 class BalanceSheet(Series):
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class OperationType(str, Enum):
@@ -34,14 +34,12 @@ _OPERATION_PATTERNS: list[tuple[str, OperationType]] = [
     (r"[Cc]ollateral", OperationType.COLLATERAL),
     (r"[Tt]otal", OperationType.TOTAL),
 ]
+_OPERATION_CLASSIFIER = PatternClassifier(_OPERATION_PATTERNS, OperationType.OTHER)
 
 
 def _detect_operation(name: str) -> OperationType:
     """Detect the operation type from a BOJ series name."""
-    for pattern, op in _OPERATION_PATTERNS:
-        if re.search(pattern, name):
-            return op
-    return OperationType.OTHER
+    return _OPERATION_CLASSIFIER(name)
 
 
 class BOJOperation(Series):
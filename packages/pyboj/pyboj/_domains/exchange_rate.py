@@ -6,6 +6,7 @@ import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class Currency(str, Enum):
@@ -88,6 +89,9 @@ _CURRENCY_MAP: dict[str, Currency] = {
     "saudi riyal": Currency.SAR_JPY,
     "turkish lira": Currency.TRY_JPY,
 }
+_CURRENCY_CLASSIFIER = PatternClassifier(
+    [(re.escape(fragment), currency) for fragment, currency in _CURRENCY_MAP.items()], None
+)
 
 # Ordered list of (pattern, RateType) — first match wins
 _RATE_TYPE_PATTERNS: list[tuple[str, RateType]] = [
@@ -107,23 +111,17 @@ _RATE_TYPE_PATTERNS: list[tuple[str, RateType]] = [
     (r"[Rr]eal.*[Ee]ffective", RateType.REAL_EFFECTIVE),
     (r"[Aa]verage", RateType.AVERAGE),
 ]
+_RATE_TYPE_CLASSIFIER = PatternClassifier(_RATE_TYPE_PATTERNS, RateType.OTHER)
 
 
 def _detect_currency(name: str) -> Currency | None:
     """Detect the currency pair from a BOJ series name."""
-    lower = name.lower()
-    for fragment, currency in _CURRENCY_MAP.items():
-        if fragment in lower:
-            return currency
-    return None
+    return _CURRENCY_CLASSIFIER(name.lower())
 
 
 def _detect_rate_type(name: str) -> RateType:
     """Detect the rate type from a BOJ series name."""
-    for pattern, rt in _RATE_TYPE_PATTERNS:
-        if re.search(pattern, name):
-            return rt
-    return RateType.OTHER
+    return _RATE_TYPE_CLASSIFIER(name)
 
 
 class ExchangeRate(Series):
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class MarketSegment(str, Enum):
@@ -43,6 +43,7 @@ _SEGMENT_PATTERNS: list[tuple[str, MarketSegment]] = [
     (r"[Gg]overnment.*[Bb]ond|JGB|[Gg]ovt.*[Bb]ond", MarketSegment.GOVT_BONDS),
     (r"[Ss]hort.*[Tt]erm|[Mm]oney\s*[Mm]arket", MarketSegment.SHORT_TERM_MONEY),
 ]
+_SEGMENT_CLASSIFIER = PatternClassifier(_SEGMENT_PATTERNS, MarketSegment.OTHER)
 
 _INSTRUMENT_PATTERNS: list[tuple[str, InstrumentType]] = [
     (r"[Oo]utstanding|[Aa]mount|[Bb]alance", InstrumentType.OUTSTANDING),
@@ -51,22 +52,17 @@ _INSTRUMENT_PATTERNS: list[tuple[str, InstrumentType]] = [
     (r"[Ss]pread", InstrumentType.SPREAD),
     (r"[Yy]ield|[Rr]ate", InstrumentType.YIELD),
 ]
+_INSTRUMENT_CLASSIFIER = PatternClassifier(_INSTRUMENT_PATTERNS, InstrumentType.OTHER)
 
 
 def _detect_segment(name: str) -> MarketSegment:
     """Detect the market segment from a BOJ series name."""
-    for pattern, seg in _SEGMENT_PATTERNS:
-        if re.search(pattern, name):
-            return seg
-    return MarketSegment.OTHER
+    return _SEGMENT_CLASSIFIER(name)
 
 
 def _detect_instrument(name: str) -> InstrumentType:
     """Detect the instrument type from a BOJ series name."""
-    for pattern, inst in _INSTRUMENT_PATTERNS:
-        if re.search(pattern, name):
-            return inst
-    return InstrumentType.OTHER
+    return _INSTRUMENT_CLASSIFIER(name)
 
 
 class FinancialMarket(Series):
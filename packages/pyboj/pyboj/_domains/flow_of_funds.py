@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class FofSector(str, Enum):
@@ -41,6 +41,7 @@ _SECTOR_PATTERNS: list[tuple[str, FofSector]] = [
     (r"[Oo]verseas|[Rr]est.*[Ww]orld", FofSector.OVERSEAS),
     (r"[Tt]otal|[Aa]ll\s*[Ss]ector", FofSector.TOTAL),
 ]
+_SECTOR_CLASSIFIER = PatternClassifier(_SECTOR_PATTERNS, FofSector.OTHER)
 
 _INSTRUMENT_PATTERNS: list[tuple[str, FofInstrument]] = [
     (r"[Cc]urrency.*[Dd]eposit|[Dd]eposit.*[Cc]urrency", FofInstrument.CURRENCY_DEPOSITS),
@@ -51,22 +52,17 @@ _INSTRUMENT_PATTERNS: list[tuple[str, FofInstrument]] = [
     (r"[Dd]erivative", FofInstrument.FINANCIAL_DERIVATIVES),
     (r"[Tt]otal\s*[Ff]inancial|[Ff]inancial.*[Aa]sset.*[Tt]otal", FofInstrument.TOTAL),
 ]
+_INSTRUMENT_CLASSIFIER = PatternClassifier(_INSTRUMENT_PATTERNS, FofInstrument.OTHER)
 
 
 def _detect_fof_sector(name: str) -> FofSector:
     """Detect the sector from a BOJ flow of funds series name."""
-    for pattern, sec in _SECTOR_PATTERNS:
-        if re.search(pattern, name):
-            return sec
-    return FofSector.OTHER
+    return _SECTOR_CLASSIFIER(name)
 
 
 def _detect_fof_instrument(name: str) -> FofInstrument:
     """Detect the instrument from a BOJ flow of funds series name."""
-    for pattern, inst in _INSTRUMENT_PATTERNS:
-        if re.search(pattern, name):
-            return inst
-    return FofInstrument.OTHER
+    return _INSTRUMENT_CLASSIFIER(name)
 
 
 class FlowOfFunds(Series):
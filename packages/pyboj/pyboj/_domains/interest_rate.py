@@ -6,6 +6,7 @@ import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class RateCategory(str, Enum):
@@ -38,6 +39,7 @@ _CATEGORY_PATTERNS: list[tuple[str, RateCategory]] = [
     (r"[Dd]eposit", RateCategory.DEPOSIT_RATE),
     (r"[Ll]oan|[Ll]ending|[Dd]iscount", RateCategory.LENDING_RATE),
 ]
+_CATEGORY_CLASSIFIER = PatternClassifier(_CATEGORY_PATTERNS, RateCategory.OTHER)
 
 # Tenor extraction: match common tenor labels in series names
 _TENOR_RE = re.compile(
@@ -54,10 +56,7 @@ _TENOR_RE = re.compile(
 
 def _detect_rate_category(name: str) -> RateCategory:
     """Detect the rate category from a BOJ series name."""
-    for pattern, cat in _CATEGORY_PATTERNS:
-        if re.search(pattern, name):
-            return cat
-    return RateCategory.OTHER
+    return _CATEGORY_CLASSIFIER(name)
 
 
 def _detect_collateralization(name: str) -> Collateralization | None:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class StatCategory(str, Enum):
@@ -30,14 +30,12 @@ _CATEGORY_PATTERNS: list[tuple[str, StatCategory]] = [
     (r"[Dd]ebt\s*[Ss]ecurit.*BIS|BIS.*[Dd]ebt", StatCategory.BIS_DEBT_SECURITIES),
     (r"BIS|[Ii]nternational\s*[Bb]anking", StatCategory.BIS_BANKING),
 ]
+_CATEGORY_CLASSIFIER = PatternClassifier(_CATEGORY_PATTERNS, StatCategory.OTHER)
 
 
 def _detect_stat_category(name: str) -> StatCategory:
     """Detect the statistics category from a BOJ series name."""
-    for pattern, cat in _CATEGORY_PATTERNS:
-        if re.search(pattern, name):
-            return cat
-    return StatCategory.OTHER
+    return _CATEGORY_CLASSIFIER(name)
 
 
 class InternationalStat(Series):
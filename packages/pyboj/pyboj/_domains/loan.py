@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class IndustrySector(str, Enum):
@@ -42,14 +42,12 @@ _SECTOR_PATTERNS: list[tuple[str, IndustrySector]] = [
     (r"[Ii]ndividual|[Hh]ousehold|[Pp]ersonal", IndustrySector.INDIVIDUALS),
     (r"[Tt]otal|[Aa]ll\s*[Ii]ndustr", IndustrySector.TOTAL),
 ]
+_SECTOR_CLASSIFIER = PatternClassifier(_SECTOR_PATTERNS, IndustrySector.OTHER)
 
 
 def _detect_sector(name: str) -> IndustrySector:
     """Detect the industry sector from a BOJ series name."""
-    for pattern, sec in _SECTOR_PATTERNS:
-        if re.search(pattern, name):
-            return sec
-    return IndustrySector.OTHER
+    return _SECTOR_CLASSIFIER(name)
 
 
 class Loan(Series):
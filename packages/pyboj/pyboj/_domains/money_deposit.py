@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class MonetaryComponent(str, Enum):
@@ -42,27 +42,23 @@ _COMPONENT_PATTERNS: list[tuple[str, MonetaryComponent]] = [
     (r"[Rr]eserve", MonetaryComponent.RESERVE),
     (r"[Tt]otal|[Mm]onetary\s*[Bb]ase", MonetaryComponent.TOTAL),
 ]
+_COMPONENT_CLASSIFIER = PatternClassifier(_COMPONENT_PATTERNS, MonetaryComponent.OTHER)
 
 _ADJUSTMENT_PATTERNS: list[tuple[str, Adjustment]] = [
     (r"[Ss]eason", Adjustment.SEASONALLY_ADJUSTED),
     (r"[Yy]ear.*[Yy]ear|[Yy]o[Yy]|y/y|前年比", Adjustment.YOY),
 ]
+_ADJUSTMENT_CLASSIFIER = PatternClassifier(_ADJUSTMENT_PATTERNS, Adjustment.NOMINAL)
 
 
 def _detect_component(name: str) -> MonetaryComponent:
     """Detect the monetary component from a BOJ series name."""
-    for pattern, comp in _COMPONENT_PATTERNS:
-        if re.search(pattern, name):
-            return comp
-    return MonetaryComponent.OTHER
+    return _COMPONENT_CLASSIFIER(name)
 
 
 def _detect_adjustment(name: str) -> Adjustment:
     """Detect the adjustment type from a BOJ series name."""
-    for pattern, adj in _ADJUSTMENT_PATTERNS:
-        if re.search(pattern, name):
-            return adj
-    return Adjustment.NOMINAL
+    return _ADJUSTMENT_CLASSIFIER(name)
 
 
 class MoneyDeposit(Series):
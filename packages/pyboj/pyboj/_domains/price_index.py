@@ -6,6 +6,7 @@ import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class IndexType(str, Enum):
@@ -31,6 +32,7 @@ _INDEX_TYPE_PATTERNS: list[tuple[str, IndexType]] = [
     (r"[Ss]ervice", IndexType.SERVICES),
     (r"[Pp]roducer|[Cc]orporate.*[Gg]oods|CGPI", IndexType.PRODUCER),
 ]
+_INDEX_TYPE_CLASSIFIER = PatternClassifier(_INDEX_TYPE_PATTERNS, None)
 
 # Extract base year from unit strings like "CY2020 average=100"
 _BASE_YEAR_RE = re.compile(r"((?:CY|FY)\d{4})")
@@ -39,9 +41,9 @@ _BASE_YEAR_RE = re.compile(r"((?:CY|FY)\d{4})")
 def _detect_index_type(name: str, category: str) -> IndexType:
     """Detect the index type from a BOJ series name and category."""
     for text in (name, category):
-        for pattern, it in _INDEX_TYPE_PATTERNS:
-            if re.search(pattern, text):
-                return it
+        it = _INDEX_TYPE_CLASSIFIER(text)
+        if it is not None:
+            return it
     return IndexType.OTHER
 
 
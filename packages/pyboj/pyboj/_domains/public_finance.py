@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pyboj._domains._base import Series
+from pyboj._domains._classify import PatternClassifier
 
 
 class FiscalItem(str, Enum):
@@ -31,14 +31,12 @@ _FISCAL_PATTERNS: list[tuple[str, FiscalItem]] = [
     (r"[Bb]orrowing", FiscalItem.BORROWING),
     (r"[Bb]alance|[Ss]urplus|[Dd]eficit", FiscalItem.BALANCE),
 ]
+_FISCAL_CLASSIFIER = PatternClassifier(_FISCAL_PATTERNS, FiscalItem.OTHER)
 
 
 def _detect_fiscal_item(name: str) -> FiscalItem:
     """Detect the fiscal item from a BOJ series name."""
-    for pattern, item in _FISCAL_PATTERNS:
-        if re.search(pattern, name):
-            return item
-    return FiscalItem.OTHER
+    return _FISCAL_CLASSIFIER(name)
 
 
 class PublicFinance(Series):
@@ -2,14 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
-from typing import TYPE_CHECKING
 
 from pyboj._domains._base import Series
-
-if TYPE_CHECKING:
-    from boj_ts_api import MetadataRecord
+from pyboj._domains._classify import PatternClassifier
 
 
 class TankanIndustry(str, Enum):
@@ -114,6 +110,7 @@ _INDUSTRY_PATTERNS: list[tuple[str, TankanIndustry]] = [
     (r"[Ii]nformation", TankanIndustry.INFORMATION),
     (r"[Ss]ervice", TankanIndustry.SERVICES),
 ]
+_INDUSTRY_CLASSIFIER = PatternClassifier(_INDUSTRY_PATTERNS, TankanIndustry.OTHER)
 
 _SIZE_PATTERNS: list[tuple[str, TankanSize]] = [
     (r"[Ll]arge", TankanSize.LARGE),
@@ -121,6 +118,7 @@ _SIZE_PATTERNS: list[tuple[str, TankanSize]] = [
     (r"[Ss]mall", TankanSize.SMALL),
     (r"[Aa]ll\s*[Ee]nterprise|[Aa]ll\s*[Ss]ize", TankanSize.ALL),
 ]
+_SIZE_CLASSIFIER = PatternClassifier(_SIZE_PATTERNS, None)
 
 _ITEM_PATTERNS: list[tuple[str, TankanItem]] = [
     (r"[Bb]usiness\s*[Cc]ondition", TankanItem.BUSINESS_CONDITIONS),
@@ -135,6 +133,7 @@ _ITEM_PATTERNS: list[tuple[str, TankanItem]] = [
     (r"[Oo]utput\s*[Pp]rice", TankanItem.OUTPUT_PRICES),
     (r"\b[Ss]ales\b", TankanItem.SALES),
 ]
+_ITEM_CLASSIFIER = PatternClassifier(_ITEM_PATTERNS, TankanItem.OTHER)
 
 _SERIES_TYPE_PATTERNS: list[tuple[str, TankanSeriesType]] = [
     (r"[Dd]iffusion\s*[Ii]ndex|D\.?I\.?\b", TankanSeriesType.DIFFUSION_INDEX),
@@ -142,34 +141,23 @@ _SERIES_TYPE_PATTERNS: list[tuple[str, TankanSeriesType]] = [
     (r"[Cc]hange|[Cc]hg", TankanSeriesType.CHANGE),
     (r"[Ll]evel", TankanSeriesType.LEVEL),
 ]
+_SERIES_TYPE_CLASSIFIER = PatternClassifier(_SERIES_TYPE_PATTERNS, TankanSeriesType.OTHER)
 
 
 def _detect_tankan_industry(name: str) -> TankanIndustry:
-    for pattern, ind in _INDUSTRY_PATTERNS:
-        if re.search(pattern, name):
-            return ind
-    return TankanIndustry.OTHER
+    return _INDUSTRY_CLASSIFIER(name)
 
 
 def _detect_tankan_size(name: str) -> TankanSize | None:
-    for pattern, sz in _SIZE_PATTERNS:
-        if re.search(pattern, name):
-            return sz
-    return None
+    return _SIZE_CLASSIFIER(name)
 
 
 def _detect_tankan_item(name: str) -> TankanItem:
-    for pattern, it in _ITEM_PATTERNS:
-        if re.search(pattern, name):
-            return it
-    return TankanItem.OTHER
+    return _ITEM_CLASSIFIER(name)
 
 
 def _detect_tankan_series_type(name: str) -> TankanSeriesType:
-    for pattern, st in _SERIES_TYPE_PATTERNS:
-        if re.search(pattern, name):
-            return st
-    return TankanSeriesType.OTHER
+    return _SERIES_TYPE_CLASSIFIER(name)
 
 
 def _detect_tankan_timing(name: str) -> TankanTiming:
@@ -179,28 +167,6 @@ def _detect_tankan_timing(name: str) -> TankanTiming:
     return TankanTiming.ACTUAL
 
 
-def _matches_tankan_filters(
-    rec: MetadataRecord,
-    *,
-    industry: TankanIndustry | None,
-    size: TankanSize | None,
-    item: TankanItem | None,
-    series_type: TankanSeriesType | None,
-    timing: TankanTiming | None,
-) -> bool:
-    """Check if a metadata record matches the requested TANKAN filters."""
-    name = rec.NAME_OF_TIME_SERIES or ""
-    if industry is not None and _detect_tankan_industry(name) != industry:
-        return False
-    if size is not None and _detect_tankan_size(name) != size:
-        return False
-    if item is not None and _detect_tankan_item(name) != item:
-        return False
-    if series_type is not None and _detect_tankan_series_type(name) != series_type:
-        return False
-    return timing is None or _detect_tankan_timing(name) == timing
-
-
 class Tankan(Series):
     """Domain wrapper for TANKAN survey series (CO database)."""
 
@@ -1,30 +1,273 @@
-"""Pandas helper for converting CSV text to DataFrames."""
+"""Pandas helpers for converting CSV text to DataFrames.
+
+Besides whole responses, every helper accepts the ``str`` chunks yielded by
+the clients' ``stream_*_csv()`` methods, so large downloads are parsed or
+written as they arrive instead of being held as one string first.
+"""
 
 from __future__ import annotations
 
+import csv as _csv
 import io
+from collections.abc import Iterable, Iterator, Sequence
+from os import PathLike
+from pathlib import Path
+from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
+from boj_ts_api import ResponseEnvelope
+
+from pyboj._parsing.dates import parse_survey_dates_array
+
+# Rows per DataFrame yielded by iter_csv_frames.
+DEFAULT_CHUNKSIZE = 50_000
+
+
+class _ChunkReader(io.RawIOBase):
+    """Readable binary stream over ``str`` chunks, re-encoded as UTF-8."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk.encode("utf-8"))
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def _open(chunks: Iterable[str]) -> io.BufferedReader:
+    return io.BufferedReader(_ChunkReader(chunks), buffer_size=1 << 16)
+
+
+def _import_arrow_csv() -> Any:
+    try:
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for the pyarrow CSV engine. "
+            "Install it with: pip install pyboj[store]"
+        ) from None
+    return pa_csv
+
+
+def _has_arrow() -> bool:
+    try:
+        import pyarrow.csv  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# ── BOJ CSV layout ───────────────────────────────────────────────────
+#
+# Envelope rows ("STATUS,200", "NEXTPOSITION,..." and the like) and blank
+# rows before the column header are skipped.  Observations and survey dates
+# are typed up front, every other column is text, so nothing depends on
+# what the first rows happen to contain.
+
+_ENVELOPE_KEYS = frozenset(ResponseEnvelope.model_fields)
+_VALUE_COLUMNS = frozenset({"VALUE", "VALUES"})
+_DATE_COLUMNS = frozenset({"SURVEY_DATE", "SURVEY_DATES"})
+# Cells read as a missing observation or survey date.
+MISSING_VALUES = ("", "ND", "NA", "N/A", "-")
+# Envelope rows tolerated before the header.
+_MAX_PREAMBLE = 20
+
+
+def _source(
+    csv_text: str | bytes | Iterable[str], encoding: str
+) -> tuple[io.BufferedIOBase, str]:
+    """Binary stream over *csv_text* and the encoding of its bytes."""
+    if isinstance(csv_text, str):
+        return io.BytesIO(csv_text.encode("utf-8")), "utf-8"
+    if isinstance(csv_text, bytes):
+        return io.BytesIO(csv_text), encoding
+    return _open(csv_text), "utf-8"
+
+
+def _read_header(stream: io.BufferedIOBase, encoding: str) -> list[str]:
+    """Consume rows up to and including the column header and return its names."""
+    for _ in range(_MAX_PREAMBLE + 1):
+        line = stream.readline()
+        if not line:
+            break
+        row = next(_csv.reader([line.decode(encoding).lstrip("\ufeff")]), [])
+        if any(row) and row[0] not in _ENVELOPE_KEYS:
+            return row
+    raise ValueError("CSV has no column header row")
+
+
+def _date_column(names: Sequence[str]) -> str | None:
+    return next((name for name in names if name in _DATE_COLUMNS), None)
+
+
+def _arrow_options(pa_csv: Any, names: list[str], encoding: str, **read: Any) -> dict[str, Any]:
+    import pyarrow as pa
+
+    types = {name: pa.string() for name in names}
+    types.update({name: pa.float64() for name in names if name in _VALUE_COLUMNS})
+    types.update({name: pa.int64() for name in names if name in _DATE_COLUMNS})
+    return {
+        "read_options": pa_csv.ReadOptions(column_names=names, encoding=encoding, **read),
+        "convert_options": pa_csv.ConvertOptions(
+            column_types=types,
+            null_values=list(MISSING_VALUES),
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    }
 
 
-def csv_to_dataframe(csv_text: str | bytes, *, encoding: str = "utf-8") -> pd.DataFrame:
+def _pandas_options(names: list[str], encoding: str) -> dict[str, Any]:
+    dtype: dict[str, Any] = {name: str for name in names}
+    dtype.update({name: np.float64 for name in names if name in _VALUE_COLUMNS})
+    dtype.update({name: "Int64" for name in names if name in _DATE_COLUMNS})
+    typed = [name for name in names if name in _VALUE_COLUMNS | _DATE_COLUMNS]
+    return {
+        "header": None,
+        "names": names,
+        "dtype": dtype,
+        "na_values": {name: list(MISSING_VALUES) for name in typed},
+        "keep_default_na": False,
+        "encoding": encoding,
+    }
+
+
+def _indexed(df: pd.DataFrame) -> pd.DataFrame:
+    """Index *df* by its parsed survey dates, if it has a survey-date column."""
+    column = _date_column(df.columns)
+    if column is None:
+        return df
+    codes = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(codes)
+    dates = np.full(len(codes), np.datetime64("NaT"), dtype="datetime64[D]")
+    dates[present] = parse_survey_dates_array(codes[present].astype(np.int64))
+    df.index = pd.DatetimeIndex(dates, name="date")
+    return df
+
+
+def csv_to_dataframe(
+    csv_text: str | bytes | Iterable[str],
+    *,
+    encoding: str = "utf-8",
+    engine: Literal["pyarrow", "c"] | None = None,
+) -> pd.DataFrame:
     """Convert CSV text from the BOJ API into a pandas DataFrame.
 
+    The reader knows the BOJ layout: envelope rows (``STATUS``,
+    ``NEXTPOSITION``, ...) before the column header are skipped, ``VALUE`` is read as ``float64``
+    and ``SURVEY_DATE`` as nullable ``Int64`` (both with
+    :data:`MISSING_VALUES` as missing), and every other column as text.
+    Survey dates are parsed in one vectorised pass into a
+    ``DatetimeIndex`` named ``date``; metadata CSV, which has no survey
+    dates, keeps a ``RangeIndex``.
+
     Parameters
     ----------
     csv_text:
         Raw CSV text returned by a ``*_csv()`` client method. Accepts ``str``
-        (already decoded) or ``bytes`` (decoded using *encoding*).
+        (already decoded), ``bytes`` (decoded using *encoding*) or the
+        ``str`` chunks of a ``stream_*_csv()`` method, which are parsed as
+        they arrive.
     encoding:
         Encoding for *csv_text* when it is ``bytes``. The BOJ API uses UTF-8
         for English (``lang=en``) and Shift-JIS for Japanese (``lang=jp``).
         Use ``encoding="shift_jis"`` for Japanese CSV responses.
+    engine:
+        ``"pyarrow"`` (multi-threaded, ``pip install pyboj[store]``) or
+        ``"c"`` (pandas' parser).  Defaults to pyarrow when it is installed.
 
     Returns
     -------
     pandas.DataFrame
     """
-    if isinstance(csv_text, bytes):
-        csv_text = csv_text.decode(encoding)
+    stream, encoding = _source(csv_text, encoding)
+    names = _read_header(stream, encoding)
+    if engine is None:
+        engine = "pyarrow" if _has_arrow() else "c"
+    if engine == "pyarrow":
+        import pyarrow as pa
+
+        pa_csv = _import_arrow_csv()
+        table = pa_csv.read_csv(stream, **_arrow_options(pa_csv, names, encoding))
+        df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    elif engine == "c":
+        df = pd.read_csv(stream, engine="c", **_pandas_options(names, encoding))
+    else:
+        raise ValueError(f"engine must be 'pyarrow' or 'c', got {engine!r}")
+    return _indexed(df)
+
+
+def iter_csv_frames(
+    chunks: Iterable[str], *, chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[pd.DataFrame]:
+    """Parse streamed CSV text into DataFrames of at most *chunksize* rows.
+
+    Each frame is typed and indexed as by :func:`csv_to_dataframe`.
+
+    Usage::
+
+        with Client(lang=Lang.JP) as client:
+            for df in iter_csv_frames(client.stream_metadata_csv("FM08")):
+                ...
+
+    Parameters
+    ----------
+    chunks:
+        ``str`` chunks, e.g. from ``Client.stream_data_layer_csv()``.
+    chunksize:
+        Maximum rows per yielded DataFrame.
+    """
+    stream, encoding = _source(chunks, "utf-8")
+    names = _read_header(stream, encoding)
+    options = _pandas_options(names, encoding)
+    with pd.read_csv(stream, chunksize=chunksize, **options) as reader:
+        for df in reader:
+            yield _indexed(df)
+
 
-    return pd.read_csv(io.StringIO(csv_text))
+def iter_csv_batches(chunks: Iterable[str], *, block_size: int = 1 << 20) -> Iterator[Any]:
+    """Parse streamed CSV text into ``pyarrow.RecordBatch`` objects.
+
+    Uses pyarrow's streaming CSV reader (``pip install pyboj[store]``),
+    which parses *block_size* bytes at a time, with the column types of
+    :func:`csv_to_dataframe` declared up front.
+
+    Parameters
+    ----------
+    chunks:
+        ``str`` chunks, e.g. from ``Client.stream_data_layer_csv()``.
+    block_size:
+        Bytes of CSV parsed per batch.
+    """
+    pa_csv = _import_arrow_csv()
+    stream, encoding = _source(chunks, "utf-8")
+    names = _read_header(stream, encoding)
+    yield from pa_csv.open_csv(
+        stream, **_arrow_options(pa_csv, names, encoding, block_size=block_size)
+    )
+
+
+def write_csv(
+    chunks: Iterable[str], path: str | PathLike[str], *, encoding: str = "utf-8"
+) -> Path:
+    """Write streamed CSV text to *path* chunk by chunk and return the path.
+
+    Japanese responses arrive as Shift-JIS but are written in *encoding*.
+    """
+    path = Path(path).expanduser()
+    with path.open("w", encoding=encoding, newline="") as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+    return path
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 
 from boj_ts_api import MetadataRecord
 
+from pyboj._helpers.search_index import SearchIndex
+
 
 @dataclass
 class LayerNode:
@@ -106,9 +108,14 @@ def search_metadata(
     records: list[MetadataRecord],
     query: str,
 ) -> list[MetadataRecord]:
-    """Search metadata records by keyword (case-insensitive substring match).
+    """Search metadata records by keyword.
 
-    Searches across series code, English name, Japanese name, and category.
+    Searches across series code, English name, Japanese name, and category
+    using a one-off :class:`~pyboj._helpers.search_index.SearchIndex`; see
+    it for the matching and ranking rules.  Series codes containing the
+    query anywhere (e.g. ``"D01"`` in ``"FXERD01"``) also match, after the
+    ranked hits.  To search the same records repeatedly, build the index
+    once (as :meth:`BOJ.search` does).
 
     Parameters
     ----------
@@ -120,24 +127,15 @@ def search_metadata(
     Returns
     -------
     list[MetadataRecord]
-        Matching records (only rows with a series code).
+        Matching records (only rows with a series code), best match first.
     """
-    q = query.lower()
-    results: list[MetadataRecord] = []
-    for rec in records:
-        if not rec.SERIES_CODE:
-            continue
-        searchable = " ".join(
-            s
-            for s in (
-                rec.SERIES_CODE,
-                rec.NAME_OF_TIME_SERIES,
-                rec.NAME_OF_TIME_SERIES_J,
-                rec.CATEGORY,
-                rec.CATEGORY_J,
-            )
-            if s
+    hits = SearchIndex(records).search(query)
+    q = query.strip().lower()
+    if q:
+        found = {id(rec) for rec in hits}
+        hits.extend(
+            rec
+            for rec in records
+            if rec.SERIES_CODE and q in rec.SERIES_CODE.lower() and id(rec) not in found
         )
-        if q in searchable.lower():
-            results.append(rec)
-    return results
+    return hits
@@ -0,0 +1,206 @@
+"""Per-database column index of classified metadata records."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from enum import Enum
+
+from boj_ts_api import Frequency, MetadataRecord, MetadataResponse
+
+from pyboj._domains.balance_of_payments import BopAccount, _detect_bop_account
+from pyboj._domains.balance_sheet import (
+    AccountSide,
+    InstitutionType,
+    _detect_institution,
+    _detect_side,
+)
+from pyboj._domains.boj_operation import OperationType, _detect_operation
+from pyboj._domains.exchange_rate import (
+    Currency,
+    RateType,
+    _detect_currency,
+    _detect_rate_type,
+)
+from pyboj._domains.financial_market import (
+    InstrumentType,
+    MarketSegment,
+    _detect_instrument,
+    _detect_segment,
+)
+from pyboj._domains.flow_of_funds import (
+    FofInstrument,
+    FofSector,
+    _detect_fof_instrument,
+    _detect_fof_sector,
+)
+from pyboj._domains.interest_rate import (
+    Collateralization,
+    RateCategory,
+    _detect_collateralization,
+    _detect_rate_category,
+)
+from pyboj._domains.international_stat import StatCategory, _detect_stat_category
+from pyboj._domains.loan import IndustrySector, _detect_sector
+from pyboj._domains.money_deposit import (
+    Adjustment,
+    MonetaryComponent,
+    _detect_adjustment,
+    _detect_component,
+)
+from pyboj._domains.price_index import IndexType, _detect_index_type
+from pyboj._domains.public_finance import FiscalItem, _detect_fiscal_item
+from pyboj._domains.tankan import (
+    TankanIndustry,
+    TankanItem,
+    TankanSeriesType,
+    TankanSize,
+    TankanTiming,
+    _detect_tankan_industry,
+    _detect_tankan_item,
+    _detect_tankan_series_type,
+    _detect_tankan_size,
+    _detect_tankan_timing,
+)
+from pyboj._helpers.search_index import SearchIndex
+from pyboj._utils import frequency_matches
+
+Classifier = Callable[[MetadataRecord], Enum | None]
+
+
+def _by_name(detect: Callable[[str], Enum | None]) -> Classifier:
+    def classify(rec: MetadataRecord) -> Enum | None:
+        return detect(rec.NAME_OF_TIME_SERIES or "")
+
+    return classify
+
+
+def _index_type(rec: MetadataRecord) -> IndexType:
+    return _detect_index_type(rec.NAME_OF_TIME_SERIES or "", rec.CATEGORY or "")
+
+
+# Every domain filter is an enum member; its enum class names the column.
+CLASSIFIERS: dict[type[Enum], Classifier] = {
+    Currency: _by_name(_detect_currency),
+    RateType: _by_name(_detect_rate_type),
+    RateCategory: _by_name(_detect_rate_category),
+    Collateralization: _by_name(_detect_collateralization),
+    IndexType: _index_type,
+    TankanIndustry: _by_name(_detect_tankan_industry),
+    TankanSize: _by_name(_detect_tankan_size),
+    TankanItem: _by_name(_detect_tankan_item),
+    TankanSeriesType: _by_name(_detect_tankan_series_type),
+    TankanTiming: _by_name(_detect_tankan_timing),
+    BopAccount: _by_name(_detect_bop_account),
+    MonetaryComponent: _by_name(_detect_component),
+    Adjustment: _by_name(_detect_adjustment),
+    IndustrySector: _by_name(_detect_sector),
+    MarketSegment: _by_name(_detect_segment),
+    InstrumentType: _by_name(_detect_instrument),
+    AccountSide: _by_name(_detect_side),
+    InstitutionType: _by_name(_detect_institution),
+    FofSector: _by_name(_detect_fof_sector),
+    FofInstrument: _by_name(_detect_fof_instrument),
+    OperationType: _by_name(_detect_operation),
+    FiscalItem: _by_name(_detect_fiscal_item),
+    StatCategory: _by_name(_detect_stat_category),
+}
+
+
+class MetadataIndex:
+    """Facet index over the series records of one metadata response.
+
+    For every facet (a domain enum class such as ``Currency``, or
+    ``Frequency``) the index maps each label to the set of record
+    positions carrying it.  A facet is built in a single pass the first
+    time a filter on it is used and then reused, so a query against the
+    same metadata is a set intersection instead of a scan that re-runs
+    the detectors.  Answers are memoized per query.
+
+    Parameters
+    ----------
+    meta:
+        The metadata response to index. Header rows (empty ``SERIES_CODE``)
+        are skipped.
+    """
+
+    def __init__(self, meta: MetadataResponse) -> None:
+        self.meta = meta
+        self.records = [rec for rec in meta.RESULTSET if rec.SERIES_CODE]
+        self._codes: list[str] = [rec.SERIES_CODE for rec in self.records]  # type: ignore[misc]
+        self._columns: dict[type[Enum], list[Enum | None]] = {}
+        self._postings: dict[type[Enum], dict[Enum | None, frozenset[int]]] = {}
+        self._frequencies: dict[Frequency, frozenset[int]] = {}
+        self._search: SearchIndex | None = None
+        self._by_code: dict[str, MetadataRecord] | None = None
+        self._queries: dict[
+            tuple[frozenset[tuple[type[Enum], Enum]], Frequency | None], tuple[str, ...]
+        ] = {}
+
+    def column(self, facet: type[Enum]) -> list[Enum | None]:
+        """Return the labels of *facet* for every record, in metadata order."""
+        col = self._columns.get(facet)
+        if col is None:
+            classify = CLASSIFIERS[facet]
+            col = [classify(rec) for rec in self.records]
+            self._columns[facet] = col
+        return col
+
+    def record(self, code: str) -> MetadataRecord:
+        """Return the metadata record of series *code*."""
+        if self._by_code is None:
+            self._by_code = {rec.SERIES_CODE: rec for rec in self.records}  # type: ignore[misc]
+        return self._by_code[code]
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index over the same records, built on first access."""
+        if self._search is None:
+            self._search = SearchIndex(self.records)
+        return self._search
+
+    def postings(self, facet: type[Enum]) -> dict[Enum | None, frozenset[int]]:
+        """Return ``{label: record positions}`` for *facet*."""
+        post = self._postings.get(facet)
+        if post is None:
+            groups: dict[Enum | None, list[int]] = {}
+            for i, label in enumerate(self.column(facet)):
+                groups.setdefault(label, []).append(i)
+            post = {label: frozenset(pos) for label, pos in groups.items()}
+            self._postings[facet] = post
+        return post
+
+    def _frequency_postings(self, frequency: Frequency) -> frozenset[int]:
+        pos = self._frequencies.get(frequency)
+        if pos is None:
+            pos = frozenset(
+                i
+                for i, rec in enumerate(self.records)
+                if frequency_matches(rec.FREQUENCY, frequency)
+            )
+            self._frequencies[frequency] = pos
+        return pos
+
+    def select(
+        self, filters: Iterable[Enum | None], frequency: Frequency | None = None
+    ) -> list[str]:
+        """Return series codes whose labels equal every non-``None`` filter.
+
+        Codes are returned in metadata order.
+        """
+        # Keyed by (enum class, member): str-valued members of different
+        # facets may compare equal.
+        active = frozenset((type(f), f) for f in filters if f is not None)
+        key = (active, frequency)
+        codes = self._queries.get(key)
+        if codes is None:
+            sets = [self.postings(facet).get(f, frozenset()) for facet, f in active]
+            if frequency is not None:
+                sets.append(self._frequency_postings(frequency))
+            if not sets:
+                codes = tuple(self._codes)
+            else:
+                sets.sort(key=len)
+                hits = sets[0].intersection(*sets[1:])
+                codes = tuple(self._codes[i] for i in sorted(hits))
+            self._queries[key] = codes
+        return list(codes)
@@ -0,0 +1,103 @@
+"""Combine many series into one pandas DataFrame."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from pyboj._domains._base import Series
+
+
+def to_panel(
+    series: Iterable[Series], *, layout: Literal["wide", "long"] = "wide"
+) -> pd.DataFrame:
+    """Align many series into a single DataFrame.
+
+    Observations come from each series' :attr:`~pyboj.Series.arrays`, so no
+    per-series frames are built and concatenated.  Series sharing a date
+    vector (typically those of one frequency) are placed with one index
+    lookup for the whole group.
+
+    Parameters
+    ----------
+    series:
+        Series to combine, e.g. the result of ``boj.tankan()``.
+    layout:
+        ``"wide"``: one ``float64`` column per series code on the sorted
+        union of all dates, ``NaN`` where a series has no observation.
+        ``"long"``: one row per observation with ``series_code``, ``date``
+        and ``value`` columns, series in input order.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    items = list(series)
+    arrays = [s.arrays for s in items]
+    return panel_frame(
+        [s.series_code for s in items],
+        [arr.dates for arr in arrays],
+        [arr.values for arr in arrays],
+        layout=layout,
+    )
+
+
+def panel_frame(
+    codes: Sequence[str],
+    dates: Sequence[np.ndarray],
+    values: Sequence[np.ndarray],
+    *,
+    layout: Literal["wide", "long"] = "wide",
+) -> pd.DataFrame:
+    """:func:`to_panel` over per-series ``datetime64[D]`` / ``float64`` arrays."""
+    if layout == "long":
+        return _long(codes, dates, values)
+    if layout != "wide":
+        raise ValueError(f"layout must be 'wide' or 'long', got {layout!r}")
+    return _wide(codes, dates, values)
+
+
+def _wide(
+    codes: Sequence[str], dates: Sequence[np.ndarray], values: Sequence[np.ndarray]
+) -> pd.DataFrame:
+    # Parsed calendars are shared objects, so grouping by identity finds
+    # series with the same dates without comparing them.
+    groups: dict[int, list[int]] = {}
+    calendars: dict[int, np.ndarray] = {}
+    for i, calendar in enumerate(dates):
+        key = id(calendar)
+        calendars[key] = calendar
+        groups.setdefault(key, []).append(i)
+
+    if calendars:
+        index = np.unique(np.concatenate(list(calendars.values())))
+    else:
+        index = np.empty(0, dtype="datetime64[D]")
+    block = np.full((len(index), len(codes)), np.nan)
+    for key, columns in groups.items():
+        rows = np.searchsorted(index, calendars[key])
+        block[np.ix_(rows, columns)] = np.column_stack([values[i] for i in columns])
+
+    return pd.DataFrame(
+        block,
+        index=pd.DatetimeIndex(index, name="date"),
+        columns=pd.Index(list(codes), name="series_code"),
+        copy=False,
+    )
+
+
+def _long(
+    codes: Sequence[str], dates: Sequence[np.ndarray], values: Sequence[np.ndarray]
+) -> pd.DataFrame:
+    lengths = [len(v) for v in values]
+    repeated = np.repeat(np.array(list(codes), dtype=object), lengths)
+    if values:
+        flat_dates = np.concatenate(list(dates))
+        flat_values = np.concatenate(list(values))
+    else:
+        flat_dates = np.empty(0, dtype="datetime64[D]")
+        flat_values = np.empty(0)
+    return pd.DataFrame({"series_code": repeated, "date": flat_dates, "value": flat_values})
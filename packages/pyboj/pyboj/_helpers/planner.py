@@ -0,0 +1,322 @@
+"""Pack series codes into Code API requests that avoid server-side pagination."""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from boj_ts_api import MetadataRecord, SeriesResult, SeriesValues
+from boj_ts_api._types.config import MAX_DATA_POINTS_PER_REQUEST, MAX_SERIES_PER_REQUEST
+
+from pyboj._parsing.arrays import SeriesArrays
+from pyboj._utils import MAX_CODE_PARAM_LENGTH
+
+# Request dates are given in the unit below for each response FREQUENCY
+# prefix (daily and weekly requests use YYYYMM), with an upper bound on
+# observations per unit used to estimate a series' data points.
+_UNITS: dict[str, tuple[str, int]] = {
+    "DAILY": ("month", 31),
+    "WEEKLY": ("month", 5),
+    "MONTHLY": ("month", 1),
+    "QUARTERLY": ("quarter", 1),
+    "SEMIANNUAL": ("half", 1),
+    "ANNUAL": ("year", 1),
+}
+
+# Sub-periods per year for each unit.
+_PER_YEAR = {"month": 12, "quarter": 4, "half": 2, "year": 1}
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """One planned Code API request.
+
+    Attributes
+    ----------
+    codes:
+        Series codes to request, all of one frequency.
+    start_date, end_date:
+        Date range for this request (``None`` for open-ended).
+    """
+
+    codes: tuple[str, ...]
+    start_date: str | None = None
+    end_date: str | None = None
+
+
+@dataclass(frozen=True)
+class _Span:
+    unit: str
+    per_unit: int
+    lo: int
+    hi: int
+
+    @property
+    def points(self) -> int:
+        return max(0, self.hi - self.lo + 1) * self.per_unit
+
+
+def _unit_of(frequency: str | None) -> tuple[str, int] | None:
+    upper = (frequency or "").upper()
+    for prefix, unit in _UNITS.items():
+        if upper.startswith(prefix):
+            return unit
+    return None
+
+
+def _ordinal(value: str | None, unit: str, *, end: bool) -> int | None:
+    """Convert a BOJ date (``YYYY``, ``YYYYMM``, ``YYYYQQ``, ``YYYYMMDD``...) to a unit index."""
+    digits = "".join(ch for ch in str(value or "") if ch.isdigit())
+    if len(digits) < 4:
+        return None
+    year = int(digits[:4])
+    per_year = _PER_YEAR[unit]
+    if per_year == 1:
+        return year
+    sub = int(digits[4:6]) if len(digits) >= 6 else (per_year if end else 1)
+    if not 1 <= sub <= per_year:
+        return None
+    return year * per_year + sub - 1
+
+
+def _format(ordinal: int, unit: str) -> str:
+    per_year = _PER_YEAR[unit]
+    if per_year == 1:
+        return f"{ordinal:04d}"
+    year, sub = divmod(ordinal, per_year)
+    return f"{year:04d}{sub + 1:02d}"
+
+
+def _span(rec: MetadataRecord, start_date: str | None, end_date: str | None) -> _Span | None:
+    """The requested part of *rec*'s observation range, or ``None`` if unknown."""
+    unit_info = _unit_of(rec.FREQUENCY)
+    if unit_info is None:
+        return None
+    unit, per_unit = unit_info
+    starts = [
+        o
+        for o in (
+            _ordinal(rec.START_OF_THE_TIME_SERIES, unit, end=False),
+            _ordinal(start_date, unit, end=False),
+        )
+        if o is not None
+    ]
+    if not starts:
+        return None
+    ends = [
+        o
+        for o in (
+            _ordinal(rec.END_OF_THE_TIME_SERIES, unit, end=True),
+            _ordinal(end_date, unit, end=True),
+        )
+        if o is not None
+    ]
+    if not ends:
+        ends = [_ordinal(datetime.date.today().strftime("%Y%m%d"), unit, end=True) or 0]
+    return _Span(unit, per_unit, max(starts), min(ends))
+
+
+def estimate_points(
+    rec: MetadataRecord, start_date: str | None = None, end_date: str | None = None
+) -> int | None:
+    """Upper-bound estimate of the observations *rec* has in the requested range.
+
+    Uses ``FREQUENCY`` and ``START/END_OF_THE_TIME_SERIES``; returns
+    ``None`` when the metadata does not say.
+    """
+    span = _span(rec, start_date, end_date)
+    return span.points if span is not None else None
+
+
+def plan_requests(
+    records: Sequence[MetadataRecord],
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    max_series: int = MAX_SERIES_PER_REQUEST,
+    max_points: int = MAX_DATA_POINTS_PER_REQUEST,
+    max_len: int = MAX_CODE_PARAM_LENGTH,
+) -> list[RequestPlan]:
+    """Pack the series of *records* into as few single-page requests as possible.
+
+    The Code API requires one frequency per request, so records are first
+    grouped by ``FREQUENCY`` (groups in order of first appearance, records
+    in metadata order).  Each group is packed greedily: a request is closed
+    when the next code would exceed *max_series* codes, *max_points*
+    estimated data points (see :func:`estimate_points`; unknown estimates
+    count as zero) or *max_len* characters of the ``code`` parameter.  A
+    single series estimated above *max_points* gets requests of its own,
+    split into consecutive date ranges.
+
+    Parameters
+    ----------
+    records:
+        Metadata records of the series to fetch.
+    start_date, end_date:
+        Requested date range, in the API's request format.
+    max_series, max_points, max_len:
+        Per-request limits.
+    """
+    groups: dict[str, list[MetadataRecord]] = {}
+    for rec in records:
+        if rec.SERIES_CODE:
+            groups.setdefault((rec.FREQUENCY or "").upper(), []).append(rec)
+
+    plans: list[RequestPlan] = []
+    for recs in groups.values():
+        batch: list[str] = []
+        points = length = 0
+
+        def flush() -> None:
+            nonlocal batch, points, length
+            if batch:
+                plans.append(RequestPlan(tuple(batch), start_date, end_date))
+            batch, points, length = [], 0, 0
+
+        for rec in recs:
+            code: str = rec.SERIES_CODE  # type: ignore[assignment]
+            span = _span(rec, start_date, end_date)
+            estimate = span.points if span is not None else 0
+            if span is not None and estimate > max_points:
+                flush()
+                plans.extend(_split(code, span, max_points))
+                continue
+            added = len(code) + (1 if batch else 0)
+            if batch and (
+                len(batch) >= max_series
+                or points + estimate > max_points
+                or length + added > max_len
+            ):
+                flush()
+                added = len(code)
+            batch.append(code)
+            points += estimate
+            length += added
+        flush()
+    return plans
+
+
+def _split(code: str, span: _Span, max_points: int) -> list[RequestPlan]:
+    """Cover *span* with consecutive date ranges of at most *max_points* points."""
+    width = max(1, max_points // span.per_unit)
+    return [
+        RequestPlan(
+            (code,), _format(lo, span.unit), _format(min(lo + width, span.hi + 1) - 1, span.unit)
+        )
+        for lo in range(span.lo, span.hi + 1, width)
+    ]
+
+
+def assemble_results(
+    codes: Sequence[str], plans: Sequence[RequestPlan], pages: Iterable[list[SeriesResult]]
+) -> list[SeriesResult]:
+    """Combine the pages of *plans* into one result per series, in *codes* order.
+
+    Results of a series split across date ranges are concatenated in
+    range order.  Results for codes not in *codes* keep their relative
+    order after the known ones.
+    """
+    # Split series: code -> (position in results, combined result so far).
+    merged: dict[str, tuple[int, SeriesResult]] = {}
+    results: list[SeriesResult] = []
+    split = _split_codes(plans)
+    for page in pages:
+        for sr in page:
+            entry = merged.get(sr.SERIES_CODE) if sr.SERIES_CODE in split else None
+            if entry is None:
+                merged[sr.SERIES_CODE] = (len(results), sr)
+                results.append(sr)
+                continue
+            pos, first = entry
+            values = SeriesValues(
+                SURVEY_DATES=[*first.VALUES.SURVEY_DATES, *sr.VALUES.SURVEY_DATES],
+                VALUES=[*first.VALUES.VALUES, *sr.VALUES.VALUES],
+            )
+            combined = first.model_copy(update={"VALUES": values})
+            results[pos] = combined
+            merged[sr.SERIES_CODE] = (pos, combined)
+    order = {code: i for i, code in enumerate(codes)}
+    return sorted(results, key=lambda sr: order.get(sr.SERIES_CODE, len(order)))
+
+
+def complete_codes(
+    plans: Sequence[RequestPlan], pages: Sequence[list[SeriesResult]]
+) -> set[str]:
+    """Codes returned by every one of *plans* that requested them.
+
+    *pages* holds each plan's results, in plan order.  A series split
+    across date ranges whose requests partly failed is left out, so its
+    partial history is not mistaken for a full one.
+    """
+    arrived: dict[str, bool] = {}
+    for plan, page in zip(plans, pages, strict=True):
+        got = {sr.SERIES_CODE for sr in page}
+        for code in plan.codes:
+            arrived[code] = arrived.get(code, True) and code in got
+    return {code for code, ok in arrived.items() if ok}
+
+
+def clip_result(
+    sr: SeriesResult, start_date: str | None = None, end_date: str | None = None
+) -> SeriesResult:
+    """Keep the observations of *sr* within a requested date range.
+
+    Dates are in the API's request format for the series' frequency, as
+    for :func:`plan_requests`.  Series of unknown frequency are returned
+    unchanged.
+    """
+    unit_info = _unit_of(sr.FREQUENCY)
+    if unit_info is None or (start_date is None and end_date is None):
+        return sr
+    unit = unit_info[0]
+    lo = _ordinal(start_date, unit, end=False) or 0
+    hi = _ordinal(end_date, unit, end=True)
+    dates: list[int | str | None] = []
+    values: list[float | str | None] = []
+    for date, value in zip(sr.VALUES.SURVEY_DATES, sr.VALUES.VALUES, strict=False):
+        ordinal = _ordinal(None if date is None else str(date), unit, end=False)
+        if ordinal is None or ordinal < lo or (hi is not None and ordinal > hi):
+            continue
+        dates.append(date)
+        values.append(value)
+    return sr.model_copy(update={"VALUES": SeriesValues(SURVEY_DATES=dates, VALUES=values)})
+
+
+def clip_arrays(
+    arrays: SeriesArrays,
+    frequency: str | None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> SeriesArrays:
+    """Array counterpart of :func:`clip_result` for parsed observations.
+
+    Parsed survey dates keep the period number in their month, so each is
+    mapped to the same period index as its raw date.
+    """
+    unit_info = _unit_of(frequency)
+    if unit_info is None or (start_date is None and end_date is None):
+        return arrays
+    unit = unit_info[0]
+    per_year = _PER_YEAR[unit]
+    lo = _ordinal(start_date, unit, end=False) or 0
+    hi = _ordinal(end_date, unit, end=True)
+    year, month = np.divmod(arrays.dates.astype("datetime64[M]").astype(np.int64), 12)
+    year += 1970
+    ordinal = year if per_year == 1 else year * per_year + month
+    keep = ordinal >= lo
+    if per_year > 1:
+        keep &= month < per_year
+    if hi is not None:
+        keep &= ordinal <= hi
+    return SeriesArrays(arrays.dates[keep], arrays.values[keep], arrays.mask[keep])
+
+
+def _split_codes(plans: Sequence[RequestPlan]) -> set[str]:
+    seen: set[str] = set()
+    split: set[str] = set()
+    for plan in plans:
+        for code in plan.codes:
+            (split if code in seen else seen).add(code)
+    return split
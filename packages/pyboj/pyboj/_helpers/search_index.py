@@ -0,0 +1,292 @@
+"""Inverted full-text indexes over metadata records."""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from boj_ts_api import MetadataRecord
+from pydantic import TypeAdapter
+
+# Field weights for ranking: a hit on the series code outranks a hit on a
+# name, which outranks a hit on a category.
+_CODE, _NAME, _CATEGORY = 4.0, 2.0, 1.0
+# Multiplier for a query term that equals an indexed term rather than
+# being a strict prefix of it.
+_EXACT_BONUS = 2.0
+
+_WORD_RE = re.compile(r"[0-9a-z]+")
+# Runs of non-ASCII word characters (kanji, kana, full-width symbols that
+# survive NFKC); indexed as character uni- and bigrams.
+_CJK_RE = re.compile(r"[^\x00-\x7f\W]+")
+
+
+def _normalize(text: str) -> str:
+    """Fold width and case so ``ＵＳＤ`` and ``usd`` index identically."""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text)
+
+
+def _grams(run: str) -> list[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+class SearchIndex:
+    """Ranked keyword search over series code, names and categories.
+
+    English text and series codes are split into lowercase alphanumeric
+    terms; every query term must be a prefix of some term of the record,
+    so ``"exch"`` finds ``"Exchange Rate"`` and ``"usd/jpy"`` finds
+    ``"USD/JPY Spot"``.  Japanese text is indexed as character uni- and
+    bigrams and Japanese query fragments must occur verbatim.  Text is
+    NFKC-normalized, so full-width and half-width forms are equivalent.
+
+    Results are ordered by score, then metadata order.  A record scores
+    the sum, over query terms, of the weight of the best field the term
+    hits (code > name > category), doubled for whole-term matches.
+
+    Parameters
+    ----------
+    records:
+        Metadata records to index. Header rows (empty ``SERIES_CODE``) are
+        skipped.
+    """
+
+    def __init__(self, records: Iterable[MetadataRecord]) -> None:
+        self.records = [rec for rec in records if rec.SERIES_CODE]
+        self._terms: dict[str, dict[int, float]] = {}
+        self._grams: dict[str, dict[int, float]] = {}
+        self._japanese: list[str] = []
+        for i, rec in enumerate(self.records):
+            japanese: list[str] = []
+            for text, weight in (
+                (rec.SERIES_CODE, _CODE),
+                (rec.NAME_OF_TIME_SERIES, _NAME),
+                (rec.NAME_OF_TIME_SERIES_J, _NAME),
+                (rec.CATEGORY, _CATEGORY),
+                (rec.CATEGORY_J, _CATEGORY),
+            ):
+                if not text:
+                    continue
+                norm = _normalize(text)
+                for word in _words(norm):
+                    _post(self._terms, word, i, weight)
+                for run in _CJK_RE.findall(norm):
+                    japanese.append(run)
+                    for gram in (*run, *_grams(run)):
+                        _post(self._grams, gram, i, weight)
+            self._japanese.append("\n".join(japanese))
+        self._vocabulary = sorted(self._terms)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def search(self, query: str, limit: int | None = None) -> list[MetadataRecord]:
+        """Return records matching every term of *query*, best first.
+
+        An empty query (or one with no searchable characters) returns all
+        records in metadata order.
+        """
+        scores = self._score(query)
+        if scores is None:
+            found = self.records
+        else:
+            ranked = sorted(scores, key=lambda i: (-scores[i], i))
+            found = [self.records[i] for i in ranked]
+        return found[:limit] if limit is not None else list(found)
+
+    def scored(self, query: str) -> list[tuple[float, int, MetadataRecord]]:
+        """Return ``(score, position, record)`` for every match, unordered.
+
+        Used to merge rankings across indexes; an empty query scores every
+        record ``0.0``.
+        """
+        scores = self._score(query)
+        if scores is None:
+            return [(0.0, i, rec) for i, rec in enumerate(self.records)]
+        return [(s, i, self.records[i]) for i, s in scores.items()]
+
+    def _score(self, query: str) -> dict[int, float] | None:
+        """Map matching record positions to scores; ``None`` if *query* is empty."""
+        norm = _normalize(query)
+        scores: dict[int, float] | None = None
+        for word in _words(norm):
+            scores = _intersect(scores, self._prefix_hits(word))
+            if not scores:
+                return {}
+        for run in _CJK_RE.findall(norm):
+            hits: dict[int, float] = {}
+            for n, gram in enumerate(_grams(run)):
+                hits = _intersect(hits if n else None, self._grams.get(gram, {}), combine=min)
+                if not hits:
+                    return {}
+            # Bigrams can co-occur without forming the run; confirm it.
+            hits = {i: s for i, s in hits.items() if run in self._japanese[i]}
+            scores = _intersect(scores, hits)
+            if not scores:
+                return {}
+        return scores
+
+    def _prefix_hits(self, word: str) -> dict[int, float]:
+        hits: dict[int, float] = {}
+        vocab = self._vocabulary
+        pos = bisect_left(vocab, word)
+        while pos < len(vocab) and vocab[pos].startswith(word):
+            term = vocab[pos]
+            bonus = _EXACT_BONUS if term == word else 1.0
+            for i, weight in self._terms[term].items():
+                score = weight * bonus
+                if score > hits.get(i, 0.0):
+                    hits[i] = score
+            pos += 1
+        return hits
+
+
+_RECORDS = TypeAdapter(list[MetadataRecord])
+
+
+class GlobalSearchIndex:
+    """One search over the metadata of many databases.
+
+    Records are added per database as its metadata is loaded, and each
+    database's :class:`SearchIndex` is built the first time a search
+    touches it.  With a *directory*, every added database is also written
+    to ``<directory>/<db>.json`` and databases found there are loaded on
+    first use, so a later process can search everything indexed before
+    without downloading any metadata.  Metadata differs by language, so
+    use one directory per :class:`~pyboj.Lang`.
+
+    Parameters
+    ----------
+    directory:
+        Where to persist the index. ``None`` keeps it in memory only.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        self._dir = Path(directory).expanduser() if directory is not None else None
+        self._records: dict[str, list[MetadataRecord]] = {}
+        self._indexes: dict[str, SearchIndex] = {}
+        self._sources: dict[str, object] = {}
+        self._loaded = False
+        self._lock = threading.RLock()  # add() may run on prefetch worker threads
+
+    @property
+    def dbs(self) -> list[str]:
+        """Database codes currently indexed."""
+        with self._lock:
+            self._load()
+            return list(self._records)
+
+    def __contains__(self, db: object) -> bool:
+        with self._lock:
+            self._load()
+            return db in self._records
+
+    def add(self, db: str, records: Iterable[MetadataRecord], *, source: object = None) -> None:
+        """Index (or re-index) the metadata *records* of *db*.
+
+        When *source* is given and is the object the current entry for *db*
+        was added from, nothing is done, so callers can pass every metadata
+        lookup through cheaply.
+        """
+        if source is not None and self._sources.get(db) is source:
+            return
+        series = [rec for rec in records if rec.SERIES_CODE]
+        with self._lock:
+            self._load()
+            self._records[db] = series
+            self._indexes.pop(db, None)
+            self._sources[db] = source
+            if self._dir is not None:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                path = self._dir / f"{db}.json"
+                tmp = path.with_suffix(".json.tmp")
+                tmp.write_bytes(_RECORDS.dump_json(series, exclude_none=True))
+                os.replace(tmp, path)
+
+    def search(
+        self,
+        query: str,
+        dbs: Iterable[str] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[tuple[str, MetadataRecord]]:
+        """Return ``(db, record)`` hits for *query*, best first.
+
+        Scores are comparable across databases (see :class:`SearchIndex`);
+        ties keep database order, then metadata order.
+
+        Parameters
+        ----------
+        query:
+            Search string.
+        dbs:
+            Restrict the search to these database codes, in this order.
+            ``None`` searches every indexed database.
+        limit:
+            Maximum number of hits.
+        """
+        with self._lock:
+            self._load()
+            records = self._records
+            names = list(records) if dbs is None else [d for d in dbs if d in records]
+            indexes = [self._index(db) for db in names]
+        hits = [
+            (-score, n, pos, db, rec)
+            for n, (db, index) in enumerate(zip(names, indexes, strict=True))
+            for score, pos, rec in index.scored(query)
+        ]
+        hits.sort(key=lambda h: h[:3])
+        if limit is not None:
+            hits = hits[:limit]
+        return [(db, rec) for *_, db, rec in hits]
+
+    def _index(self, db: str) -> SearchIndex:
+        index = self._indexes.get(db)
+        if index is None:
+            index = self._indexes[db] = SearchIndex(self._records[db])
+        return index
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._dir is None:
+            return
+        for path in sorted(self._dir.glob("*.json")):
+            try:
+                records = _RECORDS.validate_json(path.read_bytes())
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)  # unreadable or corrupt entry
+                continue
+            self._records.setdefault(path.stem, records)
+
+
+def _post(postings: dict[str, dict[int, float]], key: str, i: int, weight: float) -> None:
+    docs = postings.setdefault(key, {})
+    if weight > docs.get(i, 0.0):
+        docs[i] = weight
+
+
+def _intersect(
+    acc: dict[int, float] | None,
+    hits: dict[int, float],
+    combine: Callable[[float, float], float] | None = None,
+) -> dict[int, float]:
+    """Keep records present in both maps, summing (or *combine*-ing) scores."""
+    if acc is None:
+        return dict(hits)
+    op = combine or (lambda a, b: a + b)
+    if len(hits) < len(acc):
+        return {i: op(acc[i], s) for i, s in hits.items() if i in acc}
+    return {i: op(s, hits[i]) for i, s in acc.items() if i in hits}
@@ -0,0 +1,181 @@
+"""Delta planning and merging for :meth:`BOJ.sync`."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from boj_ts_api import MetadataRecord, SeriesResult, SeriesValues
+
+from pyboj._helpers.planner import (
+    RequestPlan,
+    _format,
+    _ordinal,
+    _unit_of,
+    assemble_results,
+    complete_codes,
+    plan_requests,
+)
+from pyboj._store import SeriesStore
+from pyboj._utils import parse_last_update
+
+# Periods (months for daily/weekly/monthly series, else quarters, halves or
+# years) before the last stored observation that a sync re-fetches, to
+# pick up revisions of recent values.
+DEFAULT_SYNC_WINDOW = 12
+
+
+@dataclass(frozen=True)
+class SyncReport:
+    """What :meth:`BOJ.sync` did.
+
+    Attributes
+    ----------
+    added:
+        Codes fetched in full because the store did not have them.
+    updated:
+        Codes whose trailing window was re-fetched because ``LAST_UPDATE``
+        advanced.
+    unchanged:
+        Codes skipped because the stored copy is current.
+    failed:
+        Codes that were due but did not arrive (their requests failed and
+        were logged); they are retried on the next sync.
+    """
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SyncPlan:
+    """Requests needed to bring a store up to date, and how to merge them."""
+
+    plans: list[RequestPlan]
+    records: dict[str, MetadataRecord]
+    # code -> first re-fetched period (unit, ordinal); absent for full fetches
+    cutoffs: dict[str, tuple[str, int]]
+    added: list[str]
+    updated: list[str]
+    unchanged: list[str]
+
+
+def plan_sync(
+    db: str,
+    records: Iterable[MetadataRecord],
+    store: SeriesStore,
+    window: int = DEFAULT_SYNC_WINDOW,
+) -> SyncPlan:
+    """Compare fresh metadata with *store* and plan the requests to refresh it.
+
+    A series is due when the store lacks it, or when the metadata's
+    ``LAST_UPDATE`` is later than the stored one (or either is unknown).
+    Stored series are re-fetched from *window* periods before their last
+    stored observation; the rest are fetched in full.
+    """
+    full: list[MetadataRecord] = []
+    partial: dict[tuple[str, str], list[MetadataRecord]] = {}
+    by_code: dict[str, MetadataRecord] = {}
+    cutoffs: dict[str, tuple[str, int]] = {}
+    added: list[str] = []
+    updated: list[str] = []
+    unchanged: list[str] = []
+    for rec in records:
+        code = rec.SERIES_CODE
+        if not code:
+            continue
+        by_code[code] = rec
+        stored = store.state(db, code)
+        if stored is None:
+            full.append(rec)
+            added.append(code)
+            continue
+        fresh = parse_last_update(rec.LAST_UPDATE)
+        known = parse_last_update(stored.last_update)
+        if fresh is not None and known is not None and fresh <= known:
+            unchanged.append(code)
+            continue
+        updated.append(code)
+        cutoff = _cutoff(rec, stored.last_date, window)
+        if cutoff is None:
+            full.append(rec)
+            continue
+        cutoffs[code] = cutoff
+        unit, start = cutoff
+        partial.setdefault(((rec.FREQUENCY or "").upper(), _format(start, unit)), []).append(rec)
+
+    plans = plan_requests(full)
+    for (_, start_date), recs in partial.items():
+        plans.extend(plan_requests(recs, start_date=start_date))
+    return SyncPlan(plans, by_code, cutoffs, added, updated, unchanged)
+
+
+def _cutoff(
+    rec: MetadataRecord, last_date: int | str | None, window: int
+) -> tuple[str, int] | None:
+    """First period to re-fetch after *last_date*, or ``None`` to fetch in full."""
+    unit_info = _unit_of(rec.FREQUENCY)
+    if unit_info is None or last_date is None:
+        return None
+    unit = unit_info[0]
+    last = _ordinal(str(last_date), unit, end=False)
+    if last is None:
+        return None
+    return unit, last - max(0, window)
+
+
+def apply_sync(
+    db: str,
+    sync: SyncPlan,
+    store: SeriesStore,
+    pages: Sequence[list[SeriesResult]],
+) -> SyncReport:
+    """Merge fetched *pages* (one per plan, in order) into *store* and report the outcome.
+
+    A series counts as failed unless every request covering it succeeded.
+    """
+    due = [*sync.added, *sync.updated]
+    results = assemble_results(due, sync.plans, pages)
+    complete = complete_codes(sync.plans, pages)
+    merged: list[SeriesResult] = []
+    for sr in results:
+        rec = sync.records.get(sr.SERIES_CODE)
+        if rec is None or sr.SERIES_CODE not in complete:
+            continue
+        cutoff = sync.cutoffs.get(sr.SERIES_CODE)
+        stored = store.get(db, sr.SERIES_CODE) if cutoff is not None else None
+        if stored is not None and cutoff is not None:
+            sr = _splice(stored, sr, *cutoff)
+        if sr.LAST_UPDATE is None:
+            sr = sr.model_copy(update={"LAST_UPDATE": rec.LAST_UPDATE})
+        merged.append(sr)
+    store.put(db, merged)
+    arrived = {sr.SERIES_CODE for sr in merged}
+    return SyncReport(
+        added=[c for c in sync.added if c in arrived],
+        updated=[c for c in sync.updated if c in arrived],
+        unchanged=list(sync.unchanged),
+        failed=[c for c in due if c not in arrived],
+    )
+
+
+def _splice(stored: SeriesResult, fresh: SeriesResult, unit: str, cutoff: int) -> SeriesResult:
+    """Stored observations before *cutoff* followed by the fresh ones."""
+    dates: list[int | str | None] = []
+    values: list[float | str | None] = []
+    for date, value in zip(stored.VALUES.SURVEY_DATES, stored.VALUES.VALUES, strict=False):
+        ordinal = _ordinal(None if date is None else str(date), unit, end=False)
+        if ordinal is not None and ordinal < cutoff:
+            dates.append(date)
+            values.append(value)
+    return fresh.model_copy(
+        update={
+            "VALUES": SeriesValues(
+                SURVEY_DATES=[*dates, *fresh.VALUES.SURVEY_DATES],
+                VALUES=[*values, *fresh.VALUES.VALUES],
+            )
+        }
+    )
+
@@ -0,0 +1,72 @@
+"""Columnar NumPy representation of series observations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pyboj._parsing.dates import parse_survey_dates_array
+
+if TYPE_CHECKING:
+    from boj_ts_api import SeriesValues
+
+
+@dataclass(frozen=True)
+class SeriesArrays:
+    """Aligned observation arrays for one series.
+
+    Observations whose survey date is ``None`` are dropped, matching
+    :attr:`Series.dates <pyboj._domains._base.Series.dates>`.
+
+    Attributes
+    ----------
+    dates:
+        ``datetime64[D]`` survey dates.
+    values:
+        ``float64`` values; missing or non-numeric entries are ``NaN``.
+    mask:
+        ``True`` where the value is missing or non-numeric.
+    """
+
+    dates: np.ndarray
+    values: np.ndarray
+    mask: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def _values_array(raw_values: list[float | str | None]) -> np.ndarray:
+    """Convert raw values to ``float64``; ``None`` and strings become ``NaN``."""
+    arr = np.asarray(raw_values)
+    if arr.dtype.kind == "f":  # all numeric, nothing missing
+        return arr.astype(np.float64, copy=False)
+    return np.fromiter(
+        (v if v.__class__ is float else np.nan for v in raw_values),
+        dtype=np.float64,
+        count=len(raw_values),
+    )
+
+
+def series_arrays(values: SeriesValues) -> SeriesArrays:
+    """Build :class:`SeriesArrays` from a :class:`~boj_ts_api.SeriesValues`."""
+    raw_dates = values.SURVEY_DATES
+    raw_values = values.VALUES
+    n = min(len(raw_dates), len(raw_values))
+    if len(raw_dates) != n:
+        raw_dates = raw_dates[:n]
+    if len(raw_values) != n:
+        raw_values = raw_values[:n]
+
+    dates = parse_survey_dates_array(raw_dates)
+    vals = _values_array(raw_values)
+    keep = ~np.isnat(dates)
+    if not keep.all():
+        dates = dates[keep]
+        vals = vals[keep]
+    mask = np.isnan(vals)
+    for arr in (dates, vals, mask):
+        arr.flags.writeable = False
+    return SeriesArrays(dates=dates, values=vals, mask=mask)
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import datetime
+import functools
+from collections.abc import Sequence
+
+import numpy as np
 
 
 def parse_survey_date(raw: int | str) -> datetime.date:
@@ -51,10 +55,80 @@ def parse_survey_dates(
 ) -> list[datetime.date | None]:
     """Parse a list of BOJ survey dates.
 
+    Uses the vectorised :func:`parse_survey_dates_array` under the hood.
+
     Parameters
     ----------
     raw_dates:
         List of raw survey date values from :pyattr:`SeriesValues.SURVEY_DATES`.
         ``None`` entries are preserved as ``None`` in the output.
     """
-    return [parse_survey_date(d) if d is not None else None for d in raw_dates]
+    return parse_survey_dates_array(raw_dates).tolist()
+
+
+# Series of the same frequency from one database usually share their whole
+# date vector, so parsed calendars are memoised by their raw contents.
+_CALENDAR_MEMO_SIZE = 256
+
+
+def parse_survey_dates_array(
+    raw_dates: Sequence[int | str | None] | np.ndarray,
+) -> np.ndarray:
+    """Vectorised :func:`parse_survey_dates` returning a ``datetime64[D]`` array.
+
+    Formats and caveats are those of :func:`parse_survey_date`; ``None``
+    entries become ``NaT``.  Results for lists are memoised (the last
+    256 distinct date vectors) and returned read-only, so series sharing
+    a calendar share one array.  Integer arrays are parsed directly.
+
+    Raises
+    ------
+    ValueError
+        If any entry does not match a supported format or is not a valid date.
+    """
+    if isinstance(raw_dates, np.ndarray) and raw_dates.dtype.kind in "iu":
+        return _codes_to_datetime64(raw_dates.astype(np.int64, copy=False))
+    return _parse_calendar(tuple(raw_dates))
+
+
+@functools.lru_cache(maxsize=_CALENDAR_MEMO_SIZE)
+def _parse_calendar(raw_dates: tuple[int | str | None, ...]) -> np.ndarray:
+    try:
+        codes = np.array(raw_dates, dtype=np.int64)  # common case: ints, no gaps
+    except (TypeError, ValueError, OverflowError):
+        codes = None
+    if codes is not None:
+        out = _codes_to_datetime64(codes)
+    else:
+        numeric = np.array(
+            [np.nan if d is None else float(int(d)) for d in raw_dates], dtype=np.float64
+        )
+        present = ~np.isnan(numeric)
+        out = np.full(len(numeric), np.datetime64("NaT"), dtype="datetime64[D]")
+        out[present] = _codes_to_datetime64(numeric[present].astype(np.int64))
+    out.flags.writeable = False
+    return out
+
+
+def _codes_to_datetime64(codes: np.ndarray) -> np.ndarray:
+    """Convert ``YYYYMMDD`` / ``YYYYMM`` / ``YYYY`` integers to ``datetime64[D]``."""
+    daily = (codes >= 10_000_000) & (codes < 100_000_000)
+    monthly = (codes >= 100_000) & (codes < 1_000_000)
+    annual = (codes >= 1_000) & (codes < 10_000)
+    bad = ~(daily | monthly | annual)
+    if bad.any():
+        msg = f"Cannot parse survey date: {int(codes[bad][0])!r} (expected 4, 6, or 8 digits)"
+        raise ValueError(msg)
+
+    year = np.where(daily, codes // 10_000, np.where(monthly, codes // 100, codes))
+    month = np.where(daily, codes // 100 % 100, np.where(monthly, codes % 100, 1))
+    day = np.where(daily, codes % 100, 1)
+    if ((month < 1) | (month > 12)).any():
+        raise ValueError("month must be in 1..12")
+
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    first = months.astype("datetime64[D]")
+    month_len = ((months + 1).astype("datetime64[D]") - first).astype(np.int64)
+    if ((day < 1) | (day > month_len)).any():
+        raise ValueError("day is out of range for month")
+    return first + (day - 1)
@@ -104,7 +104,8 @@ def plot_series(
             label = s.name_jp or s.name or s.series_code
         else:
             label = s.name or s.series_code
-        ax.plot(s.dates, s.values, label=label, **kwargs)
+        arrays = s.arrays
+        ax.plot(arrays.dates, arrays.values, label=label, **kwargs)
 
     # Auto labels for single series
     if len(series) == 1:
@@ -0,0 +1,501 @@
+"""Local series stores used by :meth:`BOJ.sync` and read-through fetches."""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+from boj_ts_api import SeriesResult, SeriesValues
+
+from pyboj._domains._base import Series
+from pyboj._parsing.arrays import SeriesArrays, _values_array
+from pyboj._parsing.dates import parse_survey_dates_array
+
+_T = TypeVar("_T", bound=Series)
+
+
+@dataclass(frozen=True)
+class StoredState:
+    """What :meth:`BOJ.sync` needs to know about a stored series.
+
+    Attributes
+    ----------
+    last_update:
+        The stored ``LAST_UPDATE``.
+    last_date:
+        The last stored survey date, or ``None`` if no observation has one.
+    """
+
+    last_update: int | str | None
+    last_date: int | str | None
+
+
+class SeriesStore(ABC):
+    """Interface for keeping a local copy of series data.
+
+    Entries are :class:`~boj_ts_api.SeriesResult` objects keyed by database
+    and series code; their ``LAST_UPDATE`` tells :meth:`BOJ.sync` whether
+    the series changed upstream.  Implement this to sync into a custom
+    backend.
+    """
+
+    @abstractmethod
+    def get(self, db: str, code: str) -> SeriesResult | None:
+        """Return the stored series, or ``None`` if it is not stored."""
+
+    @abstractmethod
+    def put(self, db: str, results: Iterable[SeriesResult]) -> None:
+        """Store *results*, replacing any stored series with the same code."""
+
+    @abstractmethod
+    def codes(self, db: str) -> list[str]:
+        """Return the codes stored for *db*."""
+
+    def load(
+        self, db: str, codes: Iterable[str] | None = None, wrapper: type[_T] = Series
+    ) -> list[_T]:
+        """Wrap stored series in *wrapper*, in *codes* order (default: all).
+
+        Unknown codes are skipped.  The default wraps :meth:`get` results;
+        columnar stores hand over their buffers instead.
+        """
+        wanted = self.codes(db) if codes is None else codes
+        return [wrapper(sr) for code in wanted if (sr := self.get(db, code)) is not None]
+
+    def state(self, db: str, code: str) -> StoredState | None:
+        """Return the stored ``LAST_UPDATE`` and last survey date, or ``None``.
+
+        The default reads the series with :meth:`get`; override it when the
+        backend can answer without loading the observations.
+        """
+        stored = self.get(db, code)
+        if stored is None:
+            return None
+        dates = stored.VALUES.SURVEY_DATES
+        last = next((date for date in reversed(dates) if date is not None), None)
+        return StoredState(last_update=stored.LAST_UPDATE, last_date=last)
+
+
+class MemorySeriesStore(SeriesStore):
+    """In-process series store."""
+
+    def __init__(self) -> None:
+        self._series: dict[str, dict[str, SeriesResult]] = {}
+
+    def get(self, db: str, code: str) -> SeriesResult | None:
+        return self._series.get(db, {}).get(code)
+
+    def put(self, db: str, results: Iterable[SeriesResult]) -> None:
+        entries = self._series.setdefault(db, {})
+        for sr in results:
+            entries[sr.SERIES_CODE] = sr
+
+    def codes(self, db: str) -> list[str]:
+        return list(self._series.get(db, {}))
+
+
+# Columns of the per-database sidecar table: every SeriesResult field but VALUES.
+_SERIES_COLUMNS = (
+    "SERIES_CODE",
+    "NAME_OF_TIME_SERIES_J",
+    "NAME_OF_TIME_SERIES",
+    "UNIT_J",
+    "UNIT",
+    "FREQUENCY",
+    "CATEGORY_J",
+    "CATEGORY",
+    "LAST_UPDATE",
+)
+
+
+def _import_arrow() -> tuple[Any, Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for ParquetSeriesStore. "
+            "Install it with: pip install pyboj[store]"
+        ) from None
+    return pa, pc, pq
+
+
+def _partition(frequency: str | None) -> str:
+    """File name stem for a response FREQUENCY, e.g. ``"WEEKLY(MON)"`` -> ``"WEEKLY_MON"``."""
+    return re.sub(r"[^0-9A-Za-z]+", "_", frequency or "").strip("_").upper() or "UNKNOWN"
+
+
+def _survey_date(value: int | str | None) -> int | None:
+    digits = "".join(ch for ch in str(value if value is not None else "") if ch.isdigit())
+    return int(digits) if digits else None
+
+
+def _text(value: int | str | None) -> str | None:
+    return None if value is None else str(value)
+
+
+def _last_update(value: str | None) -> int | str | None:
+    return int(value) if value is not None and value.isdigit() else value
+
+
+def _values_table(
+    codes: list[str], dates: list[int | None], values: list[float | str | None]
+) -> Any:
+    pa, _, _ = _import_arrow()
+    # Coerced as for fetched series, so store hits return the same values.
+    observations = _values_array(values)
+    return pa.table({
+        "SERIES_CODE": pa.array(codes, type=pa.string()),
+        "SURVEY_DATE": pa.array(dates, type=pa.int64()),
+        "DATE": pa.array(_days(dates)),
+        "VALUE": pa.array(observations),
+    })
+
+
+def _days(dates: list[int | None]) -> np.ndarray:
+    """Parsed survey dates as ``int64`` days since the epoch (``NaT`` for unparseable)."""
+    try:
+        parsed = parse_survey_dates_array(dates)
+    except ValueError:
+        parsed = np.array(
+            [_date_or_nat(date) for date in dates], dtype="datetime64[D]"
+        )
+    return parsed.astype("datetime64[D]").view(np.int64)
+
+
+def _date_or_nat(date: int | None) -> np.datetime64:
+    try:
+        return parse_survey_dates_array([date])[0]
+    except ValueError:
+        return np.datetime64("NaT")
+
+
+def _column_array(column: Any) -> np.ndarray:
+    """NumPy view of a sliced column; copies only if the slice spans chunks."""
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _row_index(table: Any) -> dict[str, tuple[int, int]]:
+    """Map each SERIES_CODE to the (offset, length) of its contiguous rows."""
+    if table.num_rows == 0:
+        return {}
+    encoded = table.column("SERIES_CODE").combine_chunks().dictionary_encode()
+    ids = encoded.indices.to_numpy(zero_copy_only=False)
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)]
+    names = encoded.dictionary.to_pylist()
+    return {
+        names[ids[start]]: (int(start), int(end - start))
+        for start, end in zip(starts, ends, strict=True)
+    }
+
+
+class _ColumnarSeriesStore(SeriesStore):
+    """Shared layout and logic of the Parquet and Arrow IPC stores."""
+
+    _suffix: str
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        _import_arrow()
+        self._dir = Path(directory).expanduser()
+        self._loaded: dict[Path, tuple[tuple[int, int], Any, dict[str, tuple[int, int]]]] = {}
+        # Serialises writes and guards _loaded; reentrant because put() reads.
+        self._lock = threading.RLock()
+
+    @abstractmethod
+    def _load_table(self, path: Path) -> Any:
+        """Read the table stored at *path*."""
+
+    @abstractmethod
+    def _dump_table(self, table: Any, path: Path) -> None:
+        """Write *table* to *path*."""
+
+    def _series_path(self, db: str) -> Path:
+        return self._dir / db / f"series{self._suffix}"
+
+    def _values_path(self, db: str, frequency: str | None) -> Path:
+        return self._dir / db / "values" / f"{_partition(frequency)}{self._suffix}"
+
+    def _read(self, path: Path) -> tuple[Any, dict[str, tuple[int, int]]] | None:
+        """Return the table at *path* and its row index, or ``None`` if absent."""
+        with self._lock:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                self._loaded.pop(path, None)
+                return None
+            key = (stat.st_mtime_ns, stat.st_size)
+            loaded = self._loaded.get(path)
+            if loaded is None or loaded[0] != key:
+                table = self._load_table(path)
+                loaded = (key, table, _row_index(table))
+                self._loaded[path] = loaded
+            return loaded[1], loaded[2]
+
+    def _write(self, path: Path, table: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f"{self._suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+        # One chunk per file, so every series' rows are one contiguous buffer.
+        self._dump_table(table.combine_chunks(), tmp)
+        with self._lock:
+            os.replace(tmp, path)
+            self._loaded.pop(path, None)
+
+    def get(self, db: str, code: str) -> SeriesResult | None:
+        series = self._read(self._series_path(db))
+        if series is None or code not in series[1]:
+            return None
+        table, index = series
+        fields = table.slice(index[code][0], 1).to_pylist()[0]
+        fields["LAST_UPDATE"] = _last_update(fields["LAST_UPDATE"])
+        dates: list[int | str | None] = []
+        values: list[float | str | None] = []
+        partition = self._read(self._values_path(db, fields["FREQUENCY"]))
+        if partition is not None and code in partition[1]:
+            rows = partition[0].slice(*partition[1][code])
+            dates = rows.column("SURVEY_DATE").to_pylist()
+            values = [None if v is None or v != v else v for v in rows.column("VALUE").to_pylist()]
+        return SeriesResult(**fields, VALUES=SeriesValues(SURVEY_DATES=dates, VALUES=values))
+
+    def put(self, db: str, results: Iterable[SeriesResult]) -> None:
+        latest = {sr.SERIES_CODE: sr for sr in results}
+        if not latest:
+            return
+        # Each put rewrites whole files from their current contents.
+        with self._lock:
+            self._put(db, latest)
+
+    def _put(self, db: str, latest: dict[str, SeriesResult]) -> None:
+        pa, pc, _ = _import_arrow()
+        replaced = pa.array(list(latest), type=pa.string())
+
+        def keep(path: Path) -> list[Any]:
+            current = self._read(path)
+            if current is None:
+                return []
+            table = current[0]
+            return [table.filter(pc.invert(pc.is_in(table["SERIES_CODE"], value_set=replaced)))]
+
+        # Rewrite the partitions the new series go to, and those they leave.
+        partitions: dict[Path, list[SeriesResult]] = {}
+        for sr in latest.values():
+            partitions.setdefault(self._values_path(db, sr.FREQUENCY), []).append(sr)
+        series_path = self._series_path(db)
+        current = self._read(series_path)
+        if current is not None:
+            frequency = current[0].column("FREQUENCY")
+            for code in latest.keys() & current[1].keys():
+                old = frequency[current[1][code][0]].as_py()
+                partitions.setdefault(self._values_path(db, old), [])
+
+        for path, members in partitions.items():
+            codes: list[str] = []
+            dates: list[int | None] = []
+            values: list[float | str | None] = []
+            for sr in members:
+                pairs = list(zip(sr.VALUES.SURVEY_DATES, sr.VALUES.VALUES, strict=False))
+                codes.extend([sr.SERIES_CODE] * len(pairs))
+                dates.extend(_survey_date(date) for date, _ in pairs)
+                values.extend(value for _, value in pairs)
+            fresh = _values_table(codes, dates, values)
+            self._write(path, pa.concat_tables([*keep(path), fresh]))
+
+        attributes = pa.table({
+            name: pa.array(
+                [_text(getattr(sr, name)) for sr in latest.values()], type=pa.string()
+            )
+            for name in _SERIES_COLUMNS
+        })
+        self._write(series_path, pa.concat_tables([*keep(series_path), attributes]))
+
+    def codes(self, db: str) -> list[str]:
+        series = self._read(self._series_path(db))
+        return [] if series is None else list(series[1])
+
+    def state(self, db: str, code: str) -> StoredState | None:
+        # LAST_UPDATE from the sidecar and one survey date from the
+        # partition, instead of rebuilding the whole series.
+        series = self._read(self._series_path(db))
+        if series is None or code not in series[1]:
+            return None
+        table, index = series
+        row = index[code][0]
+        last_update = _last_update(table.column("LAST_UPDATE")[row].as_py())
+        frequency = table.column("FREQUENCY")[row].as_py()
+        return StoredState(last_update=last_update, last_date=self._last_date(db, frequency, code))
+
+    def _last_date(self, db: str, frequency: str | None, code: str) -> int | None:
+        partition = self._read(self._values_path(db, frequency))
+        if partition is None or code not in partition[1]:
+            return None
+        offset, length = partition[1][code]
+        dates = partition[0].column("SURVEY_DATE")
+        for row in range(offset + length - 1, offset - 1, -1):
+            date = dates[row].as_py()
+            if date is not None:
+                return date
+        return None
+
+    def frequencies(self, db: str) -> list[str]:
+        """Return the distinct ``FREQUENCY`` values stored for *db*."""
+        series = self._read(self._series_path(db))
+        if series is None:
+            return []
+        return list(dict.fromkeys(series[0].column("FREQUENCY").to_pylist()))
+
+    def table(self, db: str, frequency: str | None = None) -> Any:
+        """Return stored observations as a long-form :class:`pyarrow.Table`.
+
+        Columns are ``SERIES_CODE``, ``SURVEY_DATE`` and ``VALUE``; rows of
+        one series are contiguous and in the order they were stored.  Pass a response
+        ``FREQUENCY`` (e.g. ``"MONTHLY"``) to read a single partition.
+        """
+        pa, _, _ = _import_arrow()
+        wanted = [frequency] if frequency is not None else self.frequencies(db)
+        tables = [
+            loaded[0]
+            for path in dict.fromkeys(self._values_path(db, f) for f in wanted)
+            if (loaded := self._read(path)) is not None
+        ]
+        return pa.concat_tables(tables) if tables else _values_table([], [], [])
+
+    def arrays(self, db: str, code: str) -> SeriesArrays | None:
+        """Return a stored series' observations as NumPy views, or ``None``.
+
+        ``dates`` and ``values`` view the loaded column buffers (for
+        :class:`ArrowSeriesStore`, the memory-mapped file itself); no
+        Python objects are created per observation.
+        """
+        series = self._read(self._series_path(db))
+        if series is None or code not in series[1]:
+            return None
+        table, index = series
+        frequency = table.column("FREQUENCY")[index[code][0]].as_py()
+        return self._arrays(db, frequency, code)
+
+    def _arrays(self, db: str, frequency: str | None, code: str) -> SeriesArrays:
+        partition = self._read(self._values_path(db, frequency))
+        if partition is None or code not in partition[1]:
+            empty = np.empty(0)
+            return SeriesArrays(empty.astype("datetime64[D]"), empty, empty.astype(bool))
+        rows = partition[0].slice(*partition[1][code])
+        dates = _column_array(rows.column("DATE")).view("datetime64[D]")
+        values = _column_array(rows.column("VALUE"))
+        if values.dtype != np.float64:  # nullable VALUE column
+            values = values.astype(np.float64)
+        keep = ~np.isnat(dates)
+        if not keep.all():
+            dates, values = dates[keep], values[keep]
+        mask = np.isnan(values)
+        for arr in (dates, values, mask):
+            arr.flags.writeable = False
+        return SeriesArrays(dates=dates, values=values, mask=mask)
+
+    def load(
+        self, db: str, codes: Iterable[str] | None = None, wrapper: type[_T] = Series
+    ) -> list[_T]:
+        """Wrap stored series without materialising their observations.
+
+        Each wrapper gets its attributes from the sidecar table and its
+        :attr:`~pyboj.Series.arrays` from :meth:`arrays`, so ``values``,
+        ``to_dataframe(copy=False)`` and friends read the stored buffers.
+
+        Parameters
+        ----------
+        db:
+            Database key, e.g. ``"FM08"``.
+        codes:
+            Codes to load, in order; unknown codes are skipped. Default:
+            every stored series.
+        wrapper:
+            Domain wrapper class, e.g. :class:`~pyboj.ExchangeRate`.
+        """
+        series = self._read(self._series_path(db))
+        if series is None:
+            return []
+        table, index = series
+        wanted = list(index) if codes is None else [c for c in codes if c in index]
+        rows = table.to_pylist()
+        loaded: list[_T] = []
+        for code in wanted:
+            fields = rows[index[code][0]]
+            fields["LAST_UPDATE"] = _last_update(fields["LAST_UPDATE"])
+            attributes = SeriesResult.model_construct(**fields)
+            loaded.append(
+                wrapper.from_arrays(attributes, self._arrays(db, fields["FREQUENCY"], code))
+            )
+        return loaded
+
+
+class ParquetSeriesStore(_ColumnarSeriesStore):
+    """Persistent columnar series store backed by Parquet files.
+
+    Observations are partitioned by database and frequency, with series
+    attributes in a sidecar table::
+
+        <directory>/<db>/series.parquet              one row per series
+        <directory>/<db>/values/<FREQUENCY>.parquet  SERIES_CODE, SURVEY_DATE, DATE, VALUE
+
+    Survey dates are stored both raw and parsed (days since the epoch),
+    and values as ``float64`` with ``NaN`` for missing or non-numeric
+    entries.  Files are memory-mapped on read and kept, with a per-code
+    row index, until they change on disk, so repeated lookups do not
+    re-read them.  Writes rewrite the affected files atomically and are
+    serialised per instance, so threads may share one store; use one
+    instance per directory.  Requires pyarrow (``pip install pyboj[store]``).
+
+    Parameters
+    ----------
+    directory:
+        Store directory. Created on first write.
+    """
+
+    _suffix = ".parquet"
+
+    def _load_table(self, path: Path) -> Any:
+        _, _, pq = _import_arrow()
+        return pq.read_table(path, memory_map=True)
+
+    def _dump_table(self, table: Any, path: Path) -> None:
+        _, _, pq = _import_arrow()
+        pq.write_table(table, path)
+
+
+class ArrowSeriesStore(_ColumnarSeriesStore):
+    """Series store backed by uncompressed Arrow IPC files, read zero-copy.
+
+    Same layout and API as :class:`ParquetSeriesStore`, with ``.arrow``
+    files.  Parquet must be decoded into memory; these files are
+    memory-mapped and used in place, so :meth:`arrays` and :meth:`load`
+    return NumPy views straight into the page cache.  Workers loading
+    thousands of stored series share those pages instead of each holding
+    its own copy.  Files are larger than Parquet.  Requires pyarrow
+    (``pip install pyboj[store]``).
+
+    Parameters
+    ----------
+    directory:
+        Store directory. Created on first write.
+    """
+
+    _suffix = ".arrow"
+
+    def _load_table(self, path: Path) -> Any:
+        pa, _, _ = _import_arrow()
+        with pa.memory_map(str(path)) as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def _dump_table(self, table: Any, path: Path) -> None:
+        pa, _, _ = _import_arrow()
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
@@ -38,3 +38,38 @@ def frequency_matches(response_freq: str | None, request_freq: Frequency) -> boo
     if request_freq in _PREFIX_MATCH:
         return upper.startswith(expected)
     return upper == expected
+
+
+# The BOJ API rejects overly long URLs.  We cap the comma-separated ``code``
+# parameter at 1000 characters to leave room for the rest of the URL.
+MAX_CODE_PARAM_LENGTH = 1000
+
+
+def batch_codes(codes: list[str], max_len: int = MAX_CODE_PARAM_LENGTH) -> list[list[str]]:
+    """Split series codes into batches whose joined length stays under *max_len*.
+
+    The order of *codes* is preserved both across and within batches.
+    """
+    batches: list[list[str]] = []
+    cur_len = 0
+    for code in codes:
+        added_len = len(code) + (1 if batches and batches[-1] else 0)  # comma separator
+        if not batches or (batches[-1] and cur_len + added_len > max_len):
+            batches.append([])
+            cur_len = 0
+            added_len = len(code)
+        batches[-1].append(code)
+        cur_len += added_len
+    return batches
+
+
+def parse_last_update(value: int | str | None) -> int | None:
+    """Normalise a BOJ ``LAST_UPDATE`` value (e.g. ``20250520``) to a comparable int.
+
+    Non-digit characters are ignored, so ``"2025/05/20"`` and ``20250520``
+    compare equal.  Returns ``None`` when no date is present.
+    """
+    if value is None:
+        return None
+    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    return int(digits) if digits else None
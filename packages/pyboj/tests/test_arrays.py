@@ -0,0 +1,102 @@
+"""Tests for the columnar SeriesArrays representation."""
+
+from __future__ import annotations
+
+import datetime
+
+import numpy as np
+import pytest
+from boj_ts_api import SeriesResult, SeriesValues
+from pyboj import Series, SeriesArrays
+from pyboj._parsing.arrays import series_arrays
+
+
+def _series(dates: list, values: list) -> Series:
+    return Series(
+        SeriesResult.model_validate(
+            {"SERIES_CODE": "TEST01", "VALUES": {"SURVEY_DATES": dates, "VALUES": values}}
+        )
+    )
+
+
+class TestSeriesArrays:
+    def test_dtypes(self):
+        arrays = series_arrays(SeriesValues(SURVEY_DATES=[20240104], VALUES=[1.5]))
+        assert isinstance(arrays, SeriesArrays)
+        assert arrays.dates.dtype == np.dtype("datetime64[D]")
+        assert arrays.values.dtype == np.float64
+        assert arrays.mask.dtype == np.bool_
+
+    def test_missing_and_non_numeric_masked(self):
+        arrays = series_arrays(
+            SeriesValues(SURVEY_DATES=[2021, 2022, 2023], VALUES=[1.0, None, "ND"])
+        )
+        assert arrays.mask.tolist() == [False, True, True]
+        assert np.isnan(arrays.values[1:]).all()
+
+    def test_none_dates_dropped(self):
+        arrays = series_arrays(
+            SeriesValues(SURVEY_DATES=[20240104, None, 20240106], VALUES=[1.0, 2.0, 3.0])
+        )
+        assert len(arrays) == 2
+        assert arrays.values.tolist() == [1.0, 3.0]
+
+    def test_length_mismatch_truncates(self):
+        arrays = series_arrays(SeriesValues(SURVEY_DATES=[2021, 2022], VALUES=[1.0]))
+        assert len(arrays) == 1
+
+    def test_read_only(self):
+        arrays = series_arrays(SeriesValues(SURVEY_DATES=[2021], VALUES=[1.0]))
+        with pytest.raises(ValueError):
+            arrays.values[0] = 2.0
+
+
+class TestSeriesUsesArrays:
+    def test_values_and_dates(self):
+        s = _series([20240104, None, 20240106, 20240107], [1.0, 2.0, None, "x"])
+        assert s.dates == [
+            datetime.date(2024, 1, 4),
+            datetime.date(2024, 1, 6),
+            datetime.date(2024, 1, 7),
+        ]
+        assert s.values == [1.0, None, None]
+
+    def test_to_dataframe_copy(self):
+        s = _series([20240104, 20240105], [1.0, None])
+        df = s.to_dataframe()
+        df.iloc[0, 0] = 9.0
+        assert s.arrays.values[0] == 1.0
+        assert np.isnan(df["value"].iloc[1])
+
+    def test_to_dataframe_view(self):
+        s = _series([20240104, 20240105], [1.0, 2.0])
+        df = s.to_dataframe(copy=False)
+        assert df["value"].tolist() == [1.0, 2.0]
+        assert df.index.name == "date"
+
+
+class TestMemoization:
+    def test_parsed_once(self, monkeypatch):
+        import pyboj._domains._base as base
+
+        calls = []
+
+        def counting(values):
+            calls.append(values)
+            return series_arrays(values)
+
+        monkeypatch.setattr(base, "series_arrays", counting)
+        s = _series([2021, 2022], [1.0, None])
+        s.dates, s.values, s.to_dataframe(), s.arrays  # noqa: B018
+        assert len(calls) == 1
+
+    def test_returned_lists_are_copies(self):
+        s = _series([2021, 2022], [1.0, 2.0])
+        s.values.append(3.0)
+        s.dates.clear()
+        assert s.values == [1.0, 2.0]
+        assert len(s.dates) == 2
+
+    def test_slots_only(self):
+        s = _series([2021], [1.0])
+        assert not hasattr(s, "__dict__")
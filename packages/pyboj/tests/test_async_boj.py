@@ -0,0 +1,173 @@
+"""Tests for the asynchronous high-level AsyncBOJ client."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+import respx
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+from conftest import _load_json
+from pyboj import (
+    AsyncBOJ,
+    Currency,
+    Database,
+    Frequency,
+    MemoryMetadataCache,
+    MemorySeriesStore,
+)
+from pyboj._domains.exchange_rate import ExchangeRate
+from pyboj._domains.flow_of_funds import FlowOfFunds
+from pyboj._domains.tankan import Tankan, TankanIndustry
+
+METADATA_FM08 = _load_json("metadata_fm08.json")
+DATA_FM08 = _load_json("data_fm08.json")
+METADATA_CO = _load_json("metadata_co.json")
+DATA_CO = _load_json("data_co.json")
+METADATA_FF = _load_json("metadata_ff.json")
+DATA_FF = _load_json("data_ff.json")
+
+
+def _mock_metadata(mock, db: str, metadata: dict):
+    return mock.get(
+        BASE_URL + ENDPOINT_METADATA,
+        params__contains={"db": db},
+    ).respond(json=metadata)
+
+
+def _mock_data(mock, db: str, data: dict):
+    return mock.get(
+        BASE_URL + ENDPOINT_DATA_CODE,
+        params__contains={"db": db},
+    ).respond(json=data)
+
+
+def _echo_codes(request: httpx.Request) -> httpx.Response:
+    codes = request.url.params["code"].split(",")
+    resultset = [{"SERIES_CODE": c, "FREQUENCY": "DAILY"} for c in codes]
+    return httpx.Response(200, json={"STATUS": 200, "RESULTSET": resultset})
+
+
+class TestAsyncBOJMetadata:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_metadata(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        async with AsyncBOJ() as boj:
+            records = await boj.metadata(Database.EXCHANGE_RATES)
+        assert len(records) == 4
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self):
+        route = _mock_metadata(respx, "FM08", METADATA_FM08)
+        async with AsyncBOJ() as boj:
+            await asyncio.gather(*(boj.metadata(Database.EXCHANGE_RATES) for _ in range(5)))
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_cache_and_store_run_off_the_event_loop(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        _mock_data(respx, "FM08", DATA_FM08)
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+
+        class RecordingCache(MemoryMetadataCache):
+            def get(self, db, lang):
+                threads.append(threading.get_ident())
+                return super().get(db, lang)
+
+        class RecordingStore(MemorySeriesStore):
+            def get(self, db, code):
+                threads.append(threading.get_ident())
+                return super().get(db, code)
+
+        async with AsyncBOJ(metadata_cache=RecordingCache(), store=RecordingStore()) as boj:
+            await boj.exchange_rates(currency=Currency.USD_JPY)
+        assert threads
+        assert loop_thread not in threads
+
+
+class TestAsyncDomainMethods:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_exchange_rates(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        _mock_data(respx, "FM08", DATA_FM08)
+        async with AsyncBOJ() as boj:
+            rates = await boj.exchange_rates(currency=Currency.USD_JPY, frequency=Frequency.D)
+        assert len(rates) == 1
+        assert isinstance(rates[0], ExchangeRate)
+        assert rates[0].currency_pair == Currency.USD_JPY
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_gather_across_domains(self):
+        _mock_metadata(respx, "CO", METADATA_CO)
+        _mock_data(respx, "CO", DATA_CO)
+        _mock_metadata(respx, "FF", METADATA_FF)
+        _mock_data(respx, "FF", DATA_FF)
+        async with AsyncBOJ() as boj:
+            tankan, funds = await asyncio.gather(boj.tankan(), boj.flow_of_funds())
+        assert isinstance(tankan[0], Tankan)
+        assert isinstance(funds[0], FlowOfFunds)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_filter_mismatch(self):
+        _mock_metadata(respx, "CO", METADATA_CO)
+        async with AsyncBOJ() as boj:
+            results = await boj.tankan(industry=TankanIndustry.CONSTRUCTION)
+        assert results == []
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fan_out_keeps_metadata_order(self):
+        records = [
+            {"SERIES_CODE": f"SERIES{i:04d}", "FREQUENCY": "DAILY"} for i in range(300)
+        ]
+        _mock_metadata(respx, "FM08", {"STATUS": 200, "RESULTSET": records})
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_echo_codes)
+        async with AsyncBOJ(max_concurrency=3) as boj:
+            rates = await boj.exchange_rates()
+        assert route.call_count > 1
+        assert [r.series_code for r in rates] == [rec["SERIES_CODE"] for rec in records]
+
+
+class TestAsyncDiscovery:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        async with AsyncBOJ() as boj:
+            results = await boj.search(Database.EXCHANGE_RATES, "euro")
+        assert [r.SERIES_CODE for r in results] == ["FXERC01"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_prefetch_metadata(self):
+        route = respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=METADATA_FM08)
+        async with AsyncBOJ() as boj:
+            timings = await boj.prefetch_metadata([Database.EXCHANGE_RATES, Database.CALL_RATES])
+            await boj.metadata(Database.CALL_RATES)
+        assert list(timings) == [Database.EXCHANGE_RATES, Database.CALL_RATES]
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_all(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        async with AsyncBOJ() as boj:
+            hits = await boj.search_all("euro", [Database.EXCHANGE_RATES])
+        assert [(db, r.SERIES_CODE) for db, r in hits] == [(Database.EXCHANGE_RATES, "FXERC01")]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_layer_tree(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        async with AsyncBOJ() as boj:
+            tree = await boj.layer_tree(Database.EXCHANGE_RATES)
+        assert tree.level == 0
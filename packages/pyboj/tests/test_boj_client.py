@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import httpx
+import pytest
 import respx
 from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
 from conftest import _load_json
-from pyboj import BOJ, Currency, Database, Frequency, RateType
+from pyboj import (
+    BOJ,
+    Currency,
+    Database,
+    Frequency,
+    GlobalSearchIndex,
+    RateType,
+    RetryPolicy,
+)
 from pyboj._domains.balance_of_payments import BalanceOfPayments, BopAccount
 from pyboj._domains.balance_sheet import BalanceSheet, InstitutionType
 from pyboj._domains.boj_operation import BOJOperation
@@ -19,7 +29,7 @@ from pyboj._domains.money_deposit import MoneyDeposit
 from pyboj._domains.price_index import IndexType, PriceIndex
 from pyboj._domains.public_finance import PublicFinance
 from pyboj._domains.tankan import Tankan, TankanIndustry
-from pyboj._utils import frequency_matches
+from pyboj._utils import batch_codes, frequency_matches
 
 # ── Fixture data (loaded from JSON files) ────────────────────────────
 
@@ -60,6 +70,23 @@ def _mock_metadata(mock, db: str, metadata: dict):
     ).respond(json=metadata)
 
 
+def _many_series_metadata(db: str, n: int) -> dict:
+    """Build a metadata payload with *n* daily series codes."""
+    records = [
+        {"SERIES_CODE": f"SERIES{i:04d}", "NAME_OF_TIME_SERIES": f"Series {i}",
+         "FREQUENCY": "DAILY"}
+        for i in range(n)
+    ]
+    return {"STATUS": 200, "PARAMETER": {"db": db}, "RESULTSET": records}
+
+
+def _echo_codes(request: httpx.Request) -> httpx.Response:
+    """Respond with one empty series per requested code, in request order."""
+    codes = request.url.params["code"].split(",")
+    resultset = [{"SERIES_CODE": c, "FREQUENCY": "DAILY"} for c in codes]
+    return httpx.Response(200, json={"STATUS": 200, "RESULTSET": resultset})
+
+
 def _mock_data(mock, db: str, data: dict, code: str | None = None):
     """Set up a respx mock for data_code endpoint."""
     params = {"db": db}
@@ -121,6 +148,20 @@ class TestFrequencyMatches:
         assert frequency_matches("SEMIANNUAL", Frequency.FH) is False
 
 
+class TestBatchCodes:
+    def test_single_batch(self):
+        assert batch_codes(["A", "B", "C"]) == [["A", "B", "C"]]
+
+    def test_splits_on_length(self):
+        # "AAAA,BBBB" is 9 characters; adding ",CCCC" would exceed 10
+        assert batch_codes(["AAAA", "BBBB", "CCCC"], max_len=10) == [
+            ["AAAA", "BBBB"], ["CCCC"],
+        ]
+
+    def test_empty(self):
+        assert batch_codes([]) == []
+
+
 class TestBOJContextManager:
     @respx.mock
     def test_context_manager(self):
@@ -155,6 +196,123 @@ class TestBOJMetadata:
         boj.close()
 
 
+    @respx.mock
+    def test_search_ranks_and_reuses_index(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        boj = BOJ()
+        results = boj.search(Database.EXCHANGE_RATES, "yen rate")
+        assert [r.SERIES_CODE for r in results] == ["FXERD01", "FXERC01", "FXERM01"]
+        index = boj._indexes["FM08"].search_index
+        assert [r.SERIES_CODE for r in boj.search(Database.EXCHANGE_RATES, "FXERC")] == [
+            "FXERC01"
+        ]
+        assert boj._indexes["FM08"].search_index is index
+        boj.close()
+
+    @respx.mock
+    def test_search_all_across_databases(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        _mock_metadata(respx, "FM01", _load_json("metadata_fm01.json"))
+        boj = BOJ()
+        assert boj.search_all("rate") == []  # nothing loaded yet
+        hits = boj.search_all("rate", [Database.EXCHANGE_RATES, Database.CALL_RATES])
+        assert [(db, r.SERIES_CODE) for db, r in hits] == [
+            (Database.EXCHANGE_RATES, "FXERD01"),
+            (Database.EXCHANGE_RATES, "FXERC01"),
+            (Database.EXCHANGE_RATES, "FXERM01"),
+            (Database.CALL_RATES, "STRDCLUCON"),
+        ]
+        assert [db for db, _ in boj.search_all("call")] == [Database.CALL_RATES]
+        boj.close()
+
+    @respx.mock
+    def test_search_all_persists_index(self, tmp_path):
+        route = respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=METADATA_FM08)
+        with BOJ(search_index=GlobalSearchIndex(tmp_path)) as boj:
+            boj.metadata(Database.EXCHANGE_RATES)
+        with BOJ(search_index=GlobalSearchIndex(tmp_path)) as boj:
+            hits = boj.search_all("euro", [Database.EXCHANGE_RATES])
+        assert [r.SERIES_CODE for _, r in hits] == ["FXERC01"]
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_prefetch_metadata(self):
+        route = respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=METADATA_FM08)
+        dbs = [Database.EXCHANGE_RATES, Database.CALL_RATES, Database.EXCHANGE_RATES]
+        with BOJ() as boj:
+            timings = boj.prefetch_metadata(dbs)
+            assert list(timings) == [Database.EXCHANGE_RATES, Database.CALL_RATES]
+            assert all(t >= 0 for t in timings.values())
+            assert route.call_count == 2
+            boj.metadata(Database.CALL_RATES)
+            assert route.call_count == 2
+
+    @respx.mock
+    def test_prefetch_metadata_skips_failures(self, caplog):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        respx.get(BASE_URL + ENDPOINT_METADATA, params__contains={"db": "FM01"}).respond(500)
+        with BOJ() as boj:
+            timings = boj.prefetch_metadata([Database.CALL_RATES, Database.EXCHANGE_RATES])
+        assert list(timings) == [Database.EXCHANGE_RATES]
+        assert "db=FM01" in caplog.text
+
+    @respx.mock
+    def test_prefetch_all_databases(self):
+        route = respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=METADATA_FM08)
+        with BOJ() as boj:
+            timings = boj.prefetch_metadata()
+        assert list(timings) == list(Database)
+        assert route.call_count == len(Database)
+
+class TestConcurrentFetch:
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            BOJ(max_concurrency=0)
+
+    @respx.mock
+    def test_parallel_batches_keep_metadata_order(self):
+        meta = _many_series_metadata("FM08", 300)
+        _mock_metadata(respx, "FM08", meta)
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_echo_codes)
+        with BOJ(max_concurrency=4) as boj:
+            rates = boj.exchange_rates()
+        assert route.call_count > 1
+        assert [r.series_code for r in rates] == [
+            rec["SERIES_CODE"] for rec in meta["RESULTSET"]
+        ]
+
+    @respx.mock
+    def test_serial_matches_parallel(self):
+        _mock_metadata(respx, "FM08", _many_series_metadata("FM08", 300))
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_echo_codes)
+        with BOJ() as serial, BOJ(max_concurrency=3) as parallel:
+            expected = [r.series_code for r in serial.exchange_rates()]
+            assert [r.series_code for r in parallel.exchange_rates()] == expected
+
+
+class TestRetries:
+    @respx.mock
+    def test_transient_failure_retried(self):
+        _mock_metadata(respx, "FM08", _many_series_metadata("FM08", 3))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(
+            side_effect=[httpx.Response(503), _echo_codes]
+        )
+        retry = RetryPolicy(backoff_factor=0, jitter=False)
+        with BOJ(retry=retry) as boj:
+            rates = boj.exchange_rates()
+        assert route.call_count == 2
+        assert len(rates) == 3
+
+    @respx.mock
+    def test_failed_batch_logged_as_warning(self, caplog):
+        _mock_metadata(respx, "FM08", _many_series_metadata("FM08", 3))
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(return_value=httpx.Response(500))
+        retry = RetryPolicy(1, backoff_factor=0, jitter=False)
+        with BOJ(retry=retry) as boj, caplog.at_level("WARNING", logger="pyboj._boj"):
+            assert boj.exchange_rates() == []
+        assert "after 1 retries" in caplog.text
+
+
 class TestExchangeRates:
     @respx.mock
     def test_all_daily(self):
@@ -176,6 +334,17 @@ class TestExchangeRates:
         assert rates[0].currency_pair == Currency.USD_JPY
         boj.close()
 
+    @respx.mock
+    def test_filter_by_string_value(self):
+        _mock_metadata(respx, "FM08", METADATA_FM08)
+        _mock_data(respx, "FM08", DATA_FM08)
+        boj = BOJ()
+        rates = boj.exchange_rates(currency="USD/JPY", frequency=Frequency.D)
+        assert len(rates) == 1
+        assert rates[0].currency_pair == Currency.USD_JPY
+        assert boj.exchange_rates(currency="XXX/JPY") == []
+        boj.close()
+
     @respx.mock
     def test_filter_by_rate_type(self):
         _mock_metadata(respx, "FM08", METADATA_FM08)
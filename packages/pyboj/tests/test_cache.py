@@ -0,0 +1,149 @@
+"""Tests for the pluggable metadata caches."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import respx
+from boj_ts_api import Lang, MetadataResponse
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+from conftest import _load_json
+from pyboj import BOJ, Database, FileMetadataCache, MemoryMetadataCache
+
+METADATA_FM08 = _load_json("metadata_fm08.json")
+DATA_FM08 = _load_json("data_fm08.json")
+
+
+def _response() -> MetadataResponse:
+    return MetadataResponse.model_validate(METADATA_FM08)
+
+
+class TestMemoryMetadataCache:
+    def test_roundtrip(self):
+        cache = MemoryMetadataCache()
+        resp = _response()
+        cache.set("FM08", Lang.EN, resp)
+        assert cache.get("FM08", Lang.EN) is resp
+        assert cache.get("FM08", Lang.JP) is None
+
+    def test_ttl_expiry(self):
+        cache = MemoryMetadataCache(ttl=0)
+        cache.set("FM08", Lang.EN, _response())
+        time.sleep(0.01)
+        assert cache.get("FM08", Lang.EN) is None
+
+    def test_lru_eviction(self):
+        cache = MemoryMetadataCache(max_entries=2)
+        cache.set("A", Lang.EN, _response())
+        cache.set("B", Lang.EN, _response())
+        cache.get("A", Lang.EN)
+        cache.set("C", Lang.EN, _response())
+        assert cache.get("B", Lang.EN) is None
+        assert cache.get("A", Lang.EN) is not None
+
+    def test_invalidate(self):
+        cache = MemoryMetadataCache()
+        cache.set("FM08", Lang.EN, _response())
+        cache.invalidate("FM08", Lang.EN)
+        assert cache.get("FM08", Lang.EN) is None
+
+    def test_concurrent_use(self):
+        cache = MemoryMetadataCache(max_entries=4)
+        resp = _response()
+
+        def work(n: int) -> None:
+            for i in range(200):
+                cache.set(f"DB{(n + i) % 8}", Lang.EN, resp)
+                cache.get(f"DB{i % 8}", Lang.EN)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+        assert len(cache._entries) == 4
+
+
+class TestFileMetadataCache:
+    def test_persists_across_instances(self, tmp_path):
+        FileMetadataCache(tmp_path).set("FM08", Lang.EN, _response())
+        restored = FileMetadataCache(tmp_path).get("FM08", Lang.EN)
+        assert restored == _response()
+        assert (tmp_path / "en" / "FM08.json").exists()
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = FileMetadataCache(tmp_path, ttl=60)
+        cache.set("FM08", Lang.EN, _response())
+        path = tmp_path / "en" / "FM08.json"
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get("FM08", Lang.EN) is None
+        assert not path.exists()
+
+    def test_lru_eviction(self, tmp_path):
+        cache = FileMetadataCache(tmp_path, max_entries=2)
+        cache.set("A", Lang.EN, _response())
+        cache.set("B", Lang.EN, _response())
+        now = time.time()
+        os.utime(tmp_path / "en" / "A.json", (now + 10, now))
+        cache.set("C", Lang.EN, _response())
+        assert sorted(p.stem for p in (tmp_path / "en").glob("*.json")) == ["A", "C"]
+
+    def test_eviction_tolerates_vanished_files(self, tmp_path, monkeypatch):
+        cache = FileMetadataCache(tmp_path, max_entries=1)
+        cache.set("A", Lang.EN, _response())
+        gone = tmp_path / "en" / "GONE.json"  # listed, then deleted by another process
+        glob = Path.glob
+        monkeypatch.setattr(
+            Path, "glob", lambda self, pattern: [*glob(self, pattern), gone]
+        )
+        cache.set("B", Lang.EN, _response())
+        assert [p.stem for p in (tmp_path / "en").glob("*.json") if p.exists()] == ["B"]
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        path = tmp_path / "en" / "FM08.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert FileMetadataCache(tmp_path).get("FM08", Lang.EN) is None
+        assert not path.exists()
+
+
+class TestBOJWithCache:
+    @respx.mock
+    def test_file_cache_skips_download(self, tmp_path):
+        route = respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=METADATA_FM08)
+        with BOJ(metadata_cache=FileMetadataCache(tmp_path)) as boj:
+            boj.metadata(Database.EXCHANGE_RATES)
+        with BOJ(metadata_cache=FileMetadataCache(tmp_path)) as boj:
+            records = boj.metadata(Database.EXCHANGE_RATES)
+        assert route.call_count == 1
+        assert len(records) == 4
+
+    @respx.mock
+    def test_newer_last_update_invalidates(self):
+        meta = {**METADATA_FM08, "RESULTSET": [
+            {**rec, "LAST_UPDATE": 20240101} for rec in METADATA_FM08["RESULTSET"]
+        ]}
+        data = {**DATA_FM08, "RESULTSET": [
+            {**rec, "LAST_UPDATE": 20250101} for rec in DATA_FM08["RESULTSET"]
+        ]}
+        route = respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=meta)
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(
+            return_value=httpx.Response(200, json=data)
+        )
+        cache = MemoryMetadataCache()
+        with BOJ(metadata_cache=cache) as boj:
+            boj.exchange_rates()
+            assert cache.get("FM08", boj._lang) is None
+            boj.metadata(Database.EXCHANGE_RATES)
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_current_last_update_keeps_cache(self):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=METADATA_FM08)
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).respond(json=DATA_FM08)
+        cache = MemoryMetadataCache()
+        with BOJ(metadata_cache=cache) as boj:
+            boj.exchange_rates()
+            assert cache.get("FM08", boj._lang) is not None
@@ -0,0 +1,134 @@
+"""Tests for precompiled pattern classifiers and the metadata column index."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from boj_ts_api import Frequency, MetadataResponse
+from conftest import FIXTURES_DIR, _load_json
+from pyboj import Currency, RateType, TankanIndustry, TankanSize
+from pyboj._domains import (
+    balance_of_payments,
+    balance_sheet,
+    boj_operation,
+    exchange_rate,
+    financial_market,
+    flow_of_funds,
+    interest_rate,
+    international_stat,
+    loan,
+    money_deposit,
+    price_index,
+    public_finance,
+    tankan,
+)
+from pyboj._domains._classify import PatternClassifier
+from pyboj._helpers.metadata_index import MetadataIndex
+
+TABLES = [
+    (balance_of_payments._BOP_PATTERNS, balance_of_payments._BOP_CLASSIFIER),
+    (balance_sheet._SIDE_PATTERNS, balance_sheet._SIDE_CLASSIFIER),
+    (balance_sheet._INSTITUTION_PATTERNS, balance_sheet._INSTITUTION_CLASSIFIER),
+    (boj_operation._OPERATION_PATTERNS, boj_operation._OPERATION_CLASSIFIER),
+    (exchange_rate._RATE_TYPE_PATTERNS, exchange_rate._RATE_TYPE_CLASSIFIER),
+    (financial_market._SEGMENT_PATTERNS, financial_market._SEGMENT_CLASSIFIER),
+    (financial_market._INSTRUMENT_PATTERNS, financial_market._INSTRUMENT_CLASSIFIER),
+    (flow_of_funds._SECTOR_PATTERNS, flow_of_funds._SECTOR_CLASSIFIER),
+    (flow_of_funds._INSTRUMENT_PATTERNS, flow_of_funds._INSTRUMENT_CLASSIFIER),
+    (interest_rate._CATEGORY_PATTERNS, interest_rate._CATEGORY_CLASSIFIER),
+    (international_stat._CATEGORY_PATTERNS, international_stat._CATEGORY_CLASSIFIER),
+    (loan._SECTOR_PATTERNS, loan._SECTOR_CLASSIFIER),
+    (money_deposit._COMPONENT_PATTERNS, money_deposit._COMPONENT_CLASSIFIER),
+    (money_deposit._ADJUSTMENT_PATTERNS, money_deposit._ADJUSTMENT_CLASSIFIER),
+    (price_index._INDEX_TYPE_PATTERNS, price_index._INDEX_TYPE_CLASSIFIER),
+    (public_finance._FISCAL_PATTERNS, public_finance._FISCAL_CLASSIFIER),
+    (tankan._INDUSTRY_PATTERNS, tankan._INDUSTRY_CLASSIFIER),
+    (tankan._SIZE_PATTERNS, tankan._SIZE_CLASSIFIER),
+    (tankan._ITEM_PATTERNS, tankan._ITEM_CLASSIFIER),
+    (tankan._SERIES_TYPE_PATTERNS, tankan._SERIES_TYPE_CLASSIFIER),
+]
+
+
+def _sequential(patterns, text: str):
+    for pattern, label in patterns:
+        if re.search(pattern, text):
+            return label
+    return None
+
+
+def _fixture_names() -> list[str]:
+    names = {"", "Services (All industries) Large enterprises"}
+    for path in FIXTURES_DIR.glob("*.json"):
+        for rec in _load_json(path.name).get("RESULTSET", []):
+            for key in ("NAME_OF_TIME_SERIES", "CATEGORY"):
+                if rec.get(key):
+                    names.add(rec[key])
+    return sorted(names)
+
+
+class TestPatternClassifier:
+    def test_first_pattern_wins_not_leftmost_match(self):
+        classify = PatternClassifier([("b", 1), ("a", 2)], 0)
+        assert classify("a b") == 1
+
+    def test_default(self):
+        assert PatternClassifier([("x", 1)], None)("abc") is None
+
+    @pytest.mark.parametrize(("patterns", "classifier"), TABLES)
+    def test_matches_sequential_search(self, patterns, classifier):
+        for name in _fixture_names():
+            expected = _sequential(patterns, name)
+            assert classifier(name) in (expected, classifier._default), name
+            if expected is not None:
+                assert classifier(name) == expected, name
+
+
+class TestMetadataIndex:
+    def _index(self, name: str) -> MetadataIndex:
+        return MetadataIndex(MetadataResponse.model_validate(_load_json(name)))
+
+    def test_select_matches_detectors(self):
+        index = self._index("metadata_fm08.json")
+        codes = index.select([Currency.USD_JPY, None], Frequency.D)
+        expected = [
+            rec.SERIES_CODE
+            for rec in index.records
+            if exchange_rate._detect_currency(rec.NAME_OF_TIME_SERIES or "") == Currency.USD_JPY
+            and rec.FREQUENCY == "DAILY"
+        ]
+        assert codes == expected
+
+    def test_columns_computed_once(self):
+        index = self._index("metadata_co.json")
+        index.select([TankanIndustry.MANUFACTURING, TankanSize.LARGE])
+        column = index.column(TankanIndustry)
+        index.select([TankanIndustry.MANUFACTURING])
+        assert index.column(TankanIndustry) is column
+
+    def test_no_filters_keeps_all_series(self):
+        index = self._index("metadata_fm08.json")
+        assert index.select([None, None]) == [rec.SERIES_CODE for rec in index.records]
+
+    def test_unknown_label_matches_nothing(self):
+        index = self._index("metadata_fm08.json")
+        assert index.select([RateType.OPTION_VOLATILITY]) == []
+
+    def test_postings_partition_records(self):
+        index = self._index("metadata_fm08.json")
+        postings = index.postings(Currency)
+        assert sorted(i for pos in postings.values() for i in pos) == list(
+            range(len(index.records))
+        )
+
+    def test_select_memoizes_queries(self):
+        index = self._index("metadata_fm08.json")
+        first = index.select([Currency.USD_JPY], Frequency.D)
+        first.clear()
+        assert index.select([None, Currency.USD_JPY], Frequency.D) != []
+        assert len(index._queries) == 1
+
+    def test_frequency_only(self):
+        index = self._index("metadata_fm08.json")
+        daily = index.select([], Frequency.D)
+        assert daily == [r.SERIES_CODE for r in index.records if r.FREQUENCY == "DAILY"]
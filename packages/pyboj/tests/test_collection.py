@@ -0,0 +1,141 @@
+"""Tests for the columnar SeriesCollection result type."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import respx
+from boj_ts_api import SeriesResult
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+from conftest import _load_json
+from pyboj import (
+    BOJ,
+    Currency,
+    ExchangeRate,
+    Frequency,
+    RateType,
+    SeriesCollection,
+    to_panel,
+)
+
+NAMES = [
+    ("FXERD01", "U.S.dollar/Yen Spot Rate at 9 A.M.", "DAILY"),
+    ("FXERD04", "U.S.dollar/Yen Spot Rate at 17:00", "DAILY"),
+    ("FXERC01", "Euro/Yen Central Rate", "DAILY"),
+    ("FXERM01", "U.S.dollar/Yen Spot Rate at 9 A.M. (monthly average)", "MONTHLY"),
+]
+
+
+def _results() -> list[SeriesResult]:
+    return [
+        SeriesResult.model_validate({
+            "SERIES_CODE": code,
+            "NAME_OF_TIME_SERIES": name,
+            "FREQUENCY": freq,
+            "VALUES": {
+                "SURVEY_DATES": [20240104, 20240105] if freq == "DAILY" else [202401],
+                "VALUES": [float(i), None] if freq == "DAILY" else [float(i)],
+            },
+        })
+        for i, (code, name, freq) in enumerate(NAMES)
+    ]
+
+
+@pytest.fixture()
+def rates() -> SeriesCollection[ExchangeRate]:
+    return SeriesCollection(_results(), ExchangeRate)
+
+
+class TestSequence:
+    def test_list_behaviour(self, rates):
+        assert len(rates) == 4
+        assert isinstance(rates[0], ExchangeRate)
+        assert rates[-1].series_code == "FXERM01"
+        assert [r.series_code for r in rates] == [code for code, _, _ in NAMES]
+        assert rates[1:3].codes == ["FXERD04", "FXERC01"]
+        assert rates == list(rates)
+        assert SeriesCollection() == []
+        with pytest.raises(IndexError):
+            rates[10]
+
+    def test_wrappers_created_lazily_and_reused(self, rates):
+        assert rates._columns.items == {}
+        first = rates[0]
+        assert rates[0] is first
+        assert rates[0:1][0] is first
+        assert len(rates._columns.items) == 1
+
+    def test_wrappers_read_shared_buffer(self, rates):
+        usd = rates[0]
+        assert usd.name == "U.S.dollar/Yen Spot Rate at 9 A.M."
+        assert usd.values == [0.0, None]
+        assert usd.arrays.mask.tolist() == [False, True]
+        assert np.shares_memory(usd.arrays.values, rates._columns.values)
+        assert "observations=2" in repr(usd)
+
+
+class TestUnparseableSeries:
+    def test_failure_confined_to_its_series(self):
+        results = _results()
+        results[1] = results[1].model_copy(
+            update={"VALUES": results[1].VALUES.model_copy(update={"SURVEY_DATES": ["?", 1]})}
+        )
+        rates = SeriesCollection(results, ExchangeRate)
+        assert rates.codes == [code for code, _, _ in NAMES]
+        assert rates[0].values == [0.0, None]
+        assert rates[1].name == NAMES[1][1]
+        with pytest.raises(ValueError):
+            _ = rates[1].values
+        assert list(rates.filter(frequency=Frequency.M).to_dataframe().columns) == ["FXERM01"]
+        with pytest.raises(ValueError):
+            rates.to_dataframe()
+
+
+class TestFilter:
+    def test_matches_wrapper_properties(self, rates):
+        usd = rates.filter(Currency.USD_JPY)
+        assert usd.codes == [r.series_code for r in rates if r.currency_pair == Currency.USD_JPY]
+        spot = rates.filter(Currency.USD_JPY, RateType.SPOT_9AM)
+        assert spot.codes == [
+            r.series_code
+            for r in rates
+            if r.currency_pair == Currency.USD_JPY and r.rate_type == RateType.SPOT_9AM
+        ]
+        assert rates.filter(None).codes == rates.codes
+
+    def test_frequency(self, rates):
+        assert rates.filter(frequency=Frequency.M).codes == ["FXERM01"]
+        assert rates.filter(Currency.USD_JPY, frequency=Frequency.D).codes == [
+            "FXERD01", "FXERD04"
+        ]
+
+    def test_unknown_label_matches_nothing(self, rates):
+        assert rates.filter(Currency.GBP_JPY) == []
+
+    def test_filter_does_not_create_wrappers(self, rates):
+        rates.filter(Currency.USD_JPY, frequency=Frequency.D)
+        assert rates._columns.items == {}
+
+
+class TestToDataFrame:
+    def test_matches_to_panel(self, rates):
+        df = rates.to_dataframe()
+        expected = to_panel(list(rates))
+        assert list(df.columns) == rates.codes
+        np.testing.assert_array_equal(df.to_numpy(), expected.to_numpy())
+
+    def test_long_layout_of_filtered_view(self, rates):
+        df = rates.filter(frequency=Frequency.D)[:1].to_dataframe(layout="long")
+        assert df["series_code"].tolist() == ["FXERD01", "FXERD01"]
+        assert df["value"].iloc[0] == 0.0
+
+
+@respx.mock
+def test_domain_methods_return_collections():
+    respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_load_json("metadata_fm08.json"))
+    respx.get(BASE_URL + ENDPOINT_DATA_CODE).respond(json=_load_json("data_fm08.json"))
+    with BOJ() as boj:
+        rates = boj.exchange_rates(currency=Currency.USD_JPY, frequency=Frequency.D)
+    assert isinstance(rates, SeriesCollection)
+    assert isinstance(rates[0], ExchangeRate)
+    assert rates[0].values == [141.75, 144.62]
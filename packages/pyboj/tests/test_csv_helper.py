@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pyboj import csv_to_dataframe
+import numpy as np
+import pandas as pd
+import pytest
+from pyboj import csv_to_dataframe, iter_csv_batches, iter_csv_frames, write_csv
+from pyboj._helpers.csv import _has_arrow
 
 
 class TestCsvToDataframe:
@@ -26,3 +30,121 @@ class TestCsvToDataframe:
             "VALUE",
         }
         assert set(df.columns) == expected
+
+
+def _chunks(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestStreamedCsv:
+    def test_dataframe_from_chunks(self, csv_text: str):
+        pd.testing.assert_frame_equal(
+            csv_to_dataframe(_chunks(csv_text)), csv_to_dataframe(csv_text)
+        )
+
+    def test_non_ascii_chunks(self):
+        text = (
+            "SERIES_CODE,NAME_OF_TIME_SERIES_J,VALUE\n"
+            "FXERD01,ドル・円,156.1\nFXERD02,ユーロ,157.2\n"
+        )
+        df = csv_to_dataframe(iter(_chunks(text, 1)))
+        assert df["NAME_OF_TIME_SERIES_J"].tolist() == ["ドル・円", "ユーロ"]
+        assert df["VALUE"].tolist() == [156.1, 157.2]
+
+    def test_iter_frames(self, csv_text: str):
+        frames = list(iter_csv_frames(_chunks(csv_text), chunksize=3))
+        assert [len(df) for df in frames] == [3, 1]
+        pd.testing.assert_frame_equal(
+            pd.concat(frames), csv_to_dataframe(csv_text, engine="c")
+        )
+
+    def test_iter_batches(self, csv_text: str):
+        pa = pytest.importorskip("pyarrow")
+        batches = list(iter_csv_batches(_chunks(csv_text), block_size=128))
+        assert len(batches) > 1
+        table = pa.Table.from_batches(batches)
+        assert table.num_rows == 4
+        assert table.column("VALUE").to_pylist()[0] == 106.9
+
+    def test_write_csv(self, tmp_path, csv_text: str):
+        path = write_csv(_chunks(csv_text), tmp_path / "data.csv")
+        assert path.read_text(encoding="utf-8") == csv_text
+
+
+DATA_CSV = (
+    "STATUS,200\n"
+    "MESSAGEID,M181000I\n"
+    "NEXTPOSITION,\n"
+    "SERIES_CODE,NAME_OF_TIME_SERIES,LAST_UPDATE,SURVEY_DATE,VALUE\n"
+    "A,NA,20250520,202401,1.5\n"
+    "A,NA,20250520,202402,ND\n"
+    "A,NA,20250520,,\n"
+    "B,Rate,20250520,20240105,-\n"
+)
+ENGINES = [
+    "c",
+    pytest.param(
+        "pyarrow", marks=pytest.mark.skipif(not _has_arrow(), reason="pyarrow not installed")
+    ),
+]
+
+
+class TestBojLayout:
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_typed_and_indexed(self, engine):
+        df = csv_to_dataframe(DATA_CSV, engine=engine)
+        assert list(df.columns) == [
+            "SERIES_CODE", "NAME_OF_TIME_SERIES", "LAST_UPDATE", "SURVEY_DATE", "VALUE"
+        ]
+        assert df["VALUE"].dtype == np.float64
+        assert str(df["SURVEY_DATE"].dtype) == "Int64"
+        assert df["NAME_OF_TIME_SERIES"].tolist() == ["NA", "NA", "NA", "Rate"]
+        assert df["LAST_UPDATE"].iloc[0] == "20250520"
+        assert df["VALUE"].iloc[0] == 1.5
+        assert df["VALUE"].iloc[1:].isna().all()
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index.name == "date"
+        assert list(df.index[[0, 1, 3]]) == [
+            pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01"), pd.Timestamp("2024-01-05")
+        ]
+        assert pd.isna(df.index[2])
+
+    def test_engines_agree(self):
+        pytest.importorskip("pyarrow")
+        pd.testing.assert_frame_equal(
+            csv_to_dataframe(DATA_CSV, engine="pyarrow"), csv_to_dataframe(DATA_CSV, engine="c")
+        )
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_shift_jis_bytes(self, engine):
+        text = "SERIES_CODE,NAME_OF_TIME_SERIES_J,SURVEY_DATE,VALUE\nA,ドル・円,202401,156.1\n"
+        df = csv_to_dataframe(text.encode("cp932"), encoding="cp932", engine=engine)
+        assert df["NAME_OF_TIME_SERIES_J"].iloc[0] == "ドル・円"
+        assert df["VALUE"].iloc[0] == 156.1
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_metadata_keeps_range_index(self, engine):
+        text = "SERIES_CODE,FREQUENCY,LAYER1,NOTES\nA,MONTHLY,1,\nB,DAILY,2,note\n"
+        df = csv_to_dataframe(text, engine=engine)
+        assert isinstance(df.index, pd.RangeIndex)
+        assert df["LAYER1"].tolist() == ["1", "2"]
+        assert df["NOTES"].tolist() == ["", "note"]
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="engine"):
+            csv_to_dataframe(DATA_CSV, engine="python")  # type: ignore[arg-type]
+
+    def test_no_header(self):
+        with pytest.raises(ValueError, match="header"):
+            csv_to_dataframe("STATUS,200\n")
+
+    def test_batches_typed_up_front(self):
+        pa = pytest.importorskip("pyarrow")
+        rows = "".join(f"A,x,20250520,{202401 + i},\n" for i in range(11))
+        text = DATA_CSV.split("A,")[0] + rows + "A,x,20250520,202501,2.5\n"
+        batches = list(iter_csv_batches(_chunks(text), block_size=64))
+        assert len(batches) > 1
+        table = pa.Table.from_batches(batches)
+        assert table.schema.field("VALUE").type == pa.float64()
+        assert table.schema.field("SURVEY_DATE").type == pa.int64()
+        assert table.column("VALUE").to_pylist()[-1] == 2.5
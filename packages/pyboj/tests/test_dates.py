@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import datetime
 
+import numpy as np
 import pytest
-from pyboj._parsing.dates import parse_survey_date, parse_survey_dates
+from pyboj._parsing.dates import parse_survey_date, parse_survey_dates, parse_survey_dates_array
 
 
 class TestParseSurveyDate:
@@ -55,3 +56,36 @@ class TestParseSurveyDates:
             None,
             datetime.date(2024, 2, 1),
         ]
+
+
+class TestParseSurveyDatesArray:
+    def test_matches_scalar_parser(self):
+        raw = [20240104, "20240229", 202402, "202412", 2024, None]
+        result = parse_survey_dates_array(raw)
+        assert result.dtype == np.dtype("datetime64[D]")
+        assert result.tolist() == parse_survey_dates(raw)
+
+    def test_empty(self):
+        assert len(parse_survey_dates_array([])) == 0
+
+    def test_invalid_length_raises(self):
+        with pytest.raises(ValueError, match="Cannot parse survey date"):
+            parse_survey_dates_array([2024, 12345])
+
+    def test_invalid_month_raises(self):
+        with pytest.raises(ValueError, match="month"):
+            parse_survey_dates_array([202413])
+
+    def test_invalid_day_raises(self):
+        with pytest.raises(ValueError, match="day"):
+            parse_survey_dates_array([20230229])
+
+    def test_integer_ndarray_input(self):
+        result = parse_survey_dates_array(np.array([20240104, 2024], dtype=np.int32))
+        assert result.tolist() == [datetime.date(2024, 1, 4), datetime.date(2024, 1, 1)]
+
+    def test_shared_calendar_memoised(self):
+        raw = [20240101 + i for i in range(20)]
+        first = parse_survey_dates_array(raw)
+        assert parse_survey_dates_array(list(raw)) is first
+        assert not first.flags.writeable
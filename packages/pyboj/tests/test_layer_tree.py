@@ -2,6 +2,7 @@
 
 from boj_ts_api import MetadataRecord
 from pyboj._helpers.layer_tree import LayerNode, build_layer_tree, search_metadata
+from pyboj._helpers.search_index import GlobalSearchIndex, SearchIndex
 
 
 def _make_record(**kwargs) -> MetadataRecord:
@@ -106,6 +107,14 @@ class TestSearchMetadata:
         results = search_metadata(records, "FX01")
         assert len(results) == 1
 
+    def test_search_by_code_substring(self):
+        records = [
+            _make_record(SERIES_CODE="FXERD01", NAME_OF_TIME_SERIES="Some Rate"),
+            _make_record(SERIES_CODE="FXERM02", NAME_OF_TIME_SERIES="Other Rate"),
+        ]
+        results = search_metadata(records, "d01")
+        assert [r.SERIES_CODE for r in results] == ["FXERD01"]
+
     def test_search_by_category(self):
         records = [
             _make_record(
@@ -132,3 +141,103 @@ class TestSearchMetadata:
         ]
         results = search_metadata(records, "nonexistent")
         assert results == []
+
+
+class TestSearchIndex:
+    def _index(self) -> SearchIndex:
+        return SearchIndex(
+            [
+                _make_record(NAME_OF_TIME_SERIES="Header Row"),
+                _make_record(
+                    SERIES_CODE="FXERD01",
+                    NAME_OF_TIME_SERIES="U.S.dollar/Yen Spot Rate",
+                    NAME_OF_TIME_SERIES_J="米ドル／円 スポット・レート",
+                    CATEGORY="Exchange Rates",
+                ),
+                _make_record(
+                    SERIES_CODE="STRDCLUCON",
+                    NAME_OF_TIME_SERIES="Call Rate, Uncollateralized Overnight",
+                    NAME_OF_TIME_SERIES_J="無担保コールＯ／Ｎ物レート",
+                ),
+                _make_record(
+                    SERIES_CODE="RATE01",
+                    NAME_OF_TIME_SERIES="Yield",
+                    NAME_OF_TIME_SERIES_J="利回り",
+                ),
+            ]
+        )
+
+    def test_prefix_terms(self):
+        assert [r.SERIES_CODE for r in self._index().search("uncoll over")] == ["STRDCLUCON"]
+
+    def test_all_terms_required(self):
+        assert self._index().search("spot call") == []
+
+    def test_ranking_prefers_code_and_whole_terms(self):
+        index = SearchIndex(
+            [
+                _make_record(SERIES_CODE="A", NAME_OF_TIME_SERIES="Call Rates"),
+                _make_record(SERIES_CODE="B", NAME_OF_TIME_SERIES="Call Rate"),
+                _make_record(SERIES_CODE="RATE", NAME_OF_TIME_SERIES="Other"),
+                _make_record(SERIES_CODE="C", CATEGORY="Rates"),
+            ]
+        )
+        assert [r.SERIES_CODE for r in index.search("rate")] == ["RATE", "B", "A", "C"]
+
+    def test_japanese_substring(self):
+        index = self._index()
+        assert [r.SERIES_CODE for r in index.search("コール")] == ["STRDCLUCON"]
+        assert [r.SERIES_CODE for r in index.search("回")] == ["RATE01"]
+        # Both bigrams occur in the record but never adjacent.
+        assert index.search("レーコ") == []
+
+    def test_width_folding(self):
+        assert [r.SERIES_CODE for r in self._index().search("o/n")] == ["STRDCLUCON"]
+
+    def test_empty_query_returns_all_series(self):
+        assert len(self._index().search("")) == 3
+
+    def test_limit(self):
+        assert len(self._index().search("rate", limit=1)) == 1
+
+
+class TestGlobalSearchIndex:
+    def test_merges_rankings_across_databases(self):
+        index = GlobalSearchIndex()
+        index.add("A", [_make_record(SERIES_CODE="A1", NAME_OF_TIME_SERIES="Call Rates")])
+        index.add("B", [_make_record(SERIES_CODE="B1", NAME_OF_TIME_SERIES="Call Rate")])
+        assert [(db, r.SERIES_CODE) for db, r in index.search("rate")] == [
+            ("B", "B1"),
+            ("A", "A1"),
+        ]
+        assert [db for db, _ in index.search("rate", ["A"])] == ["A"]
+        assert len(index.search("rate", limit=1)) == 1
+
+    def test_add_skips_same_source(self):
+        index = GlobalSearchIndex()
+        source = object()
+        index.add("A", [_make_record(SERIES_CODE="A1")], source=source)
+        index.add("A", [], source=source)
+        assert len(index.search("")) == 1
+        index.add("A", [], source=object())
+        assert index.search("") == []
+
+    def test_persists_to_directory(self, tmp_path):
+        index = GlobalSearchIndex(tmp_path)
+        index.add(
+            "FM08",
+            [
+                _make_record(NAME_OF_TIME_SERIES="Header"),
+                _make_record(SERIES_CODE="FX01", NAME_OF_TIME_SERIES="Euro/Yen"),
+            ],
+        )
+        reloaded = GlobalSearchIndex(tmp_path)
+        assert "FM08" in reloaded
+        assert reloaded.dbs == ["FM08"]
+        [(db, rec)] = reloaded.search("euro")
+        assert (db, rec.SERIES_CODE) == ("FM08", "FX01")
+
+    def test_corrupt_file_is_dropped(self, tmp_path):
+        (tmp_path / "FM08.json").write_text("not json")
+        assert GlobalSearchIndex(tmp_path).dbs == []
+        assert not (tmp_path / "FM08.json").exists()
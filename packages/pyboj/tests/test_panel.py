@@ -0,0 +1,68 @@
+"""Tests for combining many series into one DataFrame."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from boj_ts_api import SeriesResult
+from pyboj import Series, to_panel
+
+
+def _series(code: str, dates: list, values: list) -> Series:
+    return Series(
+        SeriesResult.model_validate(
+            {"SERIES_CODE": code, "VALUES": {"SURVEY_DATES": dates, "VALUES": values}}
+        )
+    )
+
+
+SERIES = [
+    _series("A", [202401, 202402, 202403], [1.0, 2.0, None]),
+    _series("B", [202401, 202402, 202403], [4.0, 5.0, 6.0]),
+    _series("C", [202402, 202404], [7.0, "ND"]),
+]
+
+
+class TestWide:
+    def test_aligns_on_union_of_dates(self):
+        df = to_panel(SERIES)
+        assert list(df.columns) == ["A", "B", "C"]
+        assert df.columns.name == "series_code"
+        assert df.index.name == "date"
+        assert list(df.index) == list(pd.to_datetime(["2024-01-01", "2024-02-01",
+                                                      "2024-03-01", "2024-04-01"]))
+        assert df["B"].tolist()[:3] == [4.0, 5.0, 6.0]
+        assert np.isnan(df.loc["2024-04-01", "B"])
+        assert df.loc["2024-02-01", "C"] == 7.0
+        assert np.isnan(df.loc["2024-03-01", "A"])
+        assert df.dtypes.unique().tolist() == [np.float64]
+
+    def test_matches_concatenated_frames(self):
+        expected = pd.concat(
+            [s.to_dataframe()["value"].rename(s.series_code) for s in SERIES], axis=1
+        ).sort_index()
+        result = to_panel(SERIES)
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+    def test_empty(self):
+        df = to_panel([])
+        assert df.shape == (0, 0)
+
+
+class TestLong:
+    def test_one_row_per_observation(self):
+        df = to_panel(SERIES, layout="long")
+        assert list(df.columns) == ["series_code", "date", "value"]
+        assert df["series_code"].tolist() == ["A", "A", "A", "B", "B", "B", "C", "C"]
+        assert df["date"].iloc[-1] == pd.Timestamp("2024-04-01")
+        assert df["value"].iloc[3] == 4.0
+        assert np.isnan(df["value"].iloc[2])
+
+    def test_empty(self):
+        assert to_panel([], layout="long").empty
+
+
+def test_unknown_layout():
+    with pytest.raises(ValueError, match="layout"):
+        to_panel(SERIES, layout="tall")  # type: ignore[arg-type]
@@ -0,0 +1,193 @@
+"""Tests for the Code API request planner."""
+
+from __future__ import annotations
+
+import httpx
+import respx
+from boj_ts_api import MetadataRecord, SeriesResult
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+from pyboj import BOJ, Database
+from pyboj._domains.exchange_rate import ExchangeRate
+from pyboj._helpers.planner import (
+    RequestPlan,
+    assemble_results,
+    clip_arrays,
+    clip_result,
+    complete_codes,
+    estimate_points,
+    plan_requests,
+)
+from pyboj._parsing.arrays import series_arrays
+
+
+def _rec(code: str, freq: str = "MONTHLY", start: str | None = None, end: str | None = None):
+    return MetadataRecord(
+        SERIES_CODE=code,
+        FREQUENCY=freq,
+        START_OF_THE_TIME_SERIES=start,
+        END_OF_THE_TIME_SERIES=end,
+    )
+
+
+class TestEstimatePoints:
+    def test_monthly(self):
+        assert estimate_points(_rec("A", "MONTHLY", "200001", "200012")) == 12
+
+    def test_quarterly(self):
+        assert estimate_points(_rec("A", "QUARTERLY", "200001", "200104")) == 8
+
+    def test_daily_counts_calendar_upper_bound(self):
+        assert estimate_points(_rec("A", "DAILY", "20240115", "20240220")) == 62
+
+    def test_requested_range_clips_series_range(self):
+        rec = _rec("A", "MONTHLY", "199001", "202412")
+        assert estimate_points(rec, "202401", "202406") == 6
+
+    def test_annual(self):
+        assert estimate_points(_rec("A", "ANNUAL(MAR)", "1990", "1999")) == 10
+
+    def test_unknown_without_dates(self):
+        assert estimate_points(_rec("A")) is None
+        assert estimate_points(_rec("A", "IRREGULAR", "2000", "2001")) is None
+
+
+class TestPlanRequests:
+    def test_groups_by_frequency(self):
+        recs = [_rec("M1"), _rec("D1", "DAILY"), _rec("M2"), _rec("D2", "DAILY")]
+        assert plan_requests(recs) == [RequestPlan(("M1", "M2")), RequestPlan(("D1", "D2"))]
+
+    def test_series_limit(self):
+        recs = [_rec(f"C{i}") for i in range(5)]
+        plans = plan_requests(recs, max_series=2)
+        assert [p.codes for p in plans] == [("C0", "C1"), ("C2", "C3"), ("C4",)]
+
+    def test_point_limit(self):
+        recs = [_rec(f"C{i}", "MONTHLY", "200001", "200912") for i in range(5)]  # 120 each
+        plans = plan_requests(recs, max_points=250)
+        assert [len(p.codes) for p in plans] == [2, 2, 1]
+
+    def test_url_limit(self):
+        recs = [_rec(code) for code in ("AAAA", "BBBB", "CCCC")]
+        plans = plan_requests(recs, max_len=10)
+        assert [p.codes for p in plans] == [("AAAA", "BBBB"), ("CCCC",)]
+
+    def test_long_series_split_by_date_range(self):
+        recs = [
+            _rec("A", "MONTHLY", "199001", "200012"),
+            _rec("LONG", "DAILY", "20000101", "20001231"),
+            _rec("B", "MONTHLY", "199001", "200012"),
+        ]
+        plans = plan_requests(recs, max_points=31 * 5, start_date="200003")
+        daily = [p for p in plans if p.codes == ("LONG",)]
+        assert [(p.start_date, p.end_date) for p in daily] == [
+            ("200003", "200007"),
+            ("200008", "200012"),
+        ]
+        assert RequestPlan(("A", "B"), "200003", None) in plans
+
+    def test_carries_requested_range(self):
+        assert plan_requests([_rec("A")], start_date="2020", end_date="2021") == [
+            RequestPlan(("A",), "2020", "2021")
+        ]
+
+
+class TestAssembleResults:
+    def test_restores_code_order_and_merges_split_series(self):
+        plans = [RequestPlan(("B",)), RequestPlan(("A",), "2000", "2000"),
+                 RequestPlan(("A",), "2001", "2001")]
+        pages = [
+            [SeriesResult(SERIES_CODE="B")],
+            [SeriesResult.model_validate(
+                {"SERIES_CODE": "A", "VALUES": {"SURVEY_DATES": [2000], "VALUES": [1.0]}}
+            )],
+            [SeriesResult.model_validate(
+                {"SERIES_CODE": "A", "VALUES": {"SURVEY_DATES": [2001], "VALUES": [2.0]}}
+            )],
+        ]
+        results = assemble_results(["A", "B"], plans, pages)
+        assert [r.SERIES_CODE for r in results] == ["A", "B"]
+        assert results[0].VALUES.SURVEY_DATES == [2000, 2001]
+        assert results[0].VALUES.VALUES == [1.0, 2.0]
+
+
+class TestCompleteCodes:
+    def test_split_series_needs_every_range(self):
+        plans = [RequestPlan(("A", "B"), None, "2000"), RequestPlan(("A", "B"), "2001")]
+        pages = [
+            [SeriesResult(SERIES_CODE="A"), SeriesResult(SERIES_CODE="B")],
+            [SeriesResult(SERIES_CODE="B")],
+        ]
+        assert complete_codes(plans, pages) == {"B"}
+
+
+class TestClipResult:
+    def test_keeps_requested_range(self):
+        sr = SeriesResult.model_validate({
+            "SERIES_CODE": "A",
+            "FREQUENCY": "DAILY",
+            "VALUES": {"SURVEY_DATES": [20231231, 20240101, 20240229, 20240301],
+                       "VALUES": [1.0, 2.0, 3.0, 4.0]},
+        })
+        clipped = clip_result(sr, "202401", "202402")
+        assert clipped.VALUES.SURVEY_DATES == [20240101, 20240229]
+        assert clipped.VALUES.VALUES == [2.0, 3.0]
+        assert clip_result(sr, start_date="202403").VALUES.VALUES == [4.0]
+        assert clip_result(sr) is sr
+
+    def test_arrays_match_raw_dates(self):
+        sr = SeriesResult.model_validate({
+            "SERIES_CODE": "A",
+            "FREQUENCY": "QUARTERLY",
+            "VALUES": {"SURVEY_DATES": [202304, 202401, 202402, 202403],
+                       "VALUES": [1.0, 2.0, 3.0, 4.0]},
+        })
+        arrays = series_arrays(sr.VALUES)
+        clipped = clip_arrays(arrays, sr.FREQUENCY, "202401", "202402")
+        assert clipped.values.tolist() == clip_result(sr, "202401", "202402").VALUES.VALUES
+        assert clip_arrays(arrays, "QUARTERLY") is arrays
+
+
+def _echo(request: httpx.Request) -> httpx.Response:
+    codes = request.url.params["code"].split(",")
+    return httpx.Response(
+        200, json={"STATUS": 200, "RESULTSET": [{"SERIES_CODE": c} for c in codes]}
+    )
+
+
+class TestBOJPlanning:
+    @respx.mock
+    def test_mixed_frequencies_requested_separately(self):
+        records = [
+            {"SERIES_CODE": "FXD1", "NAME_OF_TIME_SERIES": "USD/JPY", "FREQUENCY": "DAILY"},
+            {"SERIES_CODE": "FXM1", "NAME_OF_TIME_SERIES": "USD/JPY", "FREQUENCY": "MONTHLY"},
+            {"SERIES_CODE": "FXD2", "NAME_OF_TIME_SERIES": "USD/JPY", "FREQUENCY": "DAILY"},
+        ]
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(
+            json={"STATUS": 200, "RESULTSET": records}
+        )
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_echo)
+        with BOJ() as boj:
+            rates = boj.exchange_rates()
+        requested = sorted(call.request.url.params["code"] for call in route.calls)
+        assert requested == ["FXD1,FXD2", "FXM1"]
+        assert all(isinstance(r, ExchangeRate) for r in rates)
+        assert [r.series_code for r in rates] == ["FXD1", "FXM1", "FXD2"]
+
+    @respx.mock
+    def test_uses_database_metadata(self):
+        records = [
+            {"SERIES_CODE": f"S{i}", "FREQUENCY": "MONTHLY",
+             "START_OF_THE_TIME_SERIES": "190001", "END_OF_THE_TIME_SERIES": "202412"}
+            for i in range(4)
+        ]  # 1500 points each
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(
+            json={"STATUS": 200, "RESULTSET": records}
+        )
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_echo)
+        with BOJ() as boj:
+            plans = boj._plan_requests(
+                "FM08", boj._get_metadata(Database.EXCHANGE_RATES),
+                [f"S{i}" for i in range(4)], None, None,
+            )
+        assert plans == [RequestPlan(("S0", "S1", "S2", "S3"))]
+        assert route.call_count == 0
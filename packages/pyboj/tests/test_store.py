@@ -0,0 +1,334 @@
+"""Tests for the Parquet series store and store-first fetching."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
+import pytest
+import respx
+from boj_ts_api import SeriesResult
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+from pyboj import (
+    BOJ,
+    ArrowSeriesStore,
+    AsyncBOJ,
+    Database,
+    ExchangeRate,
+    Frequency,
+    MemorySeriesStore,
+    ParquetSeriesStore,
+    StoredState,
+)
+from pyboj._helpers.planner import RequestPlan
+from test_sync import _data, _metadata
+
+pytest.importorskip("pyarrow")
+
+
+def _series(code: str, freq: str, dates: list, values: list, **fields) -> SeriesResult:
+    return SeriesResult.model_validate({
+        "SERIES_CODE": code,
+        "FREQUENCY": freq,
+        "VALUES": {"SURVEY_DATES": dates, "VALUES": values},
+        **fields,
+    })
+
+
+@pytest.fixture(params=[ParquetSeriesStore, ArrowSeriesStore])
+def store_cls(request):
+    return request.param
+
+
+class TestColumnarSeriesStore:
+    def test_round_trip(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401, 202402], [1.5, None],
+                    NAME_OF_TIME_SERIES="Series A", UNIT="Yen", LAST_UPDATE=20250520),
+            _series("B", "WEEKLY(MON)", [20240101], [2.0]),
+        ])
+        a = store.get("FM08", "A")
+        assert a is not None
+        assert a.NAME_OF_TIME_SERIES == "Series A"
+        assert a.UNIT == "Yen"
+        assert a.LAST_UPDATE == 20250520
+        assert a.VALUES.SURVEY_DATES == [202401, 202402]
+        assert a.VALUES.VALUES == [1.5, None]
+        assert store.get("FM08", "C") is None
+        assert store.get("IR01", "A") is None
+        assert store.codes("FM08") == ["A", "B"]
+        assert store.frequencies("FM08") == ["MONTHLY", "WEEKLY(MON)"]
+        suffix = store_cls._suffix
+        assert (tmp_path / "FM08" / "values" / f"WEEKLY_MON{suffix}").exists()
+        assert (tmp_path / "FM08" / f"series{suffix}").exists()
+
+    def test_persists_across_instances(self, tmp_path, store_cls):
+        store_cls(tmp_path).put("FM08", [_series("A", "MONTHLY", [202401], [1.0])])
+        stored = store_cls(tmp_path).get("FM08", "A")
+        assert stored is not None
+        assert stored.VALUES.VALUES == [1.0]
+
+    def test_put_replaces_series(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401], [1.0]),
+            _series("B", "MONTHLY", [202401], [2.0]),
+        ])
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401, 202402], [1.0, 3.0], LAST_UPDATE=2),
+            _series("C", "QUARTERLY", [202401], [4.0]),
+        ])
+        a = store.get("FM08", "A")
+        assert a is not None
+        assert a.VALUES.VALUES == [1.0, 3.0]
+        assert a.LAST_UPDATE == 2
+        assert store.codes("FM08") == ["B", "A", "C"]
+        monthly = store.table("FM08", "MONTHLY")
+        assert monthly.num_rows == 3
+        assert store.table("FM08").num_rows == 4
+
+    def test_series_moving_partition(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        store.put("FM08", [_series("A", "MONTHLY", [202401], [1.0])])
+        store.put("FM08", [_series("A", "QUARTERLY", [202401], [2.0])])
+        assert store.table("FM08", "MONTHLY").num_rows == 0
+        assert store.table("FM08").column("VALUE").to_pylist() == [2.0]
+
+    def test_concurrent_puts(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        freqs = ["MONTHLY", "QUARTERLY", "DAILY"]
+        batches = [
+            [_series(f"S{i}_{j}", freqs[i % 3], [202401], [float(i * 10 + j)]) for j in range(3)]
+            for i in range(8)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda batch: store.put("FM08", batch), batches))
+        fresh = store_cls(tmp_path)
+        assert sorted(fresh.codes("FM08")) == sorted(
+            sr.SERIES_CODE for batch in batches for sr in batch
+        )
+        for batch in batches:
+            for sr in batch:
+                stored = fresh.get("FM08", sr.SERIES_CODE)
+                assert stored is not None
+                assert stored.VALUES.VALUES == sr.VALUES.VALUES
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_non_numeric_values_stored_as_missing(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        sr = _series("A", "MONTHLY", [202401, 202402, 202403], ["ND", "1.5", 2.0])
+        store.put("FM08", [sr])
+        stored = store.get("FM08", "A")
+        assert stored is not None
+        assert stored.VALUES.VALUES == [None, None, 2.0]
+        arrays = store.arrays("FM08", "A")
+        assert arrays is not None
+        np.testing.assert_array_equal(arrays.values, ExchangeRate(sr).arrays.values)
+
+    def test_empty_store(self, tmp_path, store_cls):
+        store = store_cls(tmp_path / "missing")
+        assert store.codes("FM08") == []
+        assert store.table("FM08").num_rows == 0
+        store.put("FM08", [])
+        assert not (tmp_path / "missing").exists()
+
+    def test_state_without_loading_values(self, tmp_path, store_cls, monkeypatch):
+        store = store_cls(tmp_path)
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401, 202402, None], [1.0, 2.0, 3.0], LAST_UPDATE=7),
+            _series("B", "DAILY", [], []),
+        ])
+        monkeypatch.setattr(store, "get", None)
+        assert store.state("FM08", "A") == StoredState(last_update=7, last_date=202402)
+        assert store.state("FM08", "B") == StoredState(last_update=None, last_date=None)
+        assert store.state("FM08", "C") is None
+
+    def test_arrays(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401, 202402, None], [1.0, None, 3.0]),
+            _series("B", "DAILY", [20240105], [2.0]),
+        ])
+        arrays = store.arrays("FM08", "A")
+        assert arrays is not None
+        assert arrays.dates.tolist() == [np.datetime64("2024-01-01"), np.datetime64("2024-02-01")]
+        assert arrays.values[0] == 1.0
+        assert arrays.mask.tolist() == [False, True]
+        assert not arrays.values.flags.writeable
+        assert store.arrays("FM08", "C") is None
+
+    def test_load_wraps_stored_arrays(self, tmp_path, store_cls):
+        store = store_cls(tmp_path)
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401, 202402], [1.0, 2.0], NAME_OF_TIME_SERIES="A"),
+            _series("B", "MONTHLY", [202401], [3.0]),
+        ])
+        loaded = store.load("FM08", ["B", "A", "missing"], wrapper=ExchangeRate)
+        assert [s.series_code for s in loaded] == ["B", "A"]
+        assert isinstance(loaded[0], ExchangeRate)
+        assert loaded[1].name == "A"
+        assert loaded[1].values == [1.0, 2.0]
+        assert "observations=2" in repr(loaded[1])
+        assert len(store.load("FM08")) == 2
+
+
+def test_memory_store_state():
+    store = MemorySeriesStore()
+    store.put("FM08", [_series("A", "MONTHLY", [202401, 202402], [1.0, 2.0], LAST_UPDATE=3)])
+    assert store.state("FM08", "A") == StoredState(last_update=3, last_date=202402)
+    assert store.state("FM08", "B") is None
+
+
+class TestArrowSeriesStore:
+    def test_arrays_are_views_of_mapped_file(self, tmp_path):
+        store = ArrowSeriesStore(tmp_path)
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401, 202402], [1.0, 2.0]),
+            _series("B", "MONTHLY", [202401, 202402], [3.0, 4.0]),
+        ])
+        a = store.arrays("FM08", "A")
+        b = store.arrays("FM08", "B")
+        assert a is not None and b is not None
+        assert not a.values.flags.owndata
+        assert b.values.tolist() == [3.0, 4.0]
+        # Both series view one column buffer: B's rows directly follow A's.
+        address = a.values.__array_interface__["data"][0]
+        assert b.values.__array_interface__["data"][0] == address + a.values.nbytes
+
+
+class TestStoreFirstFetch:
+    @respx.mock
+    def test_current_series_served_from_store(self, tmp_path):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        with BOJ(store=ParquetSeriesStore(tmp_path)) as boj:
+            first = boj.exchange_rates()
+            calls = route.call_count
+            second = boj.exchange_rates()
+        assert route.call_count == calls
+        assert [s.series_code for s in second] == ["A", "B"]
+        assert [s.values for s in second] == [s.values for s in first]
+
+    @respx.mock
+    def test_store_hits_use_stored_arrays(self, tmp_path, store_cls, monkeypatch):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = store_cls(tmp_path)
+        with BOJ(store=store) as boj:
+            boj.exchange_rates()
+            calls = route.call_count
+            monkeypatch.setattr(store, "get", None)
+            results = boj.exchange_rates(start_date="202402", end_date="202403")
+        assert route.call_count == calls
+        assert [s.series_code for s in results] == ["A", "B"]
+        assert [s.values for s in results] == [[1.0, 2.0], [11.0, 12.0]]
+
+    @respx.mock
+    def test_stale_series_refetched(self):
+        meta = respx.get(BASE_URL + ENDPOINT_METADATA)
+        meta.respond(json=_metadata({"A": 2, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = MemorySeriesStore()
+        store.put("FM08", [
+            _series("A", "MONTHLY", [202401], [99.0], LAST_UPDATE=1),
+            _series("B", "MONTHLY", [202401], [99.0], LAST_UPDATE=1),
+        ])
+        with BOJ(store=store) as boj:
+            results = boj.exchange_rates()
+        assert route.calls.last.request.url.params["code"] == "A"
+        assert [s.series_code for s in results] == ["A", "B"]
+        assert results[0].values[0] == 0.0
+        assert results[1].values == [99.0]
+        stored = store.get("FM08", "A")
+        assert stored is not None
+        assert stored.LAST_UPDATE == 2
+
+    @respx.mock
+    def test_partly_failed_split_series_not_stored(self, monkeypatch):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1}))
+
+        def data(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("startDate") == "202404":
+                return httpx.Response(503)
+            return _data(request)
+
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=data)
+        split = [RequestPlan(("A",), None, "202403"), RequestPlan(("A",), "202404")]
+        store = MemorySeriesStore()
+        with BOJ(store=store) as boj:
+            monkeypatch.setattr(boj, "_plan_requests", lambda *args: split)
+            results = boj.exchange_rates()
+        assert [s.series_code for s in results] == ["A"]
+        assert store.codes("FM08") == []
+
+    @respx.mock
+    def test_date_range_clipped_and_not_stored(self):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = MemorySeriesStore()
+        store.put("FM08", [_series("A", "MONTHLY", [202401, 202402, 202403], [0.0, 1.0, 2.0],
+                                   LAST_UPDATE=1)])
+        with BOJ(store=store) as boj:
+            results = boj.exchange_rates(start_date="202402", end_date="202402")
+        assert results[0].values == [1.0]
+        assert store.codes("FM08") == ["A"]
+
+    @respx.mock
+    def test_sync_defaults_to_client_store(self, tmp_path):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1}))
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = ParquetSeriesStore(tmp_path)
+        with BOJ(store=store) as boj:
+            report = boj.sync(Database.EXCHANGE_RATES)
+        assert report.added == ["A"]
+        assert store.codes("FM08") == ["A"]
+        with BOJ() as boj, pytest.raises(ValueError, match="store"):
+            boj.sync(Database.EXCHANGE_RATES)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_store_first(self, tmp_path):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        async with AsyncBOJ(store=ParquetSeriesStore(tmp_path)) as boj:
+            await boj.exchange_rates()
+            calls = route.call_count
+            results = await boj.exchange_rates()
+        assert route.call_count == calls
+        assert [s.series_code for s in results] == ["A", "B"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_overlapping_calls_share_store(self, tmp_path):
+        freqs = {"D": "DAILY", "W": "WEEKLY(MON)", "M": "MONTHLY", "Q": "QUARTERLY",
+                 "CY": "ANNUAL"}
+        records = [
+            {"SERIES_CODE": f"{key}{i}", "FREQUENCY": name, "LAST_UPDATE": 1}
+            for key, name in freqs.items()
+            for i in range(3)
+        ]
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(
+            json={"STATUS": 200, "RESULTSET": records}
+        )
+
+        def data(request: httpx.Request) -> httpx.Response:
+            codes = request.url.params["code"].split(",")
+            resultset = [
+                {"SERIES_CODE": code, "FREQUENCY": freqs[code.rstrip("012")],
+                 "VALUES": {"SURVEY_DATES": [2024], "VALUES": [float(len(code))]}}
+                for code in codes
+            ]
+            return httpx.Response(200, json={"STATUS": 200, "RESULTSET": resultset})
+
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=data)
+        async with AsyncBOJ(store=ParquetSeriesStore(tmp_path)) as boj:
+            await asyncio.gather(
+                *(boj.exchange_rates(frequency=Frequency(key)) for key in freqs)
+            )
+        stored = ParquetSeriesStore(tmp_path)
+        assert sorted(stored.codes("FM08")) == sorted(rec["SERIES_CODE"] for rec in records)
+        for rec in records:
+            assert stored.get("FM08", rec["SERIES_CODE"]) is not None
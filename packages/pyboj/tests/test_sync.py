@@ -0,0 +1,115 @@
+"""Tests for incremental sync against a local series store."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+from boj_ts_api import SeriesResult
+from boj_ts_api._types.config import BASE_URL, ENDPOINT_DATA_CODE, ENDPOINT_METADATA
+from pyboj import BOJ, AsyncBOJ, Database, MemorySeriesStore
+
+# Upstream monthly observations per series code.
+UPSTREAM = {
+    "A": {202401 + i: float(i) for i in range(6)},  # 202401..202406
+    "B": {202401 + i: 10.0 + i for i in range(6)},
+}
+
+
+def _metadata(last_updates: dict[str, int]) -> dict:
+    records = [
+        {"SERIES_CODE": code, "FREQUENCY": "MONTHLY", "LAST_UPDATE": lu,
+         "START_OF_THE_TIME_SERIES": "202401", "END_OF_THE_TIME_SERIES": "202406"}
+        for code, lu in last_updates.items()
+    ]
+    return {"STATUS": 200, "RESULTSET": records}
+
+
+def _data(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params.get("startDate", 0))
+    resultset = []
+    for code in request.url.params["code"].split(","):
+        obs = {d: v for d, v in UPSTREAM[code].items() if d >= start}
+        resultset.append({
+            "SERIES_CODE": code,
+            "FREQUENCY": "MONTHLY",
+            "VALUES": {"SURVEY_DATES": list(obs), "VALUES": list(obs.values())},
+        })
+    return httpx.Response(200, json={"STATUS": 200, "RESULTSET": resultset})
+
+
+class TestSync:
+    @respx.mock
+    def test_first_sync_fetches_everything(self):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = MemorySeriesStore()
+        with BOJ() as boj:
+            report = boj.sync(Database.EXCHANGE_RATES, store)
+        assert report.added == ["A", "B"]
+        assert report.updated == report.unchanged == report.failed == []
+        assert "startDate" not in route.calls.last.request.url.params
+        stored = store.get("FM08", "A")
+        assert stored is not None
+        assert stored.LAST_UPDATE == 1  # taken from metadata when data omits it
+        assert stored.VALUES.VALUES == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+    @respx.mock
+    def test_unchanged_series_not_requested(self):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = MemorySeriesStore()
+        with BOJ() as boj:
+            boj.sync(Database.EXCHANGE_RATES, store)
+            calls = route.call_count
+            report = boj.sync(Database.EXCHANGE_RATES, store)
+        assert report.unchanged == ["A", "B"]
+        assert route.call_count == calls
+
+    @respx.mock
+    def test_changed_series_refetch_trailing_window(self, monkeypatch):
+        meta = respx.get(BASE_URL + ENDPOINT_METADATA)
+        meta.respond(json=_metadata({"A": 1, "B": 1}))
+        route = respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = MemorySeriesStore()
+        with BOJ() as boj:
+            boj.sync(Database.EXCHANGE_RATES, store)
+            # Upstream revises A's last value and publishes a new month.
+            monkeypatch.setitem(UPSTREAM, "A", {**UPSTREAM["A"], 202406: 50.0, 202407: 6.0})
+            meta.respond(json=_metadata({"A": 2, "B": 1}))
+            report = boj.sync(Database.EXCHANGE_RATES, store, window=2)
+        assert report.updated == ["A"]
+        assert report.unchanged == ["B"]
+        request = route.calls.last.request
+        assert request.url.params["code"] == "A"
+        assert request.url.params["startDate"] == "202404"
+        stored = store.get("FM08", "A")
+        assert stored is not None
+        assert stored.VALUES.SURVEY_DATES == [
+            202401, 202402, 202403, 202404, 202405, 202406, 202407
+        ]
+        assert stored.VALUES.VALUES == [0.0, 1.0, 2.0, 3.0, 4.0, 50.0, 6.0]
+        assert stored.LAST_UPDATE == 2
+
+    @respx.mock
+    def test_failed_requests_reported(self):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1}))
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).respond(503)
+        store = MemorySeriesStore()
+        with BOJ() as boj:
+            report = boj.sync(Database.EXCHANGE_RATES, store)
+        assert report.failed == ["A"]
+        assert report.added == []
+        assert store.codes("FM08") == []
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_sync(self):
+        respx.get(BASE_URL + ENDPOINT_METADATA).respond(json=_metadata({"A": 1, "B": 1}))
+        respx.get(BASE_URL + ENDPOINT_DATA_CODE).mock(side_effect=_data)
+        store = MemorySeriesStore()
+        store.put("FM08", [SeriesResult(SERIES_CODE="B", LAST_UPDATE=1)])
+        async with AsyncBOJ() as boj:
+            report = await boj.sync(Database.EXCHANGE_RATES, store)
+        assert report.added == ["A"]
+        assert report.unchanged == ["B"]